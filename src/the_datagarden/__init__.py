@@ -1,8 +1,40 @@
-from .api.authentication.environment import TheDatagardenLocalEnvironment
-from .api.base import TheDataGardenAPI, TheDatagardenProductionEnvironment
+"""
+The Data Garden SDK.
+
+The public objects are imported on first use, so ``import the_datagarden`` stays fast
+(e.g. for CLI and serverless cold starts).
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api.aio import AsyncTheDataGardenAPI
+    from .api.authentication.environment import TheDatagardenLocalEnvironment
+    from .api.base import TheDataGardenAPI, TheDatagardenProductionEnvironment
+
+_LAZY_IMPORTS = {
+    "TheDataGardenAPI": ".api.base",
+    "AsyncTheDataGardenAPI": ".api.aio",
+    "TheDatagardenProductionEnvironment": ".api.authentication.environment",
+    "TheDatagardenLocalEnvironment": ".api.authentication.environment",
+}
 
 __all__ = [
     "TheDataGardenAPI",
+    "AsyncTheDataGardenAPI",
     "TheDatagardenProductionEnvironment",
     "TheDatagardenLocalEnvironment",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,4 @@
 from .authentication import BaseDataGardenCredentials, DatagardenEnvironment
+from .cache import BaseResponseStore, CachedResponse
 
-__all__ = ["DatagardenEnvironment", "BaseDataGardenCredentials"]
+__all__ = ["DatagardenEnvironment", "BaseDataGardenCredentials", "BaseResponseStore", "CachedResponse"]
@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Literal
 
 from requests import Response
 
 from the_datagarden.abc.authentication import DatagardenEnvironment
 
+if TYPE_CHECKING:
+    from the_datagarden.api.statistics import StatisticsCache
+
+IngestMode = Literal["strict", "fast"]
+
 
 class BaseApi(ABC):
+    # Store the records of regional data models as polars columns
+    columnar: bool = False
+    # Validate API responses ("strict") or create models without validation ("fast")
+    ingest_mode: IngestMode = "strict"
+    # Region statistics shared by the regions of the API object
+    statistics_cache: "StatisticsCache"
+
     @abstractmethod
     def __init__(self, environment: type[DatagardenEnvironment] | None = None): ...
 
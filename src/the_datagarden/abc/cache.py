@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import TypedDict
+
+
+class CachedResponse(TypedDict):
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+
+class BaseResponseStore(ABC):
+    """Protocol for a persistent store of API responses used by the response cache"""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None: ...
+
+    @abstractmethod
+    def touch(self, key: str, stored_at: float) -> None:
+        """Mark a stored response as fresh again (after a successful revalidation)"""
+
+    @abstractmethod
+    def clear(self) -> None: ...
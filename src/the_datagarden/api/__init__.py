@@ -1,5 +1,26 @@
-from .authentication import AccessToken
-from .authentication.environment import TheDatagardenProductionEnvironment
-from .base import TheDataGardenAPI
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["AccessToken", "TheDatagardenProductionEnvironment", "TheDataGardenAPI"]
+if TYPE_CHECKING:
+    from .aio import AsyncTheDataGardenAPI
+    from .authentication import AccessToken
+    from .authentication.environment import TheDatagardenProductionEnvironment
+    from .base import TheDataGardenAPI
+
+# Imported on first use, see the_datagarden/__init__.py
+_LAZY_IMPORTS = {
+    "AccessToken": ".authentication",
+    "AsyncTheDataGardenAPI": ".aio",
+    "TheDatagardenProductionEnvironment": ".authentication.environment",
+    "TheDataGardenAPI": ".base",
+}
+
+__all__ = ["AccessToken", "AsyncTheDataGardenAPI", "TheDatagardenProductionEnvironment", "TheDataGardenAPI"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
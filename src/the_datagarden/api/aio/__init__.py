@@ -0,0 +1,238 @@
+"""
+Asyncio wrappers of The Data Garden API client.
+
+This module provides awaitable variants of the API and region objects for use in
+asyncio applications. They are a thread-offload convenience, not an asynchronous
+HTTP client: the blocking work of the regular client (HTTP calls, token refreshes,
+record validation and setting up the continents and countries of a lazy API object)
+runs in worker threads with ``asyncio.to_thread``, so the event loop is not blocked
+while it waits. One semaphore per API object limits the number of concurrent calls,
+and with that the number of threads in use.
+
+Classes:
+    AsyncTheDataGardenAPI: Awaitable variant of TheDataGardenAPI.
+    AsyncRegion: Awaitable variant of a continent or country object.
+
+Example:
+    >>> api = await AsyncTheDataGardenAPI.create(email=..., password=...)
+    >>> demographics = await asyncio.gather(
+    ...     *[api.region(country).retrieve("demographics") for country in ["nl", "de", "be"]]
+    ... )
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Callable, Literal
+
+from pydantic import BaseModel
+from requests import Session
+
+from the_datagarden.abc.api import IngestMode
+from the_datagarden.abc.authentication import DatagardenEnvironment
+from the_datagarden.api.authentication.settings import MAX_CONCURRENT_REQUESTS
+from the_datagarden.api.base import TheDataGardenAPI
+from the_datagarden.api.cache import ResponseCache
+from the_datagarden.api.regions.base import Region
+from the_datagarden.models.aio import (
+    AsyncTheDataGardenRegionalDataModel,
+    AsyncTheDataGardenRegionGeoJSONModel,
+)
+
+
+class AsyncRegion:
+    """
+    Awaitable variant of a region (continent or country) object.
+
+    Region statistics are needed to know which data models are available for a region.
+    They are retrieved with ``await region.meta_data()``. After that the models are also
+    available as attributes, e.g. ``region.demographics``.
+
+    The region can be given as a function that looks it up in the API object. The
+    lookup may set up the continents and countries of a lazy API object, so it is run
+    in a worker thread when the region is first awaited.
+    """
+
+    def __init__(self, region: Region | Callable[[], Region], limiter: asyncio.Semaphore):
+        self._limiter = limiter
+        self._region: Region | None = None
+        self._lookup_region: Callable[[], Region] | None = None
+        if isinstance(region, Region):
+            self._region = region
+        else:
+            self._lookup_region = region
+        self._lookup_lock = threading.Lock()
+        self._geojsons = AsyncTheDataGardenRegionGeoJSONModel(
+            self._region.geojsons if self._region else None,
+            limiter,
+            lookup_model=lambda: self._looked_up_region().geojsons,
+        )
+
+    def __repr__(self):
+        return f"Async{self._region!r}" if self._region else f"{self.__class__.__name__} : (not looked up)"
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+        if self._region is None or not self._region.meta_data_loaded:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr}'. "
+                "Await `meta_data()` or use `await region.model(<model_name>)` to load the available models"
+            )
+        if attr in self._region.available_model_names:
+            return AsyncTheDataGardenRegionalDataModel(getattr(self._region, attr), self._limiter)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+
+    @property
+    def region(self) -> Region:
+        if self._region is None:
+            raise ValueError("The region is not looked up yet. Await `region.lookup()` first")
+        return self._region
+
+    @property
+    def geojsons(self) -> AsyncTheDataGardenRegionGeoJSONModel:
+        return self._geojsons
+
+    async def lookup(self) -> Region:
+        """
+        Get the region, looking it up in the API object in a worker thread on first use.
+        """
+        if self._region is None:
+            async with self._limiter:
+                return await asyncio.to_thread(self._looked_up_region)
+        return self._region
+
+    def _looked_up_region(self) -> Region:
+        with self._lookup_lock:
+            if self._region is None and self._lookup_region is not None:
+                self._region = self._lookup_region()
+        return self.region
+
+    async def meta_data(self) -> BaseModel | None:
+        """
+        Get the region statistics info from the API.
+        """
+        region = await self.lookup()
+        if not region.meta_data_loaded:
+            async with self._limiter:
+                return await asyncio.to_thread(lambda: region.meta_data)
+        return region.meta_data
+
+    async def available_model_names(self) -> list[str]:
+        await self.meta_data()
+        return self.region.available_model_names
+
+    async def model(self, model_name: str) -> AsyncTheDataGardenRegionalDataModel:
+        """
+        Get the (empty or already loaded) regional data model for this region.
+        """
+        if model_name not in await self.available_model_names():
+            raise AttributeError(f"Model '{model_name}' is not available for {self._region}")
+        return AsyncTheDataGardenRegionalDataModel(getattr(self.region, model_name), self._limiter)
+
+    async def retrieve(self, model_name: str, **kwargs) -> AsyncTheDataGardenRegionalDataModel:
+        """
+        Retrieve regional data for a model, equivalent to ``await (await region.model(name))(**kwargs)``.
+        """
+        model = await self.model(model_name)
+        return await model(**kwargs)
+
+
+class AsyncTheDataGardenAPI:
+    """
+    Awaitable variant of ``TheDataGardenAPI``. Calls run the wrapped (blocking) API object
+    in worker threads.
+
+    Create the object with ``await AsyncTheDataGardenAPI.create(...)`` (which initializes the
+    underlying API in a worker thread) or wrap an existing ``TheDataGardenAPI`` object.
+
+    Regions are available as attributes (``api.nl``) or with ``api.region("nl")``. When the
+    continents and countries of the API object are not set up yet (``lazy=True``), they
+    are set up in a worker thread when a region is first awaited.
+
+    Args:
+        api: The synchronous API object that is wrapped.
+        max_concurrency: Maximum number of API calls running at the same time.
+    """
+
+    def __init__(self, api: TheDataGardenAPI, max_concurrency: int = MAX_CONCURRENT_REQUESTS):
+        self._api = api
+        self._limiter = asyncio.Semaphore(max_concurrency)
+        self._regions: dict[int, AsyncRegion] = {}
+        self._regions_to_look_up: dict[str, AsyncRegion] = {}
+
+    @classmethod
+    async def create(
+        cls,
+        environment: type[DatagardenEnvironment] | None = None,
+        email: str | None = None,
+        password: str | None = None,
+        session: Session | None = None,
+        cache: ResponseCache | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        check_pulse: bool | Literal["background"] = True,
+        lazy: bool = False,
+        region_snapshot: str | Path | None = None,
+        columnar: bool = False,
+        ingest_mode: IngestMode = "strict",
+    ) -> "AsyncTheDataGardenAPI":
+        api = await asyncio.to_thread(
+            TheDataGardenAPI,
+            environment,
+            email,
+            password,
+            session,
+            cache,
+            check_pulse=check_pulse,
+            lazy=lazy,
+            region_snapshot=region_snapshot,
+            columnar=columnar,
+            ingest_mode=ingest_mode,
+        )
+        return cls(api, max_concurrency=max_concurrency)
+
+    def __getattr__(self, attr: str) -> AsyncRegion:
+        if attr.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+        return self.region(attr)
+
+    @property
+    def api(self) -> TheDataGardenAPI:
+        return self._api
+
+    def region(self, name: str) -> AsyncRegion:
+        """
+        Get a continent or country by name or iso country code (e.g. `netherlands` or `nl`).
+        Unknown names raise an AttributeError, or when the regions of the API object are not
+        set up yet, when the region is first awaited.
+        """
+        attr = name.lower().replace(" ", "_")
+        if attr in self._regions_to_look_up:
+            return self._regions_to_look_up[attr]
+        if self._api.regions_loaded:
+            return self._async_region(getattr(self._api, attr))
+        if attr not in self._regions_to_look_up:
+            self._regions_to_look_up[attr] = AsyncRegion(lambda: getattr(self._api, attr), self._limiter)
+        return self._regions_to_look_up[attr]
+
+    async def world(self) -> dict:
+        async with self._limiter:
+            return await asyncio.to_thread(self._api.world)
+
+    async def continents(self, include_details: bool = False) -> list[str] | dict[str, AsyncRegion]:
+        continents = await asyncio.to_thread(self._api.continents, include_details=True)
+        if not include_details:
+            return list(continents.keys())
+        return {name: self._async_region(continent) for name, continent in continents.items()}
+
+    async def countries(self, include_details: bool = False) -> list[str] | dict[str, AsyncRegion]:
+        countries = await asyncio.to_thread(self._api.countries, include_details=True)
+        if not include_details:
+            return list(countries.keys())
+        return {name: self._async_region(country) for name, country in countries.items()}
+
+    def _async_region(self, region: Region) -> AsyncRegion:
+        # A region can be registered under multiple names (e.g. `netherlands` and `nl`)
+        if id(region) not in self._regions:
+            self._regions[id(region)] = AsyncRegion(region, self._limiter)
+        return self._regions[id(region)]
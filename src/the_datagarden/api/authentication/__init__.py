@@ -1,11 +1,13 @@
 import json
+import threading
+import weakref
 from datetime import UTC, datetime, timedelta
 
 import jwt
-import requests
-from requests import Response
+from requests import Response, Session
 
 from ...abc.authentication import DatagardenEnvironment
+from ..decoder import response_json
 from .settings import (
     BEARER_KEY,
     DEFAULT_HEADER,
@@ -15,26 +17,51 @@ from .settings import (
 
 
 class AccessToken:
-    _instance = None
-    _tokens: dict = {}
+    """
+    Access and refresh tokens for one set of credentials.
+
+    Each API object has its own token manager, so one process can use several accounts
+    or environments. The manager is safe to use from many threads:
+
+    - a token that expires within ``TOKEN_LIFE_TIME_MARGIN`` seconds is refreshed by one
+      thread while the other threads wait for the new token (single-flight refresh);
+    - with ``background_refresh`` the token is refreshed in a daemon thread
+      ``TOKEN_REFRESH_AHEAD`` seconds before it expires, so requests do not wait for
+      token refreshes;
+    - when the refresh token is no longer accepted, new tokens are requested with the
+      credentials.
+    """
+
     TOKEN_LIFE_TIME_MARGIN: int = 20
+    TOKEN_REFRESH_AHEAD: int = 60
     ACCESS_TOKEN_KEY = "access"
     REFRESH_TOKEN_KEY = "refresh"
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(
         self,
         environment: type[DatagardenEnvironment],
         email: str | None = None,
         password: str | None = None,
+        session: Session | None = None,
+        background_refresh: bool = True,
     ) -> None:
+        # Imported here, the session module imports the settings of this package
+        from ..session import DataGardenSession
+
+        self._session = session or DataGardenSession()
         self._environment = environment()
         self._token_payload = self._environment.credentials(email, password)
         self._token_header = DEFAULT_HEADER.copy()
+        self._tokens: dict[str, str] = {}
+        self._token_expiry_time: datetime | None = None
+        self._lock = threading.Lock()
+        self._background_refresh = background_refresh
+        self._refresh_timer: threading.Timer | None = None
+
+    @property
+    def account(self) -> str | None:
+        """Email address of the credentials"""
+        return self._token_payload.get("email")
 
     @property
     def _token_url(self) -> str:
@@ -48,18 +75,31 @@ class AccessToken:
     def _the_datagarden_url(self) -> str:
         return self._environment.the_datagarden_url
 
-    def _access_token_expired(self) -> bool:
-        if self._token_expiry_time:
-            return datetime.now(tz=UTC) + timedelta(seconds=5) > self._token_expiry_time
+    def _access_token_expired(self, margin: int | None = None) -> bool:
+        """Whether the access token expires within ``margin`` seconds (``TOKEN_LIFE_TIME_MARGIN``)"""
+        return self._expires_within(self._token_expiry_time, margin)
+
+    def _expires_within(self, expiry_time: datetime | None, margin: int | None = None) -> bool:
+        if expiry_time:
+            margin = self.TOKEN_LIFE_TIME_MARGIN if margin is None else margin
+            return datetime.now(tz=UTC) + timedelta(seconds=margin) > expiry_time
         return True
 
     @property
     def _access_token(self) -> str:
-        if not self._tokens:
-            self._request_tokens()
-        elif self._access_token_expired():
-            self._get_refresh_token()
-        return self._tokens.get(self.ACCESS_TOKEN_KEY, "")
+        # The expiry time is read before the tokens, and _set_tokens sets it after them, so
+        # the tokens read are never older than the expiry time they are checked against
+        expiry_time = self._token_expiry_time
+        tokens = self._tokens
+        if not tokens or self._expires_within(expiry_time):
+            with self._lock:
+                # Another thread may have refreshed the tokens while this one waited
+                if not self._tokens:
+                    self._request_tokens()
+                elif self._access_token_expired():
+                    self._refresh_tokens()
+                tokens = self._tokens
+        return tokens.get(self.ACCESS_TOKEN_KEY, "")
 
     @property
     def header_with_access_token(self) -> dict[str, str]:
@@ -68,45 +108,89 @@ class AccessToken:
         return header
 
     def _request_tokens(self):
-        response = requests.request(
+        response = self._session.request(
             method="POST",
             url=self._token_url,
             headers=self._token_header,
             data=json.dumps(self._token_payload),
         )
         if not response.status_code == 200:
-            print("Token request failed and returned error(s): ")
-            print("    Errorr : ", response.json().get("detail", "No error details provided"))
-            quit()
+            detail = response_json(response).get("detail", "No error details provided")
+            raise ValueError(f"Token request failed and returned error: {detail}")
 
-        self._tokens = self._get_response_data(response)
-        self._set_token_expiry_time()
+        self._set_tokens(self._get_response_data(response))
+
+    def _refresh_tokens(self):
+        """Refresh the tokens, or request new tokens when the refresh token is not accepted"""
+        try:
+            self._get_refresh_token()
+        except ValueError:
+            self._request_tokens()
 
     def _get_refresh_token(self):
-        response = requests.request(
+        response = self._session.request(
             method="POST",
             url=self._refresh_token_url,
             headers=self._token_header,
             data=json.dumps(self._refresh_payload()),
         )
         if not response.status_code == 200:
-            raise ValueError("Token request failed and returned error: " f"{response.text}")
-        self._tokens = self._get_response_data(response)
-        self._set_token_expiry_time()
+            raise ValueError(f"Token request failed and returned error: {response.text}")
+        self._set_tokens(self._get_response_data(response))
 
     def _refresh_payload(self) -> dict:
         refresh_token = self._tokens.get(self.REFRESH_TOKEN_KEY, "")
         return {"refresh": refresh_token}
 
-    def _set_token_expiry_time(self):
-        if not self._tokens:
-            return
-        access_token = self._tokens.get(self.ACCESS_TOKEN_KEY, "")
+    def _set_tokens(self, tokens: dict[str, str]):
+        """Store new tokens with their expiry time and schedule the next background refresh"""
+        access_token = tokens.get(self.ACCESS_TOKEN_KEY, "")
         if not access_token:
             raise ValueError("Access token not found in response")
         decoded_token = jwt.decode(access_token, options={"verify_signature": False})
         exp_time_stamp = decoded_token["exp"]
+        # The expiry time is set after the tokens: a thread that reads the new expiry time
+        # (before the tokens, see _access_token) also reads the new tokens
+        self._tokens = tokens
         self._token_expiry_time = datetime.fromtimestamp(timestamp=exp_time_stamp, tz=UTC)
+        self._schedule_background_refresh()
+
+    def _schedule_background_refresh(self):
+        if not self._background_refresh or not self._token_expiry_time:
+            return
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+        life_time = (self._token_expiry_time - datetime.now(tz=UTC)).total_seconds()
+        # Short lived tokens are refreshed halfway their life time
+        delay = max(life_time - self.TOKEN_REFRESH_AHEAD, life_time / 2, 0.0)
+        self._refresh_timer = threading.Timer(delay, _refresh_in_background, args=(weakref.ref(self),))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.name = "the-datagarden-token-refresh"
+        self._refresh_timer.start()
+
+    def _refresh_ahead_of_expiry(self):
+        """Refresh the tokens unless another thread already did"""
+        with self._lock:
+            if self._access_token_expired(margin=self.TOKEN_REFRESH_AHEAD):
+                self._refresh_tokens()
+
+    def close(self):
+        """Stop refreshing the tokens in the background"""
+        self._background_refresh = False
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
 
     def _get_response_data(self, response: Response) -> dict[str, str]:
-        return json.loads(response.text)
+        return response_json(response)
+
+
+def _refresh_in_background(token_reference: "weakref.ref[AccessToken]"):
+    # The timer holds a weak reference, so it does not keep unused token managers alive
+    access_token = token_reference()
+    if access_token is None:
+        return
+    try:
+        access_token._refresh_ahead_of_expiry()
+    except Exception:
+        # Requests refresh the tokens themselves when the background refresh failed
+        pass
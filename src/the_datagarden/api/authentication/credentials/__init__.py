@@ -1,8 +1,8 @@
-import requests
 from decouple import config
 
 from the_datagarden.abc.authentication import BaseDataGardenCredentials, TheDatagardenCredentialsDict
 from the_datagarden.api.authentication.settings import REGISTRATION_URL_EXTENSION
+from the_datagarden.api.session import DataGardenSession
 
 
 class CredentialsFromUserInput:
@@ -15,7 +15,7 @@ class CredentialsFromUserInput:
         print("  Check www.the-datagarden.io for more information.")
         print()
         choice = input(
-            "Do you want to (1) create a new account or (2) provide existing credentials? " "Enter 1 or 2: "
+            "Do you want to (1) create a new account or (2) provide existing credentials? Enter 1 or 2: "
         )
 
         if choice == "1":
@@ -39,7 +39,8 @@ class CredentialsFromUserInput:
 
         data = {"email": email, "password": password}
         registration_url = the_datagarden_api_url + REGISTRATION_URL_EXTENSION
-        response = requests.post(registration_url, data=data)
+        with DataGardenSession(max_retries=0) as session:
+            response = session.post(registration_url, data=data)
         if response.status_code == 201:
             print("Successfully enrolled in The Data Garden API.")
             return TheDatagardenCredentialsDict(
@@ -11,6 +11,16 @@ Constants:
     BEARER_KEY (str): Prefix for Bearer token authentication.
     API_EXTENSION (str): Extension for API endpoints (currently empty).
     DEFAULT_HEADER (dict): Default headers for API requests.
+    HTTP_POOL_SIZE (int): Number of keep-alive connections per host in the HTTP session.
+    HTTP_MAX_RETRIES (int): Number of retries for failed or throttled HTTP requests.
+    HTTP_BACKOFF_FACTOR (float): Exponential backoff factor between HTTP retries.
+    HTTP_TIMEOUT (float): Default timeout in seconds for each HTTP request.
+    PAGE_FETCH_WORKERS (int): Number of pages of a paginated response fetched concurrently.
+    MAX_CONCURRENT_REQUESTS (int): Number of regions or models retrieved concurrently.
+    CACHE_DIR (str): Directory of the persistent response cache.
+    CACHE_MAX_SIZE_MB (int): Maximum size of the persistent response cache.
+    DEFAULT_CACHE_TTL (dict): Time to live in seconds of cached responses per endpoint class.
+    JSON_DECODER (str): Decoder for API responses (auto, orjson, msgspec or json).
 
 """
 
@@ -23,6 +33,26 @@ INCLUDE_STATISTIC_PARAM = {"include_statistics": "y"}
 STATISTICS_URL_EXTENSION = "statistics/"
 
 SHOW_REQ_DETAIL = config("SHOW_REQ_DETAIL", default=False, cast=bool)
+
+HTTP_POOL_SIZE = config("THE_DATAGARDEN_HTTP_POOL_SIZE", default=10, cast=int)
+HTTP_MAX_RETRIES = config("THE_DATAGARDEN_HTTP_MAX_RETRIES", default=3, cast=int)
+HTTP_BACKOFF_FACTOR = config("THE_DATAGARDEN_HTTP_BACKOFF_FACTOR", default=0.5, cast=float)
+HTTP_TIMEOUT = config("THE_DATAGARDEN_HTTP_TIMEOUT", default=60.0, cast=float)
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+PAGE_FETCH_WORKERS = config("THE_DATAGARDEN_PAGE_FETCH_WORKERS", default=8, cast=int)
+MAX_CONCURRENT_REQUESTS = config("THE_DATAGARDEN_MAX_CONCURRENT_REQUESTS", default=8, cast=int)
+
+CACHE_DIR = config("THE_DATAGARDEN_CACHE_DIR", default="~/.cache/the_datagarden")
+CACHE_MAX_SIZE_MB = config("THE_DATAGARDEN_CACHE_MAX_SIZE_MB", default=1024, cast=int)
+DEFAULT_CACHE_TTL: dict[str, int] = {
+    "pulse": 60,
+    "statistics": 24 * 60 * 60,
+    "regional_data": 24 * 60 * 60,
+    "geojson": 7 * 24 * 60 * 60,
+    "default": 24 * 60 * 60,
+}
+JSON_DECODER = config("THE_DATAGARDEN_JSON_DECODER", default="auto")
+
 REQ_TOKEN_URL_EXTENSION = "user/token/"
 REFRESH_TOKEN_URL_EXTENSION = "user/token/refresh/"
 
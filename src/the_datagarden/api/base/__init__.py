@@ -13,50 +13,141 @@ Imports:
     TheDatagardenProductionEnvironment: Concrete implementation of the production
                                                                         environment.
     URLExtension: Class for handling URL extensions.
+    DataGardenSession: Pooled HTTP session used for all calls to the API.
+    ResponseCache: Optional persistent cache for API responses.
+    StatisticsCache: Region statistics shared by the regions of the API object.
 """
 
+import json
+import threading
 from collections import defaultdict
-from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, KeysView, Literal, Sequence, get_args, overload
 
 import requests
-from requests import Response
+from pydantic import BaseModel
+from requests import Response, Session
 
-from the_datagarden.abc.api import BaseApi
+from the_datagarden.abc.api import BaseApi, IngestMode
 from the_datagarden.abc.authentication import DatagardenEnvironment
 from the_datagarden.api.authentication import AccessToken
 from the_datagarden.api.authentication.environment import TheDatagardenProductionEnvironment
 from the_datagarden.api.authentication.settings import (
     DEFAULT_HEADER,
+    MAX_CONCURRENT_REQUESTS,
     SHOW_REQ_DETAIL,
     DynamicEndpointCategories,
     URLExtension,
 )
+from the_datagarden.api.cache import ResponseCache
+from the_datagarden.api.decoder import decode_json, response_json
 from the_datagarden.api.regions import Continent
+from the_datagarden.api.regions.base import PeriodTypes, Region
 from the_datagarden.api.regions.country import Country
+from the_datagarden.api.session import DataGardenSession
+from the_datagarden.api.statistics import AvailabilityIndex, StatisticsCache
+
+if TYPE_CHECKING:
+    from the_datagarden.models import TheDataGardenRegionalDataCollection
 
 
 class BaseDataGardenAPI(BaseApi):
     """
     Base class for interacting with The Data Garden API.
+
+    All HTTP traffic, including token requests, goes through one pooled session
+    owned by the API object. Pass a ``session`` to share connections between API
+    objects or to tune pool size, retries and timeouts
+    (see ``the_datagarden.api.session.DataGardenSession``).
+
+    Pass a ``cache`` (see ``the_datagarden.api.cache.ResponseCache``) to store API
+    responses on disk and re-use them across processes.
+
+    Region statistics are retrieved once per region and kept in ``statistics_cache``
+    (see ``the_datagarden.api.statistics.StatisticsCache``).
+
+    With ``columnar=True`` the records of regional data models are stored as polars
+    columns (see ``the_datagarden.models.columnar.ColumnarRecordStore``).
+
+    With ``ingest_mode="fast"`` the responses of the API are not validated; models are
+    created directly from the response data (see ``the_datagarden.models.ingest``). The
+    default ``"strict"`` mode validates all responses and raises pydantic validation
+    errors for data that does not match the models.
+
+    The API status is checked with a call to the pulse endpoint. Set ``check_pulse`` to
+    ``"background"`` to run the check in a background thread or to ``False`` to skip it.
+
+    API objects are independent of each other: each object has its own environment,
+    session, access token, regions and caches, so several objects can be used side by
+    side, e.g. one per account or per environment in a pool of workers.
     """
 
     ACCESS_TOKEN: type[AccessToken] = AccessToken
-    DYNAMIC_ENDPOINTS: dict = defaultdict(dict)
+    DYNAMIC_ENDPOINTS: dict[str, dict[str, Region]]
 
     def __init__(
         self,
         environment: type[DatagardenEnvironment] | None = None,
         email: str | None = None,
         password: str | None = None,
+        session: Session | None = None,
+        cache: ResponseCache | None = None,
+        check_pulse: bool | Literal["background"] = True,
+        columnar: bool = False,
+        ingest_mode: IngestMode = "strict",
     ):
+        # Set first, ``TheDataGardenAPI.__getattr__`` looks up regions in it
+        self.DYNAMIC_ENDPOINTS = defaultdict(dict)
+        if ingest_mode not in get_args(IngestMode):
+            raise ValueError(f"ingest_mode should be one of {get_args(IngestMode)}, not '{ingest_mode}'")
         self._environment = environment or TheDatagardenProductionEnvironment
         self._base_url = self._environment().the_datagarden_url
+        self._owns_session = session is None
+        self._session = session or DataGardenSession()
+        self._cache = cache
+        self.statistics_cache = StatisticsCache()
+        self.columnar = columnar
+        self.ingest_mode: IngestMode = ingest_mode
+        self._api_status: bool | None = None
+        if check_pulse == "background":
+            threading.Thread(
+                target=self._set_api_status_in_background, name="the-datagarden-pulse", daemon=True
+            ).start()
+        elif check_pulse:
+            self._set_api_status()
+        self._tokens = self.ACCESS_TOKEN(self._environment, email, password, session=self._session)
+
+    @property
+    def session(self) -> Session:
+        return self._session
+
+    def close(self):
+        """
+        Stop the background refresh of the access token and close the session when it
+        was created by the API object.
+        """
+        self._tokens.close()
+        if self._owns_session:
+            self._session.close()
+
+    @property
+    def api_status(self) -> bool | None:
+        """Result of the pulse check (None when not checked or still running)"""
+        return self._api_status
+
+    def _set_api_status(self):
         self._api_status = self._check_pulse()
-        self._tokens = self.ACCESS_TOKEN(self._environment, email, password)
+
+    def _set_api_status_in_background(self):
+        try:
+            self._set_api_status()
+        except requests.RequestException:
+            self._api_status = False
 
     def _check_pulse(self) -> bool:
         url = self._generate_url(URLExtension.PULSE)
-        response = requests.request(method="GET", url=url, headers=DEFAULT_HEADER.copy())
+        response = self._send_request(method="GET", url=url, headers=DEFAULT_HEADER.copy())
 
         if response.status_code == 200:
             return True
@@ -85,26 +176,50 @@ class BaseDataGardenAPI(BaseApi):
             print(f"Request params: {params}")
         match method:
             case "GET":
-                response = requests.get(url, params=params, headers=headers)
+                response = self._send_request("GET", url, headers, params=params)
             case "POST":
-                response = requests.post(url, json=payload, headers=headers)
+                response = self._send_request("POST", url, headers, payload=payload)
             case _:
                 raise ValueError(f"Invalid method: {method}")
 
         return self._response_handler(response)
 
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict | None = None,
+        params: dict | None = None,
+        data: str | bytes | None = None,
+    ) -> Response:
+        if self._cache:
+            # Only responses of authenticated requests depend on the account
+            account = self._tokens.account if "Authorization" in headers else None
+            return self._cache.send(
+                self._session,
+                method,
+                url,
+                headers,
+                payload=payload,
+                params=params,
+                data=data,
+                account=account,
+            )
+        return self._session.request(method, url, params=params, json=payload, data=data, headers=headers)
+
     def _response_handler(self, response: requests.Response) -> Response | None:
         if response.status_code == 200:
             return response
         else:
-            response_dict = response.json()
+            response_dict = response_json(response)
             for k, v in response_dict.items():
                 print(k)
                 print(v)
             return None
 
     def _get_next_page(self, response: requests.Response) -> requests.Response | None:
-        next_url = response.json().get("next")
+        next_url = response_json(response).get("next")
         if not next_url:
             return None
 
@@ -114,17 +229,19 @@ class BaseDataGardenAPI(BaseApi):
         headers = self._tokens.header_with_access_token
 
         if original_method == "GET":
-            return requests.get(next_url, headers=headers)
+            return self._send_request("GET", next_url, headers)
         elif original_method == "POST":
             # For POST requests, we need to preserve the original payload
             original_payload = response.request.body
-            return requests.post(next_url, data=original_payload, headers=headers)
+            if original_payload is not None and not isinstance(original_payload, (str, bytes)):
+                raise ValueError("Streamed request bodies cannot be sent again for pagination")
+            return self._send_request("POST", next_url, headers, data=original_payload)
         else:
             raise ValueError(f"Unsupported method for pagination: {original_method}")
 
     def _records_from_paginated_api_response(self, response: requests.Response | None) -> Iterator[dict]:
         while response:
-            for record in response.json()["results"]:
+            for record in response_json(response)["results"]:
                 yield record
             response = self._get_next_page(response)
 
@@ -136,67 +253,250 @@ class BaseDataGardenAPI(BaseApi):
 
 
 class TheDataGardenAPI(BaseDataGardenAPI):
-    _instance = None
-    _initialized = False
+    """
+    Entry point for The Data Garden API giving access to continents and countries.
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    Continents and countries are retrieved from the API when the object is created. With
+    ``lazy=True`` they are retrieved on first use instead, and with ``region_snapshot``
+    they are loaded from (or, when the file does not yet exist, saved to) a JSON file.
+    Combined with ``check_pulse="background"`` creating the object makes no blocking calls.
+
+    Every call creates a new API object. Regions are set up once per object, also when
+    several threads use the object at the same time.
+    """
 
     def __init__(
         self,
         environment: type[DatagardenEnvironment] | None = None,
         email: str | None = None,
         password: str | None = None,
+        session: Session | None = None,
+        cache: ResponseCache | None = None,
+        check_pulse: bool | Literal["background"] = True,
+        lazy: bool = False,
+        region_snapshot: str | Path | None = None,
+        columnar: bool = False,
+        ingest_mode: IngestMode = "strict",
     ):
-        if not self._initialized:
-            super().__init__(environment, email, password)
-            self._setup_continents()
-            self._setup_countries()
-            self.__class__._initialized = True
+        super().__init__(environment, email, password, session, cache, check_pulse, columnar, ingest_mode)
+        self._region_snapshot = Path(region_snapshot) if region_snapshot else None
+        self._region_records: dict[str, list[dict]] = defaultdict(list)
+        self._regions_loaded = False
+        self._regions_lock = threading.RLock()
+        if not lazy:
+            self._setup_regions()
 
     def __getattr__(self, attr: str):
-        for _, endpoints in self.DYNAMIC_ENDPOINTS.items():
+        if attr.startswith("_") or attr == "DYNAMIC_ENDPOINTS":
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+
+        # Regions may be registered by another thread while looking up the attribute
+        for endpoints in tuple(self.DYNAMIC_ENDPOINTS.values()):
             if attr.lower() in endpoints:
                 return endpoints[attr.lower()]
 
+        if not self._regions_loaded:
+            self._setup_regions()
+            return getattr(self, attr)
+
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
 
+    @property
+    def regions_loaded(self) -> bool:
+        """Whether the continents and countries are set up, i.e. looking up a region makes no request"""
+        return self._regions_loaded
+
     def world(self):
         response = self.retrieve_from_api(URLExtension.WORLD)
-        return response.json()
-
-    def continents(self, include_details: bool = False) -> list[str] | dict:
-        continents = (
-            self.DYNAMIC_ENDPOINTS.get(DynamicEndpointCategories.CONTINENTS, None) or self._setup_continents()
-        )
+        return response_json(response)
+
+    @overload
+    def continents(self, include_details: Literal[False] = False) -> KeysView[str]: ...
+
+    @overload
+    def continents(self, include_details: Literal[True]) -> dict[str, Region]: ...
+
+    def continents(self, include_details: bool = False) -> KeysView[str] | dict[str, Region]:
+        with self._regions_lock:
+            if not self._regions_loaded:
+                self._setup_regions()
+            continents = (
+                self.DYNAMIC_ENDPOINTS.get(DynamicEndpointCategories.CONTINENTS, None)
+                or self._setup_continents()
+            )
         if not include_details:
             return continents.keys()
         return continents
 
-    def countries(self, include_details: bool = False) -> list[str] | dict:
-        countries = (
-            self.DYNAMIC_ENDPOINTS.get(DynamicEndpointCategories.COUNTRIES, None) or self._setup_countries()
-        )
+    @overload
+    def countries(self, include_details: Literal[False] = False) -> KeysView[str]: ...
+
+    @overload
+    def countries(self, include_details: Literal[True]) -> dict[str, Region]: ...
+
+    def countries(self, include_details: bool = False) -> KeysView[str] | dict[str, Region]:
+        with self._regions_lock:
+            if not self._regions_loaded:
+                self._setup_regions()
+            countries = (
+                self.DYNAMIC_ENDPOINTS.get(DynamicEndpointCategories.COUNTRIES, None)
+                or self._setup_countries()
+            )
         if not include_details:
             return countries.keys()
         return countries
 
+    def bulk_fetch(
+        self,
+        regions: Sequence[str | Region] | None = None,
+        models: list[str] | None = None,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+        **params,
+    ) -> dict[str, "TheDataGardenRegionalDataCollection"]:
+        """
+        Retrieve data for many regions and data models concurrently.
+
+        Args:
+            regions: Continent or country names, iso codes or region objects.
+                Defaults to all countries.
+            models: Names of the data models to retrieve (e.g. ["demographics", "economics"]).
+                Defaults to all models available for the regions.
+            max_workers: Maximum number of requests for regional data running at the same time,
+                shared by the regions and models and the pages of each of them.
+            **params: Parameters for the regional data call (e.g. period_from, descendant_level).
+
+        Returns:
+            dict[str, TheDataGardenRegionalDataCollection]: A collection per data model holding
+            the regional data models of all regions for which the model is available.
+            The models are new objects holding the records of this call only; the models
+            of the regions (e.g. ``api.nl.demographics``) are not changed.
+            Regions without data for the requested period type, period range, source or
+            region type (according to the region statistics) are not requested.
+        """
+        from the_datagarden.models import TheDataGardenRegionalDataCollection, TheDataGardenRegionalDataModel
+
+        regions_to_fetch = self._regions_for_bulk_fetch(regions)
+        # Region statistics tell which models are available and are required for each model
+        availability_index = self.prefetch_statistics(regions_to_fetch, max_workers)
+        availability_filters = self._availability_filters(params)
+        requests_to_fetch = [
+            (region, meta_data, model_name.lower())
+            for region in regions_to_fetch
+            if (meta_data := region.meta_data) is not None
+            for model_name in (models or region.available_model_names)
+            if model_name.lower() in region.available_model_names
+            and availability_index.has_data(region, model_name, **availability_filters)
+        ]
+        if not requests_to_fetch:
+            return {}
+
+        # Regions and models are fetched by ``region_workers`` threads, each fetching at most
+        # ``page_workers`` pages at the same time, so at most ``max_workers`` requests run
+        region_workers = max(min(max_workers, len(requests_to_fetch)), 1)
+        page_workers = max(max_workers // region_workers, 1)
+
+        def fetch(region: Region, meta_data: BaseModel, model_name: str) -> TheDataGardenRegionalDataModel:
+            model = TheDataGardenRegionalDataModel(
+                api=self, model_name=model_name, region_url=region.region_url, meta_data=meta_data
+            )
+            return model._retrieve(page_workers, **params)
+
+        with ThreadPoolExecutor(
+            max_workers=region_workers, thread_name_prefix="the-datagarden-bulk"
+        ) as executor:
+            fetched_models = executor.map(lambda request: fetch(*request), requests_to_fetch)
+
+            collections: dict[str, TheDataGardenRegionalDataCollection] = {}
+            for (_, _, model_name), model in zip(requests_to_fetch, fetched_models, strict=True):
+                if model_name not in collections:
+                    collections[model_name] = TheDataGardenRegionalDataCollection(model_name)
+                collections[model_name].append(model)
+
+        return collections
+
+    def prefetch_statistics(
+        self, regions: Sequence[str | Region] | None = None, max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> AvailabilityIndex:
+        """
+        Retrieve the statistics of many regions concurrently and index the availability
+        of the data models per region, region type and period range.
+
+        Args:
+            regions: Continent or country names, iso codes or region objects.
+                Defaults to all countries.
+            max_workers: Maximum number of statistics retrieved at the same time.
+        """
+        regions_to_fetch = self._regions_for_bulk_fetch(regions)
+        self.statistics_cache.prefetch(regions_to_fetch, max_workers)
+        return AvailabilityIndex(regions_to_fetch)
+
+    @staticmethod
+    def _availability_filters(params: dict) -> dict:
+        """Filters of the availability index for the parameters of a regional data call"""
+        source = params.get("source")
+        filters = {
+            # Without a period type the API returns yearly data
+            "period_type": params.get("period_type") or PeriodTypes.YEAR,
+            "period_from": params.get("period_from"),
+            "period_to": params.get("period_to"),
+            "region_type": params.get("region_type"),
+            # A list of sources matches regions with data for any of them; not filtered
+            "source": source if isinstance(source, str) else None,
+        }
+        return {key: value for key, value in filters.items() if value is not None}
+
+    def _regions_for_bulk_fetch(self, regions: Sequence[str | Region] | None) -> list[Region]:
+        if regions is None:
+            regions = list(self.countries(include_details=True).values())
+
+        regions_to_fetch: dict[int, Region] = {}
+        for region in regions:
+            if isinstance(region, str):
+                region = getattr(self, region.lower().replace(" ", "_"))
+            # Countries are registered both by name and by iso code
+            regions_to_fetch[id(region)] = region
+        return list(regions_to_fetch.values())
+
+    def save_region_snapshot(self, path: str | Path):
+        """
+        Save the continents and countries to a JSON file, to be used as ``region_snapshot``.
+        """
+        if not self._regions_loaded:
+            self._setup_regions()
+        Path(path).write_text(json.dumps(self._region_records))
+
+    def load_region_snapshot(self, path: str | Path):
+        """
+        Load the continents and countries from a JSON file created with ``save_region_snapshot``.
+        """
+        region_records = decode_json(Path(path).read_bytes())
+        with self._regions_lock:
+            for continent in region_records.get(DynamicEndpointCategories.CONTINENTS, []):
+                self._register_continent(continent)
+            for country in region_records.get(DynamicEndpointCategories.COUNTRIES, []):
+                self._register_country(country)
+            self._regions_loaded = True
+
+    def _setup_regions(self):
+        with self._regions_lock:
+            # Another thread may have set up the regions while waiting for the lock
+            if self._regions_loaded:
+                return
+            if self._region_snapshot and self._region_snapshot.exists():
+                self.load_region_snapshot(self._region_snapshot)
+                return
+
+            self._setup_continents()
+            countries = self._setup_countries()
+            self._regions_loaded = True
+            if self._region_snapshot and countries:
+                self.save_region_snapshot(self._region_snapshot)
+
     def _setup_continents(self):
         if not self.DYNAMIC_ENDPOINTS.get(DynamicEndpointCategories.CONTINENTS, None):
             continents = self.retrieve_from_api(URLExtension.CONTINENTS)
             for continent in self._records_from_paginated_api_response(continents):
-                continent_method_name = continent["name"].lower().replace(" ", "_")
-                self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.CONTINENTS].update(
-                    {
-                        continent_method_name: Continent(
-                            url=self._create_url_extension([URLExtension.CONTINENT + continent["name"]]),
-                            api=self,
-                            name=continent["name"].lower(),
-                        ),
-                    }
-                )
+                self._register_continent(continent)
 
         return self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.CONTINENTS]
 
@@ -206,20 +506,39 @@ class TheDataGardenAPI(BaseDataGardenAPI):
             if not countries:
                 return None
             for country in self._records_from_paginated_api_response(countries):
-                country_method_name = country["name"].lower().replace(" ", "_")
-                country_code = country["iso_cc_2"].lower()
-                continent = country["parent_region"].lower()
-                country = Country(
-                    url=self._create_url_extension([URLExtension.COUNTRY + country["name"]]),
-                    api=self,
-                    name=country["name"],
-                    continent=continent,
-                )
-                self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.COUNTRIES].update(
-                    {
-                        country_method_name: country,
-                        country_code: country,
-                    }
-                )
+                self._register_country(country)
 
         return self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.COUNTRIES]
+
+    def _register_continent(self, continent: dict):
+        continent_method_name = continent["name"].lower().replace(" ", "_")
+        self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.CONTINENTS].update(
+            {
+                continent_method_name: Continent(
+                    url=self._create_url_extension([URLExtension.CONTINENT + continent["name"]]),
+                    api=self,
+                    name=continent["name"].lower(),
+                ),
+            }
+        )
+        self._region_records[DynamicEndpointCategories.CONTINENTS].append({"name": continent["name"]})
+
+    def _register_country(self, country: dict):
+        country_method_name = country["name"].lower().replace(" ", "_")
+        country_code = country["iso_cc_2"].lower()
+        continent = country["parent_region"].lower()
+        country_region = Country(
+            url=self._create_url_extension([URLExtension.COUNTRY + country["name"]]),
+            api=self,
+            name=country["name"],
+            continent=continent,
+        )
+        self.DYNAMIC_ENDPOINTS[DynamicEndpointCategories.COUNTRIES].update(
+            {
+                country_method_name: country_region,
+                country_code: country_region,
+            }
+        )
+        self._region_records[DynamicEndpointCategories.COUNTRIES].append(
+            {key: country[key] for key in ["name", "iso_cc_2", "parent_region"]}
+        )
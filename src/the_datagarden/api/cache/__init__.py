@@ -0,0 +1,278 @@
+"""
+Persistent response cache for The Data Garden API.
+
+Responses of the API are cached on disk, keyed on account, method, URL, query parameters
+and payload, so accounts with different access levels do not share responses. Each
+endpoint class (pulse, statistics, regional_data, geojson and default for all other
+endpoints) has its own time to live. When a cached response has expired but the server
+provided an ``ETag`` or ``Last-Modified`` header, the response is revalidated with a
+conditional request; a ``304 Not Modified`` response renews the cached response without
+downloading it again.
+
+Classes:
+    ResponseCache: Cache policy (keys, time to live and revalidation) on top of a store.
+    SQLiteResponseStore: Size bounded (LRU) on disk store for cached responses.
+
+Example:
+    >>> cache = ResponseCache(ttl={"geojson": 30 * 24 * 60 * 60})
+    >>> the_datagarden_api = TheDataGardenAPI(cache=cache)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from requests import Request, Response, Session
+from requests.structures import CaseInsensitiveDict
+
+from the_datagarden.abc.cache import BaseResponseStore, CachedResponse
+from the_datagarden.api.authentication.settings import (
+    CACHE_DIR,
+    CACHE_MAX_SIZE_MB,
+    DEFAULT_CACHE_TTL,
+    SHOW_REQ_DETAIL,
+)
+
+CACHED_HEADERS = ["Content-Type", "ETag", "Last-Modified"]
+
+
+class SQLiteResponseStore(BaseResponseStore):
+    """
+    Stores responses in a SQLite database. When the total size of the stored responses
+    exceeds ``max_size_mb`` the least recently used responses are removed.
+    The store can be shared by multiple threads and processes.
+    """
+
+    FILE_NAME = "responses.sqlite3"
+
+    def __init__(self, cache_dir: str | Path = CACHE_DIR, max_size_mb: int = CACHE_MAX_SIZE_MB):
+        cache_path = Path(cache_dir).expanduser()
+        cache_path.mkdir(parents=True, exist_ok=True)
+        self._path = cache_path / self.FILE_NAME
+        self._max_size = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self._path, check_same_thread=False, timeout=30, isolation_level=None
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, content BLOB, "
+                "stored_at REAL, accessed_at REAL, size INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : {self._path}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        status_code, headers, content, stored_at = row
+        return CachedResponse(
+            status_code=status_code, headers=json.loads(headers), content=content, stored_at=stored_at
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response["status_code"],
+                    json.dumps(response["headers"]),
+                    response["content"],
+                    response["stored_at"],
+                    time.time(),
+                    len(response["content"]),
+                ),
+            )
+            self._evict()
+
+    def touch(self, key: str, stored_at: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (stored_at, time.time(), key),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self._max_size:
+            return
+        keys_to_remove = []
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            keys_to_remove.append((key,))
+            total_size -= size
+            if total_size <= self._max_size:
+                break
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", keys_to_remove)
+
+
+class ResponseCache:
+    """
+    Caches API responses in a (persistent) response store.
+
+    Args:
+        store: Store for the cached responses. Defaults to a ``SQLiteResponseStore``
+            in ``THE_DATAGARDEN_CACHE_DIR``.
+        ttl: Time to live in seconds per endpoint class. Overrides the defaults in
+            ``DEFAULT_CACHE_TTL``; a time to live of 0 disables caching for that class.
+    """
+
+    ENDPOINT_CLASSES: dict[str, str] = {
+        "pulse": "pulse/",
+        "statistics": "statistics/",
+        "regional_data": "regional_data/",
+        "geojson": "geojson/",
+    }
+
+    def __init__(self, store: BaseResponseStore | None = None, ttl: dict[str, int] | None = None):
+        self._store = store or SQLiteResponseStore()
+        self._ttl = DEFAULT_CACHE_TTL | (ttl or {})
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : {self._store!r}"
+
+    @property
+    def store(self) -> BaseResponseStore:
+        return self._store
+
+    def clear(self):
+        self._store.clear()
+
+    def endpoint_class(self, url: str) -> str:
+        path = url.split("?")[0]
+        for endpoint_class, url_extension in self.ENDPOINT_CLASSES.items():
+            if path.endswith(url_extension):
+                return endpoint_class
+        return "default"
+
+    def ttl_for(self, url: str) -> int:
+        return self._ttl.get(self.endpoint_class(url), 0)
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        payload: dict | None = None,
+        data: str | bytes | None = None,
+        account: str | None = None,
+    ) -> str:
+        if isinstance(data, bytes):
+            data = data.decode()
+        key_items = [
+            account or "",
+            method.upper(),
+            url,
+            json.dumps(params or {}, sort_keys=True, default=str),
+            json.dumps(payload or {}, sort_keys=True, default=str),
+            data or "",
+        ]
+        return hashlib.sha256("\n".join(key_items).encode()).hexdigest()
+
+    def send(
+        self,
+        session: Session,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict | None = None,
+        params: dict | None = None,
+        data: str | bytes | None = None,
+        account: str | None = None,
+    ) -> Response:
+        """
+        Return the cached response for the request when it is fresh. Otherwise send the
+        request (conditionally when the cached response can be revalidated) and cache
+        the response. Responses are cached per ``account`` (e.g. the email address of the
+        credentials), as the data in a response depends on the access level of the account.
+        """
+        ttl = self.ttl_for(url)
+        if not ttl:
+            return session.request(method, url, params=params, json=payload, data=data, headers=headers)
+
+        key = self.key(method, url, params, payload, data, account)
+        cached_response = self._store.get(key)
+        now = time.time()
+        if cached_response and now - cached_response["stored_at"] < ttl:
+            if SHOW_REQ_DETAIL:
+                print(f"Response from cache: {url}")
+            return self._response_from_cache(cached_response, method, url, payload, params, data)
+
+        request_headers = headers | self._revalidation_headers(cached_response)
+        response = session.request(
+            method, url, params=params, json=payload, data=data, headers=request_headers
+        )
+        if response.status_code == 304 and cached_response:
+            if SHOW_REQ_DETAIL:
+                print(f"Response revalidated: {url}")
+            self._store.touch(key, now)
+            return self._response_from_cache(cached_response, method, url, payload, params, data)
+
+        if response.status_code == 200:
+            self._store.set(
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    headers={
+                        header: response.headers[header]
+                        for header in CACHED_HEADERS
+                        if header in response.headers
+                    },
+                    content=response.content,
+                    stored_at=now,
+                ),
+            )
+        return response
+
+    def _revalidation_headers(self, cached_response: CachedResponse | None) -> dict[str, str]:
+        if not cached_response:
+            return {}
+        cached_headers = CaseInsensitiveDict(cached_response["headers"])
+        revalidation_headers = {}
+        if "ETag" in cached_headers:
+            revalidation_headers["If-None-Match"] = cached_headers["ETag"]
+        if "Last-Modified" in cached_headers:
+            revalidation_headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+        return revalidation_headers
+
+    def _response_from_cache(
+        self,
+        cached_response: CachedResponse,
+        method: str,
+        url: str,
+        payload: dict | None,
+        params: dict | None,
+        data: str | bytes | None,
+    ) -> Response:
+        response = Response()
+        response.status_code = cached_response["status_code"]
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(cached_response["headers"])
+        response._content = cached_response["content"]
+        # The original request is needed for pagination (see BaseDataGardenAPI._get_next_page)
+        response.request = Request(method, url, params=params, json=payload, data=data).prepare()
+        response.url = response.request.url or url
+        return response
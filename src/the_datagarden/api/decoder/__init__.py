@@ -0,0 +1,96 @@
+"""
+JSON decoding of API responses.
+
+All response bodies of the API are decoded with ``response_json``. The body of a
+response is decoded only once; the result is kept on the response object, so code
+that needs both the pagination info and the records of a response does not decode
+it twice.
+
+The decoder is chosen with ``THE_DATAGARDEN_JSON_DECODER``:
+    auto (default): orjson or msgspec when installed, the standard library otherwise.
+    orjson, msgspec, json: the named decoder.
+
+Install a fast decoder with ``pip install the-datagarden[fast]``. Any other decoder
+(a callable from bytes to Python objects) can be set with ``set_json_decoder``.
+
+Example:
+    >>> set_json_decoder("json")
+    >>> json_decoder_name()
+    'json'
+"""
+
+import json
+from importlib import import_module
+from typing import Any, Callable
+
+from requests import Response
+
+JSONDecoder = Callable[[bytes], Any]
+
+DECODERS: dict[str, tuple[str, str]] = {
+    "orjson": ("orjson", "loads"),
+    "msgspec": ("msgspec.json", "decode"),
+    "json": ("json", "loads"),
+}
+DECODED_JSON_ATTRIBUTE = "_the_datagarden_json"
+
+
+def _import_decoder(name: str) -> JSONDecoder:
+    if name not in DECODERS:
+        raise ValueError(f"Unknown JSON decoder '{name}', use one of {list(DECODERS)}")
+    module_name, function_name = DECODERS[name]
+    return getattr(import_module(module_name), function_name)
+
+
+def _default_decoder(name: str) -> tuple[str, JSONDecoder]:
+    if name != "auto":
+        return name, _import_decoder(name)
+    for decoder_name in DECODERS:
+        try:
+            return decoder_name, _import_decoder(decoder_name)
+        except ImportError:
+            continue
+    return "json", json.loads
+
+
+# Set on first use, from THE_DATAGARDEN_JSON_DECODER
+_decoder_name: str | None = None
+_decoder: JSONDecoder | None = None
+
+
+def _configured_decoder() -> JSONDecoder:
+    if _decoder is None:
+        from the_datagarden.api.authentication.settings import JSON_DECODER
+
+        set_json_decoder(JSON_DECODER)
+    return _decoder  # type: ignore[return-value]
+
+
+def set_json_decoder(decoder: str | JSONDecoder):
+    """
+    Set the decoder for API responses by name (``orjson``, ``msgspec``, ``json`` or
+    ``auto``) or as a callable decoding bytes.
+    """
+    global _decoder_name, _decoder
+    if isinstance(decoder, str):
+        _decoder_name, _decoder = _default_decoder(decoder)
+    else:
+        _decoder_name, _decoder = getattr(decoder, "__qualname__", repr(decoder)), decoder
+
+
+def json_decoder_name() -> str:
+    _configured_decoder()
+    return _decoder_name  # type: ignore[return-value]
+
+
+def decode_json(content: bytes) -> Any:
+    return _configured_decoder()(content)
+
+
+def response_json(response: Response) -> Any:
+    """
+    Decoded JSON body of a response. The body is decoded on the first call only.
+    """
+    if DECODED_JSON_ATTRIBUTE not in response.__dict__:
+        setattr(response, DECODED_JSON_ATTRIBUTE, decode_json(response.content))
+    return getattr(response, DECODED_JSON_ATTRIBUTE)
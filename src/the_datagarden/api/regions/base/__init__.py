@@ -1,15 +1,18 @@
 from datetime import datetime
 from enum import StrEnum
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel
 
 from the_datagarden.api.authentication.settings import STATISTICS_URL_EXTENSION
 from the_datagarden.api.base import BaseApi
-from the_datagarden.models import TheDataGardenRegionalDataModel, TheDataGardenRegionGeoJSONModel
+from the_datagarden.api.decoder import response_json
 
 from .settings import ResponseKeys
 
+if TYPE_CHECKING:
+    from the_datagarden.models import TheDataGardenRegionalDataModel, TheDataGardenRegionGeoJSONModel
+
 
 class PeriodTypes:
     """Choice class for periodtype used in most data classes"""
@@ -40,8 +43,8 @@ class Region:
     A region in The Data Garden.
     """
 
-    REGION_STATS_MODEL: type[BaseModel]
-    _region_stats: BaseModel | None = None
+    # Name of the statistics model in datagarden_models (imported on first use)
+    REGION_STATS_MODEL_NAME: str
 
     KEYS: type[StrEnum]
 
@@ -52,22 +55,29 @@ class Region:
         self._region_url = url
         self._api = api
         self._available_models: dict = {}
-        self._model_data_storage: dict[str, TheDataGardenRegionalDataModel] = {}
-        self._geojsons = TheDataGardenRegionGeoJSONModel(api=api, region_url=url)
+        self._model_data_storage: dict[str, "TheDataGardenRegionalDataModel"] = {}
+        self._geojsons: "TheDataGardenRegionGeoJSONModel | None" = None
         self._name = name
         self._continent = continent
 
     def __getattr__(self, attr: str):
-        if attr in self.available_model_names:
-            return self._model_data_from_storage(model_name=attr)
         if attr == "geojsons":
+            if self._geojsons is None:
+                from the_datagarden.models import TheDataGardenRegionGeoJSONModel
+
+                self._geojsons = TheDataGardenRegionGeoJSONModel(api=self._api, region_url=self._region_url)
             return self._geojsons
+        if attr in self.available_model_names:
+            return self._model_data_from_storage(model_name=attr)
 
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
 
-    def _model_data_from_storage(self, model_name: str) -> TheDataGardenRegionalDataModel | None:
+    def _model_data_from_storage(self, model_name: str) -> "TheDataGardenRegionalDataModel | None":
         stored_model_data = self._model_data_storage.get(model_name, None)
-        if not stored_model_data:
+        # A model without records is falsy (it has a length), so compare with None
+        if stored_model_data is None:
+            from the_datagarden.models import TheDataGardenRegionalDataModel
+
             self._model_data_storage[model_name] = TheDataGardenRegionalDataModel(
                 model_name=model_name, api=self._api, region_url=self._region_url, meta_data=self.meta_data
             )
@@ -75,22 +85,43 @@ class Region:
 
         return stored_model_data
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def region_url(self) -> str:
+        return self._region_url
+
     @property
     def meta_data(self) -> BaseModel | None:
         """
-        Get the region statistics info from the API.
+        Get the region statistics info from the API. The statistics are retrieved once and
+        kept in the statistics cache of the API object (see ``the_datagarden.api.statistics``).
         """
-        if not self._region_stats:
-            region_stats_resp = self._api.retrieve_from_api(
-                url_extension=self._region_url + STATISTICS_URL_EXTENSION,
-            )
-            if region_stats_resp and region_stats_resp.status_code == 200:
-                region_stats_resp_json = region_stats_resp.json().get(self._key(ResponseKeys.STATISTICS), {})
-                self._region_stats = self.REGION_STATS_MODEL(
-                    region_stats_resp_json if isinstance(region_stats_resp_json, dict) else {}
-                )
+        return self._api.statistics_cache.get(self._region_url, self._meta_data_from_api)
 
-        return self._region_stats
+    @property
+    def meta_data_loaded(self) -> bool:
+        """Whether the region statistics are retrieved, i.e. ``meta_data`` makes no request"""
+        return self._region_url in self._api.statistics_cache
+
+    def _meta_data_from_api(self) -> BaseModel | None:
+        region_stats_resp = self._api.retrieve_from_api(
+            url_extension=self._region_url + STATISTICS_URL_EXTENSION,
+        )
+        if not region_stats_resp or region_stats_resp.status_code != 200:
+            return None
+        region_stats_resp_json = response_json(region_stats_resp).get(self._key(ResponseKeys.STATISTICS), {})
+        return self.region_stats_model()(
+            region_stats_resp_json if isinstance(region_stats_resp_json, dict) else {}
+        )
+
+    @classmethod
+    def region_stats_model(cls) -> type[BaseModel]:
+        import datagarden_models
+
+        return getattr(datagarden_models, cls.REGION_STATS_MODEL_NAME)
 
     @property
     def region_types(self) -> list[str]:
@@ -1,9 +1,7 @@
-from datagarden_models import ContinentStats
-
 from .base import Region
 from .base.settings import ContinentKeys
 
 
 class Continent(Region):
     KEYS = ContinentKeys
-    REGION_STATS_MODEL = ContinentStats
+    REGION_STATS_MODEL_NAME = "ContinentStats"
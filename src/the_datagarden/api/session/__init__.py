@@ -0,0 +1,83 @@
+"""
+HTTP transport for The Data Garden API.
+
+All HTTP calls made by the SDK (API calls, pagination and token requests) go
+through a ``DataGardenSession``. The session keeps a pool of keep-alive
+connections per host, retries failures (429 and 5xx responses) with an
+exponential backoff and applies a default timeout to every request. POST requests
+(token requests and data queries) are only retried when they are throttled (429),
+as the API did not process them; a POST that failed on the server is not replayed.
+
+Classes:
+    DataGardenSession: Pooled ``requests.Session`` with retry and timeout defaults.
+    DataGardenRetry: Retry policy retrying POST requests on throttling only.
+"""
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from the_datagarden.api.authentication.settings import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_SIZE,
+    HTTP_RETRY_STATUS_CODES,
+    HTTP_TIMEOUT,
+)
+
+
+class DataGardenRetry(Retry):
+    """
+    Retry policy of the session. Idempotent requests are retried on the status codes of
+    ``status_forcelist``, POST requests only on ``THROTTLED_STATUS_CODES``.
+    """
+
+    THROTTLED_STATUS_CODES: frozenset[int] = frozenset({429})
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in self.THROTTLED_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class DataGardenSession(Session):
+    """
+    Pooled keep-alive session used for all calls to The Data Garden API.
+
+    Args:
+        pool_size: Maximum number of connections kept alive per host. Should be at
+            least the number of threads that use the session concurrently.
+        max_retries: Number of retries for connection errors and retryable status codes.
+            POST requests are only retried when throttled (429).
+        backoff_factor: Backoff factor between retries (0.5 -> 0.5s, 1s, 2s, ...).
+        timeout: Default (connect, read) timeout in seconds for each request. Can be
+            overridden per request with the ``timeout`` keyword.
+    """
+
+    RETRY_STATUS_CODES: tuple[int, ...] = HTTP_RETRY_STATUS_CODES
+
+    def __init__(
+        self,
+        pool_size: int = HTTP_POOL_SIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        timeout: float | tuple[float, float] | None = HTTP_TIMEOUT,
+    ):
+        super().__init__()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        retry = DataGardenRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method: str, url: str | bytes, *args, **kwargs) -> Response:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().request(method, url, *args, **kwargs)
@@ -0,0 +1,219 @@
+"""
+Region statistics cache for The Data Garden API.
+
+The statistics of a region (``statistics/`` endpoint) tell which data models, sources,
+periods and period types are available for the region. They are needed for every
+regional data model of the region and are retrieved once per API object: all regions
+of the API object share one ``StatisticsCache``. The statistics of a region are
+retrieved by a single thread; other threads asking for the same region wait for the
+result instead of sending the same request.
+
+``AvailabilityIndex`` indexes the statistics of many regions by data model, so a job
+can select the regions with data for a model, region type and period range before
+sending any regional data request.
+
+Classes:
+    StatisticsCache: Region statistics by region URL, with concurrent prefetching.
+    AvailabilityIndex: Availability of data models per region, region type and period.
+    ModelAvailability: Availability of a data model for one region type of a region.
+
+Example:
+    >>> countries = the_datagarden_api.countries(include_details=True).values()
+    >>> the_datagarden_api.statistics_cache.prefetch(countries)
+    >>> the_datagarden_api.netherlands.meta_data  # no request
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from pydantic import BaseModel
+
+from the_datagarden.api.authentication.settings import MAX_CONCURRENT_REQUESTS
+from the_datagarden.models.sync import period_date
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from the_datagarden.api.regions.base import Region
+
+
+class StatisticsCache:
+    """
+    Region statistics by region URL, shared by the regions of an API object.
+
+    Statistics are kept for the lifetime of the cache. Failed retrievals are not cached,
+    so they are retried on the next request for the region.
+    """
+
+    def __init__(self):
+        self._statistics: dict[str, BaseModel] = {}
+        self._region_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : (regions={len(self)})"
+
+    def __contains__(self, region_url: str) -> bool:
+        return region_url in self._statistics
+
+    def __len__(self) -> int:
+        return len(self._statistics)
+
+    def get(self, region_url: str, retrieve: Callable[[], BaseModel | None]) -> BaseModel | None:
+        """
+        Statistics of a region, retrieved with ``retrieve`` when they are not cached yet.
+        """
+        statistics = self._statistics.get(region_url)
+        if statistics is not None:
+            return statistics
+        with self._region_lock(region_url):
+            statistics = self._statistics.get(region_url)
+            if statistics is None:
+                statistics = retrieve()
+                if statistics is not None:
+                    self._statistics[region_url] = statistics
+        return statistics
+
+    def set(self, region_url: str, statistics: BaseModel):
+        self._statistics[region_url] = statistics
+
+    def clear(self):
+        self._statistics.clear()
+
+    def prefetch(self, regions: Iterable["Region"], max_workers: int = MAX_CONCURRENT_REQUESTS):
+        """
+        Retrieve the statistics of several regions concurrently. Regions with cached
+        statistics are skipped.
+        """
+        regions_to_fetch = [region for region in regions if region.region_url not in self]
+        if not regions_to_fetch:
+            return
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(regions_to_fetch))),
+            thread_name_prefix="the-datagarden-statistics",
+        ) as executor:
+            list(executor.map(lambda region: region.meta_data, regions_to_fetch))
+
+    def _region_lock(self, region_url: str) -> threading.Lock:
+        with self._lock:
+            return self._region_locks.setdefault(region_url, threading.Lock())
+
+
+class ModelAvailability(BaseModel):
+    """Availability of a data model for the regions of one region type of a region"""
+
+    region_name: str
+    region_url: str
+    model_name: str
+    region_type: str
+    region_level: int
+    count: int
+    sources: list[str]
+    period_types: list[str]
+    from_period: str
+    to_period: str
+
+    def matches(
+        self,
+        region_type: str | None = None,
+        region_level: int | None = None,
+        period_type: str | None = None,
+        period_from: str | date | None = None,
+        period_to: str | date | None = None,
+        source: str | None = None,
+    ) -> bool:
+        """Whether the model has data for the region type, period type, period range and source"""
+        if region_type is not None and region_type != self.region_type:
+            return False
+        if region_level is not None and region_level != self.region_level:
+            return False
+        if period_type is not None and period_type not in self.period_types:
+            return False
+        if source is not None and source not in self.sources:
+            return False
+        if period_from is not None and period_date(self.to_period) < period_date(period_from):
+            return False
+        if period_to is not None and period_date(self.from_period) > period_date(period_to):
+            return False
+        return True
+
+
+class AvailabilityIndex:
+    """
+    Availability of data models per region, region type and period range, from the
+    statistics of a set of regions. Regions without statistics are left out.
+
+    Example:
+        >>> index = the_datagarden_api.prefetch_statistics()
+        >>> index.regions("demographics", region_type="province", period_from="2020-01-01")
+        [Country : Netherlands, Country : Germany, ...]
+    """
+
+    def __init__(self, regions: Iterable["Region"]):
+        from datagarden_models import CountryStats
+
+        self._regions: dict[str, "Region"] = {}
+        self._availability: dict[str, list[ModelAvailability]] = {}
+        # Availability per data model and region URL, for has_data
+        self._region_availability: dict[tuple[str, str], list[ModelAvailability]] = {}
+        for region in regions:
+            statistics = region.meta_data
+            if not isinstance(statistics, CountryStats):
+                continue
+            self._regions[region.region_url] = region
+            for region_data in statistics.root.values():
+                for model_name, stats in region_data.regional_data_stats.items():
+                    availability = ModelAvailability(
+                        region_name=region.name,
+                        region_url=region.region_url,
+                        model_name=model_name.lower(),
+                        region_type=region_data.region_type,
+                        region_level=region_data.region_level,
+                        count=stats.count,
+                        sources=stats.source_names,
+                        period_types=stats.period_type,
+                        from_period=stats.from_period,
+                        to_period=stats.to_period,
+                    )
+                    self._availability.setdefault(availability.model_name, []).append(availability)
+                    self._region_availability.setdefault(
+                        (availability.model_name, region.region_url), []
+                    ).append(availability)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : (regions={len(self._regions)}, models={len(self._availability)})"
+
+    def __len__(self) -> int:
+        return sum(len(availability) for availability in self._availability.values())
+
+    @property
+    def model_names(self) -> list[str]:
+        return list(self._availability)
+
+    def availability(self, model_name: str | None = None, **filters) -> list[ModelAvailability]:
+        """
+        Availability of a data model (all models when not set) matching the filters of
+        ``ModelAvailability.matches``, e.g. ``region_type="province", period_from="2020-01-01"``.
+        """
+        if model_name is None:
+            candidates = [item for availability in self._availability.values() for item in availability]
+        else:
+            candidates = self._availability.get(model_name.lower(), [])
+        return [item for item in candidates if item.matches(**filters)]
+
+    def regions(self, model_name: str, **filters) -> list["Region"]:
+        """Regions with data for a data model matching the filters"""
+        region_urls = dict.fromkeys(item.region_url for item in self.availability(model_name, **filters))
+        return [self._regions[region_url] for region_url in region_urls]
+
+    def has_data(self, region: "Region", model_name: str, **filters) -> bool:
+        """Whether a region has data for a data model matching the filters"""
+        availability = self._region_availability.get((model_name.lower(), region.region_url), [])
+        return any(item.matches(**filters) for item in availability)
+
+    def to_polars(self) -> "pl.DataFrame":
+        import polars as pl
+
+        return pl.DataFrame([item.model_dump() for item in self.availability()])
@@ -1,9 +1,37 @@
-from .geojson import RegionGeoJSONDataRecord, TheDataGardenRegionGeoJSONModel
-from .regional_data import RegionalDataRecord, TheDataGardenRegionalDataModel
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aio import AsyncTheDataGardenRegionalDataModel, AsyncTheDataGardenRegionGeoJSONModel
+    from .collection import TheDataGardenRegionalDataCollection
+    from .geojson import RegionGeoJSONDataRecord, TheDataGardenRegionGeoJSONModel
+    from .regional_data import RegionalDataRecord, TheDataGardenRegionalDataModel
+
+# The models depend on datagarden_models and are imported on first use
+_LAZY_IMPORTS = {
+    "RegionalDataRecord": ".regional_data",
+    "TheDataGardenRegionalDataModel": ".regional_data",
+    "TheDataGardenRegionalDataCollection": ".collection",
+    "RegionGeoJSONDataRecord": ".geojson",
+    "TheDataGardenRegionGeoJSONModel": ".geojson",
+    "AsyncTheDataGardenRegionalDataModel": ".aio",
+    "AsyncTheDataGardenRegionGeoJSONModel": ".aio",
+}
 
 __all__ = [
     "RegionalDataRecord",
     "TheDataGardenRegionalDataModel",
+    "TheDataGardenRegionalDataCollection",
     "RegionGeoJSONDataRecord",
     "TheDataGardenRegionGeoJSONModel",
+    "AsyncTheDataGardenRegionalDataModel",
+    "AsyncTheDataGardenRegionGeoJSONModel",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
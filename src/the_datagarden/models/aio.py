@@ -0,0 +1,144 @@
+"""
+Asyncio variants of the regional data and geojson models.
+
+The async models wrap a regular model and share its records. Awaiting a call runs
+the blocking call of the regular model in a worker thread (``asyncio.to_thread``), so
+the pooled HTTP session, the pagination logic and the AccessToken refresh logic are
+re-used without blocking the event loop; the HTTP I/O itself is not asynchronous. A
+shared semaphore limits the number of calls that run at the same time, and a lock per
+regular model makes concurrent calls on the same model run one after the other.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from .geojson import TheDataGardenRegionGeoJSONModel
+    from .regional_data import RegionalDataRecord, TheDataGardenRegionalDataModel
+
+# Locks of the regular models, shared by all async wrappers of a model
+_model_locks: "weakref.WeakKeyDictionary[object, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _model_lock(model: object) -> asyncio.Lock:
+    """Lock that serializes the calls on a regular model from the event loop"""
+    if model not in _model_locks:
+        _model_locks[model] = asyncio.Lock()
+    return _model_locks[model]
+
+
+class AsyncTheDataGardenRegionalDataModel:
+    """
+    Awaitable variant of ``TheDataGardenRegionalDataModel``.
+
+    Awaiting a call retrieves the records from the API in a worker thread; concurrent
+    calls on the same model wait for each other. All other attributes
+    (``to_polars``, ``full_model_to_polars``, ``data_records``, ...) are taken from the
+    wrapped model.
+
+        >>> demographics = await nl.model("demographics")
+        >>> await demographics(period_from="2010-01-01")
+        >>> demographics.full_model_to_polars()
+    """
+
+    def __init__(self, model: "TheDataGardenRegionalDataModel", limiter: asyncio.Semaphore):
+        self._model = model
+        self._limiter = limiter
+
+    def __str__(self):
+        return f"Async{self._model}"
+
+    def __repr__(self):
+        return self.__str__()
+
+    async def __call__(self, **kwargs) -> "AsyncTheDataGardenRegionalDataModel":
+        async with _model_lock(self._model), self._limiter:
+            await asyncio.to_thread(self._model, **kwargs)
+        return self
+
+    def __getattr__(self, attribute: str):
+        if attribute.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+        return getattr(self._model, attribute)
+
+    def __iter__(self):
+        return iter(self._model)
+
+    def __len__(self):
+        return len(self._model)
+
+    @property
+    def model(self) -> "TheDataGardenRegionalDataModel":
+        return self._model
+
+    @property
+    def data_records(self) -> list["RegionalDataRecord"]:
+        return self._model.data_records
+
+
+class AsyncTheDataGardenRegionGeoJSONModel:
+    """
+    Awaitable variant of ``TheDataGardenRegionGeoJSONModel``.
+
+    Awaiting a call retrieves the geojsons from the API in a worker thread; concurrent
+    calls on the same model wait for each other. When the region of the model still has
+    to be looked up, pass ``lookup_model`` instead of the model. It is called in a worker
+    thread on the first call.
+
+        >>> geojsons = await nl.geojsons(region_level=2)
+        >>> geojsons.to_polars()
+    """
+
+    def __init__(
+        self,
+        model: "TheDataGardenRegionGeoJSONModel | None",
+        limiter: asyncio.Semaphore,
+        lookup_model: "Callable[[], TheDataGardenRegionGeoJSONModel] | None" = None,
+    ):
+        if model is None and lookup_model is None:
+            raise ValueError("Either model or lookup_model is required")
+        self._model = model
+        self._lookup_model = lookup_model
+        self._lookup_lock = threading.Lock()
+        self._limiter = limiter
+
+    def __str__(self):
+        if self._model is None:
+            return f"{self.__class__.__name__} : (not looked up)"
+        return f"Async{self._model}"
+
+    def __repr__(self):
+        return self.__str__()
+
+    async def __call__(
+        self, region_level: int = 0, levels: Iterable[int] | None = None
+    ) -> "AsyncTheDataGardenRegionGeoJSONModel":
+        if self._model is None:
+            async with self._limiter:
+                await asyncio.to_thread(lambda: self.model)
+        async with _model_lock(self.model), self._limiter:
+            await asyncio.to_thread(self.model, region_level=region_level, levels=levels)
+        return self
+
+    def __getattr__(self, attribute: str):
+        if attribute.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+        return getattr(self.model, attribute)
+
+    def __iter__(self):
+        return iter(self.model)
+
+    def __len__(self):
+        return len(self.model)
+
+    @property
+    def model(self) -> "TheDataGardenRegionGeoJSONModel":
+        if self._model is None:
+            with self._lookup_lock:
+                if self._model is None and self._lookup_model is not None:
+                    self._model = self._lookup_model()
+        if self._model is None:
+            raise ValueError("GeoJSON model not found")
+        return self._model
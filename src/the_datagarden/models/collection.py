@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING, Iterator
+
+from .regional_data import RegionalDataRecord, TheDataGardenRegionalDataModel
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+
+class TheDataGardenRegionalDataCollection:
+    """
+    Collection of regional data models for the same data model over multiple regions.
+
+    Returned per data model by ``TheDataGardenAPI.bulk_fetch``. The records of all regions
+    can be converted to a single dataframe with the same methods as a regional data model:
+    - to_polars(model_convertors: dict | None = None) -> pl.DataFrame
+    - full_model_to_polars() -> pl.DataFrame
+    - to_pandas(model_convertors: dict | None = None) -> pd.DataFrame
+    - full_model_to_pandas() -> pd.DataFrame
+    """
+
+    def __init__(self, model_name: str, models: list[TheDataGardenRegionalDataModel] | None = None):
+        self._model_name: str = model_name
+        self._models: list[TheDataGardenRegionalDataModel] = models or []
+
+    def __str__(self):
+        return (
+            f"TheDataGardenRegionalDataCollection : {self._model_name} : "
+            f"(regions={len(self._models)}, count={len(self)})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+    def append(self, model: TheDataGardenRegionalDataModel):
+        self._models.append(model)
+
+    @property
+    def models(self) -> list[TheDataGardenRegionalDataModel]:
+        return self._models
+
+    def to_polars(self, model_convertors: dict | None = None) -> "pl.DataFrame":
+        """
+        Convert the data of all regions to one polars dataframe using a dictionary of model
+        attributes to convert to columns
+        """
+        return self._concat([model.to_polars(model_convertors) for model in self._models if len(model)])
+
+    def full_model_to_polars(self) -> "pl.DataFrame":
+        """
+        Convert the data of all regions to one polars dataframe, flattening all nested dictionaries
+        """
+        return self._concat([model.full_model_to_polars() for model in self._models if len(model)])
+
+    def to_pandas(self, model_convertors: dict | None = None) -> "pd.DataFrame":
+        return self.to_polars(model_convertors).to_pandas()
+
+    def full_model_to_pandas(self) -> "pd.DataFrame":
+        return self.full_model_to_polars().to_pandas()
+
+    def _concat(self, dataframes: list["pl.DataFrame"]) -> "pl.DataFrame":
+        import polars as pl
+
+        if not dataframes:
+            return pl.DataFrame()
+        # Regions can hold different (sub)sets of model attributes
+        return pl.concat(dataframes, how="diagonal_relaxed")
+
+    def __iter__(self) -> Iterator[RegionalDataRecord]:
+        """Makes the class iterable over the records of all regions"""
+        for model in self._models:
+            yield from model
+
+    def __len__(self):
+        """Returns the number of records over all regions"""
+        return sum(len(model) for model in self._models)
+
+    @property
+    def data_records(self) -> list[RegionalDataRecord]:
+        return list(self)
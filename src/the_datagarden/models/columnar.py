@@ -0,0 +1,199 @@
+"""
+Columnar storage for the records of a regional data model.
+
+By default a regional data model keeps one pydantic ``RegionalDataRecord`` per record.
+With a ``ColumnarRecordStore`` the records are converted once, at ingest, to flat polars
+columns (the columns of ``full_model_to_polars()``). Dataframe exports are then views on
+the stored columns and pydantic records are only created when they are accessed.
+
+Enable the store per API object with ``TheDataGardenAPI(columnar=True)``.
+"""
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from datagarden_models import DatagardenModels, DataGardenSubModel
+
+from .conversion import (
+    SEPARATOR,
+    record_fields,
+    records_to_full_model_polars,
+    regional_data_to_full_model_polars,
+    select_model_attributes,
+)
+from .keys import record_keys
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from the_datagarden.abc.api import IngestMode
+
+    from .regional_data import RegionalDataRecord
+
+RECORD_HASH_COLUMN = "record_hash"
+
+
+def unflatten_dict(flattened_dict: dict) -> dict:
+    """Rebuild nested dictionaries from flattened keys. Empty (None) values are skipped."""
+    nested_dict: dict = {}
+    for key, value in flattened_dict.items():
+        if value is None:
+            continue
+        *parents, attribute = key.split(SEPARATOR)
+        target = nested_dict
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[attribute] = value
+    return nested_dict
+
+
+class ColumnarRecordStore(Mapping[str, "RegionalDataRecord"]):
+    """
+    Mapping of record hash to record backed by a polars dataframe.
+
+    The dataframe holds the record fields, the flattened model fields and a
+    ``record_hash`` column. Records added with a hash that is already stored replace
+    the stored record, as in the default (dictionary) store.
+
+    Args:
+        model: Model class used to create the pydantic records on access. When not set
+            the model is derived from the ``data_model_name`` of the record.
+    """
+
+    def __init__(self, model: type[DataGardenSubModel] | None = None):
+        self._model = model
+        self._frame: "pl.DataFrame | None" = None
+        self._index: dict[str, int] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : (count={len(self)})"
+
+    @classmethod
+    def from_frame(
+        cls, frame: "pl.DataFrame", model: type[DataGardenSubModel] | None = None
+    ) -> "ColumnarRecordStore":
+        """Store of a flattened dataframe (with a ``record_hash`` column) with unique records"""
+        store = cls(model=model)
+        if not frame.is_empty():
+            store._frame = frame
+            store._index = cls._index_rows(frame.get_column(RECORD_HASH_COLUMN))
+        return store
+
+    @property
+    def frame(self) -> "pl.DataFrame":
+        """All stored records, including the ``record_hash`` column"""
+        import polars as pl
+
+        if self._frame is None:
+            return pl.DataFrame()
+        return self._frame
+
+    def full_model_to_polars(self) -> "pl.DataFrame":
+        """Stored records with the columns of ``full_model_to_polars()``"""
+        if self._frame is None:
+            return self.frame
+        return self._frame.drop(RECORD_HASH_COLUMN)
+
+    def to_polars(self, model_convertors: dict | None = None) -> "pl.DataFrame":
+        """Stored records with the columns of ``to_polars(model_convertors)``"""
+        return select_model_attributes(self.full_model_to_polars(), model_convertors)
+
+    def add_records(self, records: Iterable["RegionalDataRecord"]):
+        import polars as pl
+
+        records = list(records)
+        if not records:
+            return
+        frame = records_to_full_model_polars(records)
+        frame.insert_column(0, pl.Series(RECORD_HASH_COLUMN, [record.record_hash() for record in records]))
+        self.add_frame(frame)
+
+    def add_regional_data(self, data: dict, ingest_mode: "IngestMode" = "fast"):
+        """
+        Add the records of a decoded regional data response, without keeping records
+        (see ``regional_data_to_full_model_polars``)
+        """
+        import polars as pl
+
+        from .regional_data import UNIQUE_FIELDS
+
+        frame = regional_data_to_full_model_polars(data, ingest_mode)
+        if frame.is_empty():
+            return
+        record_hashes = record_keys(frame.select(sorted(UNIQUE_FIELDS)).iter_rows())
+        frame.insert_column(0, pl.Series(RECORD_HASH_COLUMN, record_hashes, dtype=pl.String))
+        self.add_frame(frame)
+
+    def add_frame(self, frame: "pl.DataFrame"):
+        """
+        Add a flattened dataframe (with a ``record_hash`` column) to the store. New records
+        are appended and only their rows are added to the index; the index is rebuilt only
+        when stored records are replaced.
+        """
+        import polars as pl
+
+        frame = frame.unique(subset=RECORD_HASH_COLUMN, keep="last", maintain_order=True)
+        if self._frame is None:
+            self._frame = frame
+            self._index = self._index_rows(frame.get_column(RECORD_HASH_COLUMN))
+            return
+
+        replaced = frame.get_column(RECORD_HASH_COLUMN).is_in(list(self._index))
+        stored_frame = self._frame
+        if replaced.any():
+            replaced_hashes = frame.filter(replaced).get_column(RECORD_HASH_COLUMN)
+            stored_frame = stored_frame.filter(~pl.col(RECORD_HASH_COLUMN).is_in(replaced_hashes.implode()))
+            self._index = self._index_rows(stored_frame.get_column(RECORD_HASH_COLUMN))
+        # Pages can hold different (sub)sets of model attributes
+        self._frame = pl.concat([stored_frame, frame], how="diagonal_relaxed", rechunk=False)
+        self._index.update(self._index_rows(frame.get_column(RECORD_HASH_COLUMN), start=len(stored_frame)))
+
+    @staticmethod
+    def _index_rows(record_hashes: "pl.Series", start: int = 0) -> dict[str, int]:
+        return {record_hash: row_number for row_number, record_hash in enumerate(record_hashes, start)}
+
+    def update(self, records: Mapping[str, "RegionalDataRecord"]):
+        self.add_records(records.values())
+
+    def sub_model_store(
+        self, sub_model_name: str, sub_model: type[DataGardenSubModel]
+    ) -> "ColumnarRecordStore":
+        """
+        Store for a sub model, selecting the columns of the sub model from this store.
+        """
+        import polars as pl
+
+        store = ColumnarRecordStore(model=sub_model)
+        if self._frame is None:
+            return store
+        prefix = sub_model_name + SEPARATOR
+        store._frame = self._frame.select(
+            pl.col(RECORD_HASH_COLUMN),
+            *[
+                pl.lit(sub_model_name).alias(field) if field == "data_model_name" else pl.col(field)
+                for field in record_fields()
+            ],
+            *[
+                pl.col(column).alias(column.removeprefix(prefix))
+                for column in self._frame.columns
+                if column.startswith(prefix)
+            ],
+        )
+        # Rows are in the same order; the index of this store is extended when records are added
+        store._index = self._index.copy()
+        return store
+
+    def __getitem__(self, record_hash: str) -> "RegionalDataRecord":
+        from .regional_data import RegionalDataRecord
+
+        row = self.frame.row(self._index[record_hash], named=True)
+        row.pop(RECORD_HASH_COLUMN)
+        record_items = {field: row.pop(field) for field in record_fields()}
+        model = self._model or getattr(DatagardenModels, record_items["data_model_name"].upper())
+        return RegionalDataRecord(**record_items, model=model(**unflatten_dict(row)))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
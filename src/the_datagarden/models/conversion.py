@@ -0,0 +1,442 @@
+"""
+Conversion of regional data records to polars dataframes.
+
+Model data is serialized to JSON and loaded into polars as nested struct columns in one
+call. The struct columns are flattened with struct field expressions, instead of
+flattening the model data record by record in Python. The flattened columns of a data
+model (names and, where possible, types) are derived once per model class; columns
+without data in any of the records are still part of the dataframe.
+
+Decoded responses of the regional data endpoint are converted without creating records:
+the values of the data objects are collected per attribute in one pass and the columns
+get the types and defaults of the model (see ``regional_data_to_full_model_polars``).
+
+Functions:
+    flatten_dict: Flatten nested dictionaries to dotted keys.
+    model_schema: Flattened columns and polars types of a data model.
+    models_to_polars: Flattened model fields of data models.
+    regional_data_to_full_model_polars: Record fields and flattened model fields of a response.
+    records_to_full_model_polars: Record fields and all flattened model fields.
+    select_model_attributes: Record fields and model fields selected by model convertors.
+    records_to_polars: Record fields and model fields selected by model convertors.
+"""
+
+import io
+from functools import cache
+from types import NoneType, UnionType
+from typing import TYPE_CHECKING, Any, Iterable, Union, get_args, get_origin
+
+from datagarden_models import DataGardenSubModel
+from datagarden_models.models.base.legend import Legend
+from pydantic import BaseModel, RootModel, ValidationError
+from pydantic_core import to_json
+
+from .ingest import _construction_plan
+
+if TYPE_CHECKING:
+    import polars as pl
+    from polars.datatypes import DataTypeClass
+
+    from the_datagarden.abc.api import IngestMode
+
+    from .regional_data import RegionalDataRecord
+
+SEPARATOR = "."
+MODEL_COLUMN = "model"
+
+
+def _polars_type(attribute_type: Any) -> "pl.DataType | None":
+    import polars as pl
+
+    if get_origin(attribute_type) in (Union, UnionType):
+        attribute_types = [arg for arg in get_args(attribute_type) if arg is not NoneType]
+        if len(attribute_types) != 1:
+            return None
+        attribute_type = attribute_types[0]
+    return {int: pl.Int64(), float: pl.Float64(), str: pl.String(), bool: pl.Boolean()}.get(attribute_type)
+
+
+def flatten_dict(dict_to_flatten: dict, prefix: str = "") -> dict:
+    flattened_dict = {}
+    for key, value in dict_to_flatten.items():
+        new_key = f"{prefix}{SEPARATOR}{key}" if prefix else key
+        if isinstance(value, dict):
+            flattened_dict.update(flatten_dict(value, new_key))
+        else:
+            flattened_dict[new_key] = value
+    return flattened_dict
+
+
+def _legend_types(legend: Legend, prefix: str = "") -> dict[str, Any]:
+    attribute_types = {}
+    for attribute, field_legend in legend.field_legends.items():
+        column = f"{prefix}{SEPARATOR}{attribute}" if prefix else attribute
+        if field_legend.field_legends:
+            attribute_types.update(_legend_types(field_legend, column))
+        else:
+            attribute_types[column] = field_legend.type
+    return attribute_types
+
+
+@cache
+def model_schema(model: type[DataGardenSubModel]) -> dict[str, "pl.DataType | None"]:
+    """
+    Flattened columns of a data model (as in a model without data) with their polars
+    type from the model legends. The type is None when it is inferred from the data.
+    """
+    attribute_types = _legend_types(model.legends())
+    try:
+        columns = list(flatten_dict(model().model_dump()))
+    except ValidationError:
+        columns = list(attribute_types)
+    return {column: _polars_type(attribute_types.get(column)) for column in columns}
+
+
+@cache
+def sub_models(model: type[DataGardenSubModel]) -> dict[str, type[DataGardenSubModel]]:
+    """Sub models of a data model by attribute name, from the model legends"""
+    legends = model.legends()
+    return {name: getattr(legends, name).model for name in legends.sub_model_names}
+
+
+def _flattened_columns(dtype: "pl.DataType | DataTypeClass", expr: "pl.Expr", prefix: str) -> list["pl.Expr"]:
+    import polars as pl
+
+    if not isinstance(dtype, pl.Struct):
+        return [expr.alias(prefix)]
+    columns: list[pl.Expr] = []
+    for field in dtype.fields:
+        if not field.name:
+            # Placeholder field of an empty struct (empty dictionary)
+            continue
+        column = f"{prefix}{SEPARATOR}{field.name}" if prefix else field.name
+        columns.extend(_flattened_columns(field.dtype, expr.struct.field(field.name), column))
+    return columns
+
+
+def _ordered_columns(columns: list[str], column_order: list[str]) -> list[str]:
+    """
+    Order columns as in ``column_order``. Columns that are not in ``column_order`` (e.g. keys
+    of dictionaries) are placed after their closest parent.
+    """
+    positions: dict[str, int] = {}
+    for column in column_order:
+        positions.setdefault(column, len(positions))
+
+    def position(column: str) -> int:
+        attributes = column.split(SEPARATOR)
+        for length in range(len(attributes), 0, -1):
+            parent = SEPARATOR.join(attributes[:length])
+            if parent in positions:
+                return positions[parent]
+        return len(positions)
+
+    return sorted(columns, key=position)
+
+
+def models_to_polars(models: list[DataGardenSubModel], include: dict | None = None) -> "pl.DataFrame":
+    """
+    Convert data models to a polars dataframe with the flattened model fields.
+
+    The models are serialized to JSON and loaded by polars in one call; nested models and
+    dictionaries are flattened with struct field expressions. Columns are ordered as the
+    fields of the first model. Columns of the model schema that are empty for all models
+    get the type from the schema.
+
+    Pass ``include`` (as for pydantic's ``model_dump``) to convert a subset of the fields.
+    """
+    import polars as pl
+
+    if not models:
+        return pl.DataFrame()
+    models_json = b"[" + b",".join(to_json(model, include=include) for model in models) + b"]"
+    frame = pl.read_json(io.BytesIO(models_json), infer_schema_length=None)
+    schema = {} if include else model_schema(models[0].__class__)
+    model_columns = {
+        column.meta.output_name(): column
+        for name, dtype in frame.schema.items()
+        for column in _flattened_columns(dtype, pl.col(name), name)
+    }
+    first_model_columns = flatten_dict(models[0].model_dump(include=include))
+    return _select_model_columns(frame, model_columns, schema, [*first_model_columns, *schema])
+
+
+def _select_model_columns(
+    frame: "pl.DataFrame", model_columns: dict[str, "pl.Expr"], schema: dict, column_order: list[str]
+) -> "pl.DataFrame":
+    """
+    Select the model columns in ``column_order`` and add the columns of the model schema
+    without data. Columns without data in any of the rows get the type from the schema.
+    """
+    import polars as pl
+
+    model_columns = model_columns.copy()
+    for column, dtype in schema.items():
+        if column in model_columns or any(name.startswith(column + SEPARATOR) for name in model_columns):
+            continue
+        model_columns[column] = pl.lit(None, dtype=dtype or pl.Null()).alias(column)
+    frame = frame.select(
+        model_columns[column] for column in _ordered_columns(list(model_columns), column_order)
+    )
+    return frame.with_columns(
+        pl.col(column).cast(dtype)
+        for column, dtype in schema.items()
+        if dtype is not None and frame.schema.get(column) == pl.Null
+    )
+
+
+def _column_tree(objects: list[dict]) -> dict:
+    """
+    Values of the nested dictionaries ``objects`` per attribute, as a tree of dictionaries
+    with a column (list of values, None when missing) per leaf attribute.
+    """
+    row_count = len(objects)
+    tree: dict = {}
+
+    def add_values(values: dict, node: dict, row: int):
+        for attribute, value in values.items():
+            if value is None:
+                continue
+            child = node.get(attribute)
+            if type(value) is dict:
+                if type(child) is not dict:
+                    child = node[attribute] = {}
+                add_values(value, child, row)
+            else:
+                if type(child) is not list:
+                    child = node[attribute] = [None] * row_count
+                child[row] = value
+
+    for row, values in enumerate(objects):
+        add_values(values, tree, row)
+    return tree
+
+
+def _flattened_tree(tree: dict, prefix: str) -> dict[str, list]:
+    columns = {}
+    for attribute, child in tree.items():
+        column = f"{prefix}{SEPARATOR}{attribute}"
+        if type(child) is dict:
+            columns.update(_flattened_tree(child, column))
+        else:
+            columns[column] = child
+    return columns
+
+
+@cache
+def _model_fields(
+    model: type[BaseModel],
+) -> list[tuple[str, list[str], type[BaseModel] | None, type[list | dict] | None, Any]]:
+    """
+    Name, keys in the model data (name and aliases), nested model class, container of the
+    nested models and default (dumped for models) per field of the model
+    """
+    plan = _construction_plan(model)
+    fields = []
+    for field_name, field_info in model.model_fields.items():
+        keys = [key for key, (name, *_) in plan.items() if name == field_name]
+        _, nested_model, container = plan[field_name]
+        if not isinstance(nested_model, type) or not issubclass(nested_model, BaseModel):
+            nested_model = None
+        elif issubclass(nested_model, RootModel):
+            nested_model = None
+        default = field_info.get_default(call_default_factory=True)
+        if isinstance(default, BaseModel):
+            default = default.model_dump()
+        fields.append((field_name, keys, nested_model, container, default))
+    return fields
+
+
+def _model_tree_columns(
+    tree: dict, model: type[BaseModel], row_count: int, prefix: str = ""
+) -> dict[str, list]:
+    """
+    Flattened columns of a column tree (see ``_column_tree``) as they are dumped by the
+    models constructed from the data: attributes that are not fields of a model are left
+    out, fields of nested models get their defaults where the data has no value.
+    """
+    columns = {}
+    for field_name, keys, nested_model, container, default in _model_fields(model):
+        column = f"{prefix}{SEPARATOR}{field_name}" if prefix else field_name
+        node = next((tree[key] for key in keys if key in tree), None)
+        if type(node) is dict and nested_model and container is None:
+            columns.update(_model_tree_columns(node, nested_model, row_count, column))
+        elif type(node) is dict and nested_model and container is dict:
+            for key, child in node.items():
+                if type(child) is dict:
+                    columns.update(
+                        _model_tree_columns(child, nested_model, row_count, f"{column}{SEPARATOR}{key}")
+                    )
+                else:
+                    columns[f"{column}{SEPARATOR}{key}"] = child
+        elif type(node) is dict:
+            columns.update(_flattened_tree(node, column))
+        elif node is not None:
+            if default is not None and not isinstance(default, dict):
+                node = [default if value is None else value for value in node]
+            columns[column] = node
+        elif isinstance(default, dict):
+            columns.update(
+                {name: [value] * row_count for name, value in flatten_dict(default, column).items()}
+            )
+        else:
+            columns[column] = [default] * row_count
+    return columns
+
+
+def regional_data_to_full_model_polars(data: dict, ingest_mode: "IngestMode" = "fast") -> "pl.DataFrame":
+    """
+    Convert a decoded response of the regional data endpoint to a polars dataframe with
+    the columns of ``records_to_full_model_polars`` for the records created in the
+    ``ingest_mode``, without keeping (pydantic) records.
+
+    In the ``"strict"`` ingest mode the records are validated as when they are created
+    from the response, and the columns with a type in the model schema are cast to that
+    type; the columns are still built from the response data, so values that validators
+    of a model rewrite are converted as sent. In the ``"fast"`` mode the model data is
+    not validated.
+    """
+    import polars as pl
+    from datagarden_models import DatagardenModels
+
+    from .regional_data import RegionalDataRecord
+
+    record_columns: dict[str, list] = {field: [] for field in record_fields()}
+    data_objects = []
+    for regional_data in data["data_by_region"]:
+        region_items = region_fields(regional_data)
+        for data_object in regional_data["data_objects_for_region"]:
+            record_items = region_items | data_object_fields(data_object)
+            if ingest_mode == "strict":
+                # Validate the record as when it is created from the response
+                if not record_items["data_model_name"]:
+                    raise ValueError("data_model_name is required")
+                model = getattr(DatagardenModels, record_items["data_model_name"].upper())
+                RegionalDataRecord(**record_items, model=model(**data_object.get("data", {})))
+            for field, value in record_items.items():
+                record_columns[field].append(value)
+            data_objects.append(data_object.get("data") or {})
+    if not data_objects:
+        return pl.DataFrame()
+    if not all(record_columns["data_model_name"]):
+        raise ValueError("data_model_name is required")
+
+    model = getattr(DatagardenModels, record_columns["data_model_name"][0].upper())
+    columns = _model_tree_columns(_column_tree(data_objects), model, len(data_objects))
+    frame = pl.DataFrame(columns, strict=False)
+    model_columns = {column: pl.col(column) for column in columns}
+    schema = model_schema(model)
+    model_frame = _select_model_columns(frame, model_columns, schema, list(columns))
+    if ingest_mode == "strict":
+        model_frame = model_frame.with_columns(
+            pl.col(column).cast(dtype)
+            for column, dtype in schema.items()
+            if dtype is not None and column in model_frame.columns
+        )
+    record_frame = pl.DataFrame(record_columns, strict=False)
+    return pl.concat([record_frame, model_frame], how="horizontal")
+
+
+def region_fields(regional_data: dict) -> dict:
+    """Record fields of a region of a regional data response"""
+    return {
+        "name": regional_data.get("region_name", None),
+        "region_type": regional_data.get("region_type", None),
+        "un_region_code": regional_data.get("un_region_code", None),
+        "iso_cc_2": regional_data.get("iso_cc_2", None),
+        "local_region_code": regional_data.get("local_region_code", None),
+        "local_region_code_type": regional_data.get("local_region_code_type", None),
+        "parent_region_code": regional_data.get("parent_region_code", None),
+        "parent_region_code_type": regional_data.get("parent_region_code_type", None),
+        "parent_region_type": regional_data.get("parent_region_type", None),
+        "region_level": regional_data.get("region_level", 0),
+    }
+
+
+def data_object_fields(data_object: dict) -> dict:
+    """Record fields of a data object of a regional data response"""
+    return {
+        "source_name": data_object.get("source_name", None),
+        "period": data_object.get("period", None),
+        "period_type": data_object.get("period_type", None),
+        "data_model_name": data_object.get("data_type", None),
+    }
+
+
+def records_to_full_model_polars(
+    records: Iterable["RegionalDataRecord"], include: dict | None = None
+) -> "pl.DataFrame":
+    """
+    Convert records to a polars dataframe with the record fields and all (flattened)
+    fields of the model, or the fields in ``include``.
+    """
+    import polars as pl
+
+    records = list(records)
+    if not records:
+        return pl.DataFrame()
+    record_frame = pl.from_dicts(
+        [record.model_dump(exclude={"model"}) for record in records], infer_schema_length=None
+    )
+    model_frame = models_to_polars([record.model for record in records], include)
+    return pl.concat([record_frame, model_frame], how="horizontal")
+
+
+def select_model_attributes(frame: "pl.DataFrame", model_convertors: dict | None = None) -> "pl.DataFrame":
+    """
+    Select the record fields and a column per model convertor from a dataframe created
+    by ``records_to_full_model_polars``. A model convertor maps a column name to a (dotted)
+    model attribute; model attributes ending with ``__flatten`` are added as flattened
+    columns (named relative to the attribute) instead. Model attributes without data in
+    any of the records are left out.
+    """
+    import polars as pl
+
+    if frame.is_empty():
+        return frame
+    columns: list[pl.Expr] = []
+    for new_col, model_attr in (model_convertors or {}).items():
+        model_attr_flatten = "__flatten" in model_attr
+        model_attr = model_attr.replace("__flatten", "")
+        prefix = model_attr + SEPARATOR
+        nested_columns = [column for column in frame.columns if column.startswith(prefix)]
+        if model_attr_flatten:
+            columns.extend(pl.col(column).alias(column.removeprefix(prefix)) for column in nested_columns)
+        elif model_attr in frame.columns:
+            columns.append(pl.col(model_attr).alias(new_col))
+        elif nested_columns:
+            nested_fields = [pl.col(column).alias(column.removeprefix(prefix)) for column in nested_columns]
+            columns.append(pl.struct(nested_fields).alias(new_col))
+    model_frame = frame.select(columns)
+    model_frame = model_frame.select(
+        column for column in model_frame.columns if model_frame[column].null_count() < model_frame.height
+    )
+    return pl.concat([frame.select(record_fields()), model_frame], how="horizontal")
+
+
+def records_to_polars(
+    records: Iterable["RegionalDataRecord"], model_convertors: dict | None = None
+) -> "pl.DataFrame":
+    """
+    Convert records to a polars dataframe with the record fields and a column per model
+    convertor (see ``select_model_attributes``). Only the model attributes of the model
+    convertors are converted.
+    """
+    include: dict = {}
+    for model_attr in (model_convertors or {}).values():
+        *parents, attribute = model_attr.replace("__flatten", "").split(SEPARATOR)
+        target = include
+        for parent in parents:
+            if target.get(parent) is True:
+                break
+            target = target.setdefault(parent, {})
+        else:
+            target[attribute] = True
+    return select_model_attributes(records_to_full_model_polars(records, include), model_convertors)
+
+
+def record_fields() -> list[str]:
+    """Fields of a regional data record, other than the model"""
+    from .regional_data import RegionalDataRecord
+
+    return [field for field in RegionalDataRecord.model_fields if field != MODEL_COLUMN]
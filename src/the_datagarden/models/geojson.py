@@ -1,10 +1,28 @@
-from typing import Any
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, get_args
 
-import pandas as pd
-import polars as pl
 from pydantic import BaseModel
 
+from the_datagarden.api.authentication.settings import PAGE_FETCH_WORKERS
 from the_datagarden.api.base import BaseApi
+from the_datagarden.api.decoder import response_json
+
+from .geometry import PackedCoordinates
+from .ingest import construct_model
+from .join import RegionalDataIndex, feature_collection_chunks
+from .keys import record_key
+from .pagination import fetch_all_pages, fetch_next_pages
+from .simplify import SimplifyMethod, simplify_coordinates
+from .snapshot import SnapshotFormat, load_geojson, save_geojson
+from .spatial import SpatialIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
+
+    from .regional_data import TheDataGardenRegionalDataModel
 
 GEJSON_UNIQUE_FIELDS = [
     "region_type",
@@ -13,6 +31,9 @@ GEJSON_UNIQUE_FIELDS = [
     "local_region_code_type",
     "region_level",
 ]
+_record_key_values = attrgetter(*sorted(GEJSON_UNIQUE_FIELDS))
+POINT_GEOMETRY_TYPES = ("Point", "MultiPoint")
+POLYGON_GEOMETRY_TYPES = ("Polygon", "MultiPolygon")
 
 
 class Properties(BaseModel):
@@ -25,8 +46,25 @@ class Properties(BaseModel):
 
 
 class Geometry(BaseModel):
+    """
+    GeoJSON geometry. The coordinates are stored packed (see ``PackedCoordinates``) and
+    are converted to nested lists by ``to_geojson()`` and ``model_dump()``.
+    """
+
     type: str
-    coordinates: list
+    coordinates: PackedCoordinates
+
+    def to_geojson(self) -> dict:
+        return {"type": self.type, "coordinates": self.coordinates.to_list()}
+
+    def simplify(
+        self, tolerance: float = 0.0, method: SimplifyMethod = "douglas_peucker", precision: int | None = None
+    ) -> "Geometry":
+        """Simplified geometry with coordinates rounded to ``precision`` decimals"""
+        coordinates = simplify_coordinates(
+            self.coordinates, tolerance, method, precision, lines=self.type not in POINT_GEOMETRY_TYPES
+        )
+        return Geometry(type=self.type, coordinates=coordinates)
 
 
 class Feature(BaseModel):
@@ -45,8 +83,7 @@ class RegionGeoJSONDataRecord(BaseModel):
     feature: Feature
 
     def record_hash(self) -> str:
-        hash_str = ".".join([str(getattr(self, key)) for key in sorted(GEJSON_UNIQUE_FIELDS)])
-        return str(hash(hash_str))
+        return record_key(_record_key_values(self))
 
     def __str__(self):
         return f"RegionGeoJSONDataRecord: {self.name} ({self.region_type} for {self.local_region_code})"
@@ -69,6 +106,18 @@ class TheDataGardenRegionGeoJSONModel:
     For pandas dataframes you can use the same methods:
     - to_pandas(model_convertors: dict | None = None) -> pd.DataFrame
     - full_model_to_pandas() -> pd.DataFrame
+
+    GeoJSON for the front-end, optionally simplified and with reduced precision:
+    - to_feature_collection(region_level, tolerance, method, precision) -> dict
+    - stream_feature_collection(regional_data, attributes, period, ...) -> Iterator[bytes]
+        with attributes of regional data joined onto the feature properties
+
+    Regions of coordinates (e.g. of customers):
+    - locate(lon, lat, region_level) -> np.ndarray with the local_region_code per point
+
+    Records and requested levels can be saved to and loaded from disk:
+    - save(path: str | Path, file_format: "ipc" | "parquet" = "ipc")
+    - load(path: str | Path) -> TheDataGardenRegionGeoJSONModel
     """
 
     def __init__(self, api: "BaseApi", region_url: str):
@@ -76,6 +125,8 @@ class TheDataGardenRegionGeoJSONModel:
         self._region_url: str = region_url
         self._levels_requested: list[int] = []
         self._geojson_records: dict[str, RegionGeoJSONDataRecord] = {}
+        self._simplified_features: dict[tuple[float, str, int | None], dict[str, Feature]] = {}
+        self._spatial_indexes: dict[int | None, tuple[SpatialIndex, list[RegionGeoJSONDataRecord]]] = {}
 
     def __str__(self):
         return f"TheDataGardenRegionGeoJSONModel : GeoJSON : (count={len(self._geojson_records)})"
@@ -83,41 +134,54 @@ class TheDataGardenRegionGeoJSONModel:
     def __repr__(self):
         return self.__str__()
 
-    def __call__(self, region_level: int = 0) -> "TheDataGardenRegionGeoJSONModel":
-        if region_level not in self._levels_requested:
-            features = self.geojson_paginated_data_from_api(region_level=region_level)
-            if features:
-                self.set_items(features)
-                self._levels_requested.append(region_level)
+    def __call__(
+        self,
+        region_level: int = 0,
+        levels: Iterable[int] | None = None,
+        max_workers: int = PAGE_FETCH_WORKERS,
+    ) -> "TheDataGardenRegionGeoJSONModel":
+        """
+        Retrieve the features of a region level, or of several ``levels`` at once. The
+        pages of all levels are fetched concurrently (at most ``max_workers`` at a time)
+        and the features of each page are added as the page arrives. A level counts as
+        requested once all of its pages are added.
+        """
+        levels_to_request = [
+            level
+            for level in dict.fromkeys(levels if levels is not None else [region_level])
+            if level not in self._levels_requested
+        ]
+        if not levels_to_request:
+            return self
+        pages = fetch_all_pages(
+            fetch_page=lambda level, pagination: self.geojson_data_from_api(
+                region_level=level, pagination=pagination
+            ),
+            request_keys=levels_to_request,
+            max_workers=max_workers,
+        )
+        levels_with_features = set()
+        for level, page_resp, level_complete in pages:
+            if page_resp.get("features"):
+                self.set_items(page_resp)
+                levels_with_features.add(level)
+            if level_complete and level in levels_with_features and level not in self._levels_requested:
+                self._levels_requested.append(level)
         return self
 
-    def _response_has_next_page(self, model_data_resp: dict) -> bool:
-        pagination = model_data_resp.get("pagination", None)
-        if not pagination:
-            return False
-        return pagination.get("next_page", None) is not None
-
-    def _next_page_pagination(self, model_data_resp: dict) -> dict | None:
-        pagination = model_data_resp.pop("pagination", None)
-        if not pagination:
-            return None
-        next_page = pagination.get("next_page", None)
-        if not next_page:
-            return None
-        return {"page": next_page}
-
-    def geojson_paginated_data_from_api(self, region_level: int):
+    def geojson_paginated_data_from_api(self, region_level: int) -> dict | None:
         geojson_data_resp = self.geojson_data_from_api(region_level=region_level)
-        while geojson_data_resp and self._response_has_next_page(geojson_data_resp):
-            next_page_pagination = self._next_page_pagination(geojson_data_resp)
-            if next_page_pagination:
-                next_page_resp = self.geojson_data_from_api(
-                    pagination=next_page_pagination, region_level=region_level
-                )
-                if next_page_resp:
-                    geojson_data_resp["features"].extend(next_page_resp["features"])
-                    geojson_data_resp["pagination"] = next_page_resp["pagination"]
-
+        if not geojson_data_resp:
+            return geojson_data_resp
+        next_pages = fetch_next_pages(
+            fetch_page=lambda pagination: self.geojson_data_from_api(
+                region_level=region_level, pagination=pagination
+            ),
+            first_page_resp=geojson_data_resp,
+        )
+        for next_page_resp in next_pages:
+            geojson_data_resp["features"].extend(next_page_resp["features"])
+        geojson_data_resp.pop("pagination", None)
         return geojson_data_resp
 
     def geojson_data_from_api(
@@ -132,12 +196,14 @@ class TheDataGardenRegionGeoJSONModel:
             payload=payload,
         )
         if geojson_data_resp:
-            return geojson_data_resp.json()
+            return response_json(geojson_data_resp)
         return None
 
     def set_items(self, data: dict):
-        for feature in data["features"]:
-            feature = Feature(**feature)
+        fast_ingest = self._api.ingest_mode == "fast"
+        self._spatial_indexes = {}
+        for feature_data in data["features"]:
+            feature = construct_model(Feature, feature_data) if fast_ingest else Feature(**feature_data)
             data_record_items = {
                 "name": feature.properties.name,
                 "region_type": feature.properties.region_type,
@@ -147,25 +213,154 @@ class TheDataGardenRegionGeoJSONModel:
                 "region_level": feature.properties.region_level,
                 "feature": feature,
             }
-            data_record = RegionGeoJSONDataRecord(**data_record_items)
-            self._geojson_records.update({data_record.record_hash(): data_record})
+            data_record = (
+                construct_model(RegionGeoJSONDataRecord, data_record_items)
+                if fast_ingest
+                else RegionGeoJSONDataRecord(**data_record_items)
+            )
+            record_hash = data_record.record_hash()
+            self._geojson_records.update({record_hash: data_record})
+            for simplified_features in self._simplified_features.values():
+                simplified_features.pop(record_hash, None)
+
+    def simplified_features(
+        self, tolerance: float = 0.0, method: SimplifyMethod = "douglas_peucker", precision: int | None = None
+    ) -> dict[str, Feature]:
+        """
+        Features with simplified geometries by record hash. The simplified features are
+        cached per tolerance, method and precision; only records added since the last
+        call are simplified.
+        """
+        if method not in get_args(SimplifyMethod):
+            raise ValueError(f"method should be one of {get_args(SimplifyMethod)}, not '{method}'")
+        features = self._simplified_features.setdefault((tolerance, method, precision), {})
+        for record_hash, record in self._geojson_records.items():
+            if record_hash not in features:
+                geometry = record.feature.geometry.simplify(tolerance, method, precision)
+                features[record_hash] = record.feature.model_copy(update={"geometry": geometry})
+        return features
+
+    def _features(
+        self, region_level: int | None, tolerance: float, method: SimplifyMethod, precision: int | None
+    ) -> list[Feature]:
+        if tolerance or precision is not None:
+            features = self.simplified_features(tolerance, method, precision)
+        else:
+            features = {record_hash: record.feature for record_hash, record in self._geojson_records.items()}
+        return [
+            features[record_hash]
+            for record_hash, record in self._geojson_records.items()
+            if region_level is None or record.region_level == region_level
+        ]
+
+    def to_feature_collection(
+        self,
+        region_level: int | None = None,
+        tolerance: float = 0.0,
+        method: SimplifyMethod = "douglas_peucker",
+        precision: int | None = None,
+    ) -> dict:
+        """
+        GeoJSON FeatureCollection of the features (of a region level), simplified with
+        ``tolerance`` (in degrees) and rounded to ``precision`` decimals when given.
+        """
+        return {
+            "type": "FeatureCollection",
+            "features": [
+                feature.model_dump() for feature in self._features(region_level, tolerance, method, precision)
+            ],
+        }
+
+    def stream_feature_collection(
+        self,
+        regional_data: "TheDataGardenRegionalDataModel | None" = None,
+        attributes: dict[str, str] | list[str] | None = None,
+        period: str | None = None,
+        period_type: str | None = None,
+        source_name: str | None = None,
+        region_level: int | None = None,
+        tolerance: float = 0.0,
+        method: SimplifyMethod = "douglas_peucker",
+        precision: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        GeoJSON FeatureCollection as chunks of JSON (one per feature), to write to a file
+        or a response. With ``regional_data`` the ``attributes`` (property names mapped
+        to model attributes) of the records for ``period`` are added to the properties of
+        the features of their region; see ``RegionalDataIndex``.
+        """
+        index = None
+        if regional_data is not None:
+            index = RegionalDataIndex(regional_data, attributes or [], period, period_type, source_name)
+        return feature_collection_chunks(self._features(region_level, tolerance, method, precision), index)
+
+    def spatial_index(
+        self, region_level: int | None = None
+    ) -> tuple[SpatialIndex, list[RegionGeoJSONDataRecord]]:
+        """
+        Spatial index over the (non empty) (Multi)Polygon features of a region level (all
+        features when None) and the records in the order of the index. The index is built
+        on first use and rebuilt after new features are loaded.
+        """
+        if region_level not in self._spatial_indexes:
+            records = [
+                record
+                for record in self._geojson_records.values()
+                if record.feature.geometry.type in POLYGON_GEOMETRY_TYPES
+                and len(record.feature.geometry.coordinates.coords)
+                and (region_level is None or record.region_level == region_level)
+            ]
+            index = SpatialIndex([record.feature.geometry.coordinates for record in records])
+            self._spatial_indexes[region_level] = (index, records)
+        return self._spatial_indexes[region_level]
+
+    def locate(self, lon: "np.ndarray", lat: "np.ndarray", region_level: int | None = None) -> "np.ndarray":
+        """
+        Local region code of the region containing each point (longitude, latitude), None
+        for points outside the loaded regions. Pass ``region_level`` when features of
+        several levels are loaded; otherwise the first loaded region containing a point
+        is used.
+        """
+        import numpy as np
 
-    def to_polars(self) -> pl.DataFrame:
+        index, records = self.spatial_index(region_level)
+        # Points outside all regions (index -1) get the trailing None
+        region_codes = np.array([record.local_region_code for record in records] + [None], dtype=object)
+        return region_codes[index.locate(lon, lat)]
+
+    def to_polars(self) -> "pl.DataFrame":
         """
         Convert the data to a polars dataframe using a dictionary of model attributes to convert to columns
         """
+        import polars as pl
+
         converted_records = []
         for record in self._geojson_records.values():
             record_dict = record.model_dump()
             converted_records.append(record_dict)
         return pl.from_records(converted_records)
 
-    def to_pandas(self) -> pd.DataFrame:
+    def to_pandas(self) -> "pd.DataFrame":
         """
         Convert the data to a pandas dataframe
         """
         return self.to_polars().to_pandas()
 
+    def save(self, path: str | Path, file_format: SnapshotFormat = "ipc"):
+        """
+        Save the records and requested levels of the model as a snapshot directory with
+        an Arrow IPC (default) or Parquet file.
+        """
+        save_geojson(self, path, file_format)
+
+    def load(self, path: str | Path) -> "TheDataGardenRegionGeoJSONModel":
+        """
+        Load the records and requested levels of a snapshot into the model. Levels included
+        in the snapshot are not requested from the API again.
+        """
+        load_geojson(self, path)
+        return self
+
     def __iter__(self):
         """Makes the class iterable over the values in _data_records"""
         return iter(self._geojson_records.values())
@@ -0,0 +1,134 @@
+"""
+Compact storage of GeoJSON geometries.
+
+GeoJSON coordinates are nested lists of positions. A ``PackedCoordinates`` object stores
+them, as in the GeoArrow layout, as one float64 array with a row per position and an
+offset array per nesting level:
+
+    Point                                          coords
+    LineString, MultiPoint                         coords
+    Polygon, MultiLineString         ring offsets, coords
+    MultiPolygon      polygon offsets, ring offsets, coords
+
+Part ``i`` of a level runs from ``offsets[i]`` to ``offsets[i + 1]`` in the next level;
+e.g. the first ring of a polygon is ``coords[ring_offsets[0]:ring_offsets[1]]``.
+
+Nested lists are only created again on demand: by ``to_list()`` and when a geometry is
+serialized (``model_dump``, ``model_dump_json``).
+
+Example:
+    >>> coordinates = PackedCoordinates.from_list([[[0, 0], [1, 0], [1, 1], [0, 0]]])
+    >>> coordinates.offsets
+    (array([0, 4]),)
+    >>> coordinates.to_list()
+    [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]
+"""
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterator
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _nesting_depth(coordinates: list) -> int:
+    """Number of list levels above the positions (0 for a single position)"""
+    depth = 0
+    items: list | tuple = coordinates
+    while items and isinstance(items[0], (list, tuple)):
+        depth += 1
+        items = next((item for item in items if item), items[0])
+    return depth if coordinates else 1
+
+
+class PackedCoordinates:
+    """
+    Coordinates of a GeoJSON geometry as a flat float64 position array with offsets.
+
+    Args:
+        coords: Array of shape (positions, dimensions).
+        offsets: Offset arrays, outermost level first.
+        depth: Nesting depth of the coordinates (0 for a point).
+    """
+
+    __slots__ = ("coords", "offsets", "depth")
+
+    def __init__(self, coords: "np.ndarray", offsets: tuple["np.ndarray", ...] = (), depth: int = 1):
+        self.coords = coords
+        self.offsets = offsets
+        self.depth = depth
+
+    @classmethod
+    def from_list(cls, coordinates: list) -> "PackedCoordinates":
+        import numpy as np
+
+        depth = _nesting_depth(coordinates)
+        if depth == 0:
+            return cls(np.array([coordinates], dtype=np.float64), depth=0)
+        offsets = []
+        items = coordinates
+        for _ in range(depth - 1):
+            lengths = np.fromiter((len(item) for item in items), dtype=np.int64, count=len(items))
+            offsets.append(np.concatenate(([0], np.cumsum(lengths))))
+            items = [sub_item for item in items for sub_item in item]
+        dimensions = len(items[0]) if items else 2
+        coords = np.fromiter(chain.from_iterable(items), dtype=np.float64, count=len(items) * dimensions)
+        return cls(coords.reshape(-1, dimensions), tuple(offsets), depth)
+
+    def to_list(self) -> list:
+        """Coordinates as GeoJSON nested lists"""
+        items = self.coords.tolist()
+        if self.depth == 0:
+            return items[0]
+        for offsets in reversed(self.offsets):
+            bounds = offsets.tolist()
+            items = [items[start:end] for start, end in zip(bounds[:-1], bounds[1:], strict=True)]
+        return items
+
+    def rings(self) -> Iterator["np.ndarray"]:
+        """Position arrays (views) of the innermost parts: rings, lines or the points"""
+        if self.depth < 2:
+            yield self.coords
+            return
+        bounds = self.offsets[-1].tolist()
+        for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+            yield self.coords[start:end]
+
+    @property
+    def nbytes(self) -> int:
+        return self.coords.nbytes + sum(offsets.nbytes for offsets in self.offsets)
+
+    def __eq__(self, other: object) -> bool:
+        import numpy as np
+
+        if not isinstance(other, PackedCoordinates):
+            return NotImplemented
+        return (
+            self.depth == other.depth
+            and np.array_equal(self.coords, other.coords)
+            and len(self.offsets) == len(other.offsets)
+            and all(np.array_equal(a, b) for a, b in zip(self.offsets, other.offsets, strict=True))
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : (positions={len(self.coords)}, depth={self.depth})"
+
+    @classmethod
+    def _validate(cls, value: Any) -> "PackedCoordinates":
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, (list, tuple)):
+            raise ValueError("coordinates should be a (nested) list of positions")
+        return cls.from_list(list(value))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.to_list()),
+        )
@@ -0,0 +1,132 @@
+"""
+Creation of models from API responses without validation.
+
+In the ``"fast"`` ingest mode (``TheDataGardenAPI(ingest_mode="fast")``) the responses of
+the API are trusted to match the models. Models are then created with
+``construct_model``, which sets the fields of the (nested) models from the response
+data without validating or converting them. This is an order of magnitude faster
+than validation for large models. GeoJSON coordinates are still packed (see
+``PackedCoordinates``), as the models store them packed.
+
+Fields that are not in the response data get the defaults of the model. The default
+values are created once per model class; mutable defaults (dictionaries, lists and
+models) are copied for every constructed model.
+"""
+
+from copy import deepcopy
+from functools import cache
+from types import UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel, RootModel
+
+from .geometry import PackedCoordinates
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+NestedModel = type[BaseModel | PackedCoordinates]
+
+
+def _nested_model(annotation: Any) -> tuple[NestedModel | None, type[list | dict] | None]:
+    """Nested model class of a field annotation and the container (list or dict) of the models"""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        models = [nested for arg in get_args(annotation) if (nested := _nested_model(arg))[0]]
+        return models[0] if len(models) == 1 else (None, None)
+    if origin in (list, dict) and get_args(annotation):
+        nested_model, container = _nested_model(get_args(annotation)[-1])
+        return (nested_model, origin) if nested_model and not container else (None, None)
+    if isinstance(annotation, type) and issubclass(annotation, (BaseModel, PackedCoordinates)):
+        return annotation, None
+    return None, None
+
+
+@cache
+def _construction_plan(
+    model: type[BaseModel],
+) -> dict[str, tuple[str, NestedModel | None, type[list | dict] | None]]:
+    """
+    Field name, nested model class and container of the nested models per key (field
+    name or alias) of the model data
+    """
+    plan = {}
+    for field_name, field_info in model.model_fields.items():
+        keys = [field_name]
+        if field_info.alias:
+            keys.append(field_info.alias)
+        if isinstance(field_info.validation_alias, str):
+            keys.append(field_info.validation_alias)
+        elif isinstance(field_info.validation_alias, AliasChoices):
+            keys.extend(choice for choice in field_info.validation_alias.choices if isinstance(choice, str))
+        for key in keys:
+            plan[key] = (field_name, *_nested_model(field_info.annotation))
+    return plan
+
+
+@cache
+def _default_values(model: type[BaseModel]) -> tuple[dict[str, Any], set[str]] | None:
+    """Default values of the fields of the model and the names of the fields with mutable defaults"""
+    try:
+        default_values = dict(model().__dict__)
+    except ValueError:
+        # Models with required fields get their defaults from model_construct
+        return None
+    mutable_fields = {
+        field_name
+        for field_name, value in default_values.items()
+        if isinstance(value, (dict, list, set, BaseModel))
+    }
+    return default_values, mutable_fields
+
+
+def _copy_default(value: Any) -> Any:
+    if isinstance(value, BaseModel) and not isinstance(value, RootModel) and not value.model_fields_set:
+        return construct_model(type(value), {})
+    if isinstance(value, (dict, list, set)) and not value:
+        return type(value)()
+    return deepcopy(value)
+
+
+def _construct_value(nested_model: NestedModel, value: Any) -> Any:
+    if issubclass(nested_model, PackedCoordinates):
+        return PackedCoordinates.from_list(value) if isinstance(value, list) else value
+    return construct_model(nested_model, value) if isinstance(value, dict) else value
+
+
+def construct_model(model: type[ModelType], data: dict) -> ModelType:
+    """
+    Create a model (and its nested models, also in lists and dictionaries) from data
+    without validation.
+    """
+    if issubclass(model, RootModel):
+        return model.model_construct(data)
+
+    plan = _construction_plan(model)
+    values = {}
+    for key, value in data.items():
+        if key not in plan:
+            continue
+        field_name, nested_model, container = plan[key]
+        if nested_model is None:
+            pass
+        elif container is list and isinstance(value, list):
+            value = [_construct_value(nested_model, item) for item in value]
+        elif container is dict and isinstance(value, dict):
+            value = {item_key: _construct_value(nested_model, item) for item_key, item in value.items()}
+        elif container is None:
+            value = _construct_value(nested_model, value)
+        values[field_name] = value
+
+    defaults = _default_values(model)
+    if defaults is None or model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        return model.model_construct(**values)
+    default_values, mutable_fields = defaults
+    # Mutable defaults are copied, as validation does, so the models do not share them
+    copied_defaults = {name: _copy_default(default_values[name]) for name in mutable_fields - values.keys()}
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", default_values | copied_defaults | values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
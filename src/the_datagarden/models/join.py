@@ -0,0 +1,135 @@
+"""
+Join of regional data onto GeoJSON features.
+
+``RegionalDataIndex`` selects model attributes of the records of a regional data model
+for one period and indexes them, serialized to JSON, by the region keys shared with
+the GeoJSON features (``iso_cc_2``, ``local_region_code`` and ``region_level``).
+``feature_collection_chunks`` then writes a GeoJSON FeatureCollection feature by
+feature, merging the serialized feature properties with the indexed attributes of the
+region. No dictionaries are created per feature.
+
+Example:
+    >>> index = RegionalDataIndex(demographics, {"population": "population.total"}, period="2022")
+    >>> features = [record.feature for record in geojsons.geojson_records]
+    >>> b"".join(feature_collection_chunks(features, index))
+"""
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from .geojson import Feature
+    from .regional_data import TheDataGardenRegionalDataModel
+
+JOIN_FIELDS = ["iso_cc_2", "local_region_code", "region_level"]
+RegionKey = tuple[str | None, str | None, int]
+
+
+class RegionalDataIndex:
+    """
+    Model attributes of regional data records per region, serialized as JSON objects.
+
+    Args:
+        regional_data: Regional data model with the records to join.
+        attributes: Feature property names mapped to (dotted) model attributes, as the
+            model convertors of ``to_polars``. A list of attributes uses the attributes as
+            property names. Attributes named as a feature property (e.g. ``name``) are left
+            out, so the merged properties have unique keys.
+        period: Period of the records, or the start of it (e.g. ``"2022"``). When not set,
+            the last period of each region is used.
+        period_type: Period type of the records (e.g. ``"Y"``).
+        source_name: Source of the records.
+    """
+
+    def __init__(
+        self,
+        regional_data: "TheDataGardenRegionalDataModel",
+        attributes: dict[str, str] | list[str],
+        period: str | None = None,
+        period_type: str | None = None,
+        source_name: str | None = None,
+    ):
+        import polars as pl
+
+        from .geojson import Properties
+
+        if not isinstance(attributes, dict):
+            attributes = {attribute: attribute for attribute in attributes}
+        attributes = {
+            name: attribute for name, attribute in attributes.items() if name not in Properties.model_fields
+        }
+        frame = regional_data.to_polars(attributes)
+        if frame.is_empty():
+            self._properties: dict[RegionKey, bytes] = {}
+            return
+        if period is not None:
+            frame = frame.filter(pl.col("period").str.starts_with(period))
+        if period_type is not None:
+            frame = frame.filter(pl.col("period_type") == period_type)
+        if source_name is not None:
+            frame = frame.filter(pl.col("source_name") == source_name)
+        frame = frame.sort("period").unique(subset=JOIN_FIELDS, keep="last", maintain_order=True)
+        properties = frame.select(
+            pl.struct(
+                pl.col(name) if name in frame.columns else pl.lit(None).alias(name) for name in attributes
+            ).struct.json_encode()
+        ).to_series()
+        self._properties = {
+            key: properties_json.encode()
+            for key, properties_json in zip(frame.select(JOIN_FIELDS).iter_rows(), properties, strict=True)
+        }
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def properties(self, region_key: RegionKey) -> bytes | None:
+        """JSON object with the attributes of a region, None for regions without data"""
+        iso_cc_2, local_region_code, region_level = region_key
+        region_properties = self._properties.get(region_key)
+        if region_properties is None and local_region_code is not None:
+            # Records of countries can come without a local region code
+            region_properties = self._properties.get((iso_cc_2, None, region_level))
+        return region_properties
+
+
+def _merged_objects(first_object: bytes, second_object: bytes | None) -> bytes:
+    if not second_object or second_object == b"{}":
+        return first_object
+    if first_object == b"{}":
+        return second_object
+    return first_object[:-1] + b"," + second_object[1:]
+
+
+def feature_collection_chunks(
+    features: Iterable["Feature"], index: RegionalDataIndex | None = None
+) -> Iterator[bytes]:
+    """
+    GeoJSON FeatureCollection of features as chunks of JSON, one feature per chunk.
+    Feature properties are extended with the attributes of the region in ``index``.
+    """
+    yield b'{"type":"FeatureCollection","features":['
+    separator = b""
+    for feature in features:
+        properties = to_json(feature.properties)
+        if index is not None:
+            region_key = (
+                feature.properties.iso_cc_2,
+                feature.properties.local_region_code,
+                feature.properties.region_level,
+            )
+            properties = _merged_objects(properties, index.properties(region_key))
+        yield b"".join(
+            (
+                separator,
+                b'{"type":',
+                to_json(feature.type),
+                b',"properties":',
+                properties,
+                b',"geometry":',
+                to_json(feature.geometry),
+                b"}",
+            )
+        )
+        separator = b","
+    yield b"]}"
@@ -0,0 +1,38 @@
+"""
+Deterministic keys of records and requests.
+
+Keys are hex digests (BLAKE2b, 128 bits) of the identifying values, so they are equal
+across Python processes and can be stored in snapshots and caches or compared between
+workers. The builtin ``hash()`` of strings is randomised per process.
+
+Example:
+    >>> record_key(["NL", "NL31", 2, "2022-01-01T00:00:00Z"])
+    'c91d55ac2fe73b4beeca67fcadf6491b'
+"""
+
+import json
+from hashlib import blake2b
+from typing import Any, Iterable
+
+KEY_DIGEST_SIZE = 16
+# Separates the values of a key; None is written as a character that does not occur
+# in region codes, periods or source names, so None and "None" give different keys
+VALUE_SEPARATOR = "\x1f"
+NONE_VALUE = "\x00"
+
+
+def record_key(values: Iterable[Any]) -> str:
+    """Key of a record from the values of its unique fields (in a fixed field order)"""
+    key_str = VALUE_SEPARATOR.join(NONE_VALUE if value is None else str(value) for value in values)
+    return blake2b(key_str.encode(), digest_size=KEY_DIGEST_SIZE).hexdigest()
+
+
+def record_keys(rows: Iterable[Iterable[Any]]) -> list[str]:
+    """Keys of several records, e.g. of the rows of a dataframe"""
+    return [record_key(row) for row in rows]
+
+
+def request_key(params: dict[str, Any]) -> str:
+    """Key of the parameters of a request, independent of the order of the parameters"""
+    key_str = json.dumps(params, sort_keys=True, default=str)
+    return blake2b(key_str.encode(), digest_size=KEY_DIGEST_SIZE).hexdigest()
@@ -0,0 +1,160 @@
+"""
+Pagination helpers for the regional data and geojson endpoints.
+
+Responses of these endpoints contain a ``pagination`` block like::
+
+    {"pagination": {"current_page": 1, "next_page": 2, "total_pages": 12}}
+
+When the total number of pages is known after the first response the remaining
+pages are fetched concurrently by a bounded thread pool. Otherwise the pages
+are followed one by one using ``next_page``.
+
+``fetch_all_pages`` fetches several paginated requests (e.g. the geojsons of several
+region levels) at once: the first pages of all requests are fetched concurrently,
+followed by the remaining pages of all requests, and pages are yielded as they arrive.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Hashable, Iterable, Iterator, TypeVar
+
+from the_datagarden.api.authentication.settings import PAGE_FETCH_WORKERS
+
+PageFetcher = Callable[[dict], dict | None]
+RequestKey = TypeVar("RequestKey", bound=Hashable)
+
+
+def next_page_number(response: dict) -> int | None:
+    pagination = response.get("pagination", None) or {}
+    next_page = pagination.get("next_page", None)
+    return int(next_page) if next_page else None
+
+
+def total_pages(response: dict) -> int | None:
+    pagination = response.get("pagination", None) or {}
+    total = pagination.get("total_pages", None)
+    return int(total) if total else None
+
+
+def fetch_next_pages(
+    fetch_page: PageFetcher,
+    first_page_resp: dict,
+    max_workers: int = PAGE_FETCH_WORKERS,
+) -> Iterator[dict]:
+    """
+    Yield the pages following ``first_page_resp`` in page order.
+
+    ``fetch_page`` is called with the pagination payload (``{"page": <page>}``)
+    and returns the decoded page or ``None`` when the request failed. A failed
+    page raises a RuntimeError (after the pages before it are yielded), so an
+    incomplete request is not taken for a complete one. At most ``max_workers``
+    pages are in flight (and held in memory) at the same time.
+    """
+    first_next_page = next_page_number(first_page_resp)
+    if first_next_page is None:
+        return
+
+    last_page = total_pages(first_page_resp)
+    if last_page is None or max_workers <= 1:
+        yield from _fetch_pages_serially(fetch_page, first_next_page)
+        return
+
+    pages = iter(range(first_next_page, last_page + 1))
+    workers = min(max_workers, last_page - first_next_page + 1)
+    pending: deque[tuple[int, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="the-datagarden-page") as executor:
+
+        def submit_next_page() -> None:
+            page = next(pages, None)
+            if page is not None:
+                pending.append((page, executor.submit(fetch_page, {"page": page})))
+
+        try:
+            for _ in range(workers):
+                submit_next_page()
+            while pending:
+                page, future = pending.popleft()
+                page_resp = future.result()
+                if not page_resp:
+                    raise _page_failed(page)
+                yield page_resp
+                # The next page is requested once the caller is done with this page, so
+                # the page being processed counts towards ``max_workers``
+                submit_next_page()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _page_failed(page: int) -> RuntimeError:
+    return RuntimeError(f"Page {page} of the paginated response could not be retrieved")
+
+
+def _fetch_pages_serially(fetch_page: PageFetcher, page: int | None) -> Iterator[dict]:
+    while page is not None:
+        page_resp = fetch_page({"page": page})
+        if not page_resp:
+            raise _page_failed(page)
+        yield page_resp
+        page = next_page_number(page_resp)
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[RequestKey, dict | None], dict | None],
+    request_keys: Iterable[RequestKey],
+    max_workers: int = PAGE_FETCH_WORKERS,
+) -> Iterator[tuple[RequestKey, dict, bool]]:
+    """
+    Yield ``(request_key, page, request_complete)`` for all pages of several paginated
+    requests, in the order in which the pages arrive. ``request_complete`` is True for
+    the last page of a request of which all pages were retrieved.
+
+    ``fetch_page`` is called with the request key and the pagination payload (None for
+    the first page) and returns the decoded page or ``None`` when the request failed.
+    The first pages of all requests are fetched concurrently. When a first page tells
+    the total number of pages, the remaining pages of the request are fetched
+    concurrently as well; otherwise they are followed one by one using ``next_page``.
+    Failed pages are skipped; their requests are not complete.
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(max_workers, 1), thread_name_prefix="the-datagarden-page"
+    ) as executor:
+        # Request key of each page in flight and whether the next page of the request
+        # is to be requested when the page arrives
+        pending: dict[Future, tuple[RequestKey, bool]] = {}
+        # Pages in flight and failed requests per request key
+        outstanding_pages: dict[RequestKey, int] = {}
+        failed_requests: set[RequestKey] = set()
+
+        def submit(request_key: RequestKey, pagination: dict | None, follow_next_page: bool) -> None:
+            future = executor.submit(fetch_page, request_key, pagination)
+            pending[future] = (request_key, follow_next_page)
+            outstanding_pages[request_key] = outstanding_pages.get(request_key, 0) + 1
+
+        for request_key in request_keys:
+            submit(request_key, None, True)
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    request_key, follow_next_page = pending.pop(future)
+                    outstanding_pages[request_key] -= 1
+                    page_resp = future.result()
+                    if not page_resp:
+                        failed_requests.add(request_key)
+                        continue
+                    next_page = next_page_number(page_resp)
+                    last_page = total_pages(page_resp)
+                    if follow_next_page and next_page is not None:
+                        if last_page is None:
+                            submit(request_key, {"page": next_page}, True)
+                        else:
+                            for page in range(next_page, last_page + 1):
+                                submit(request_key, {"page": page}, False)
+                    request_complete = (
+                        not outstanding_pages[request_key] and request_key not in failed_requests
+                    )
+                    yield request_key, page_resp, request_complete
+        finally:
+            for future in pending:
+                future.cancel()
@@ -1,10 +1,41 @@
-import pandas as pd
-import polars as pl
-from datagarden_models import DataGardenModel, DatagardenModels, DataGardenSubModel, RegionalDataStats
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
+
+from datagarden_models import (
+    CountryStats,
+    DataGardenModel,
+    DatagardenModels,
+    DataGardenSubModel,
+    RegionalDataStats,
+)
 from datagarden_models.models.base.legend import Legend
 from pydantic import BaseModel
 
+from the_datagarden.api.authentication.settings import PAGE_FETCH_WORKERS
 from the_datagarden.api.base import BaseApi
+from the_datagarden.api.decoder import response_json
+
+from .columnar import ColumnarRecordStore
+from .conversion import (
+    data_object_fields,
+    flatten_dict,
+    records_to_full_model_polars,
+    records_to_polars,
+    region_fields,
+    regional_data_to_full_model_polars,
+    select_model_attributes,
+    sub_models,
+)
+from .ingest import construct_model
+from .keys import record_key, request_key
+from .pagination import fetch_next_pages
+from .snapshot import SnapshotFormat, load_regional_data, save_regional_data
+from .sync import PeriodRange, missing_period_windows, period_date
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
 
 UNIQUE_FIELDS = [
     "region_type",
@@ -17,6 +48,7 @@ UNIQUE_FIELDS = [
     "period_type",
     "source_name",
 ]
+_record_key_values = attrgetter(*sorted(UNIQUE_FIELDS))
 DEFAULT_COLUMNS_TO_EXCLUDE = [
     "datagarden_model_version",
     "name",
@@ -54,8 +86,7 @@ class RegionalDataRecord(BaseModel):
     model: DataGardenSubModel
 
     def record_hash(self) -> str:
-        hash_str = ".".join([str(getattr(self, key)) for key in sorted(UNIQUE_FIELDS)])
-        return str(hash(hash_str))
+        return record_key(_record_key_values(self))
 
     def __str__(self):
         return (
@@ -67,12 +98,45 @@ class RegionalDataRecord(BaseModel):
         return self.model.__class__
 
     def record_for_sub_model(self, sub_model_name: str) -> "RegionalDataRecord":
-        if sub_model_name not in self.datgarden_model_class.legends().sub_model_names:
+        if sub_model_name not in sub_models(self.model.__class__):
             raise ValueError(f"Sub model `{sub_model_name}` not found in {self.datgarden_model_class}")
-        child_record = self.model_dump()
-        child_record["data_model_name"] = sub_model_name
-        child_record["model"] = getattr(self.model, sub_model_name)
-        return RegionalDataRecord(**child_record)
+        # The sub model is shared with this record, not copied or validated again
+        return self.model_copy(
+            update={"data_model_name": sub_model_name, "model": getattr(self.model, sub_model_name)}
+        )
+
+
+class SubModelRecords(Mapping[str, RegionalDataRecord]):
+    """
+    Records of a sub model as a view on the records of the parent model. A record is
+    projected (see ``RegionalDataRecord.record_for_sub_model``) on first access.
+    """
+
+    def __init__(self, records: Mapping[str, RegionalDataRecord], sub_model_name: str):
+        self._records = records
+        self._sub_model_name = sub_model_name
+        self._projected_records: dict[str, RegionalDataRecord] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} : {self._sub_model_name} : (count={len(self)})"
+
+    def __getitem__(self, record_hash: str) -> RegionalDataRecord:
+        record = self._projected_records.get(record_hash)
+        if record is None:
+            record = self._records[record_hash].record_for_sub_model(self._sub_model_name)
+            self._projected_records[record_hash] = record
+        return record
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+# Records of a model: a dictionary, the columnar store of the API option ``columnar`` or,
+# for sub models, a view on the records of the parent model
+RecordStore = dict[str, RegionalDataRecord] | ColumnarRecordStore | SubModelRecords
 
 
 class TheDataGardenRegionalDataModel:
@@ -92,6 +156,21 @@ class TheDataGardenRegionalDataModel:
     For pandas dataframes you can use the same methods:
     - to_pandas(model_convertors: dict | None = None) -> pd.DataFrame
     - full_model_to_pandas() -> pd.DataFrame
+
+    Data can be kept up to date by requesting only the periods that are not loaded yet:
+    - sync(period_type="Y", period_from=None, period_to=None, source=None, **kwargs)
+
+    Large requests can be streamed page by page without storing the records in the model:
+    - stream(**kwargs) -> Iterator[RegionalDataRecord]
+    - stream_to_polars(model_convertors: dict | None = None, **kwargs) -> Iterator[pl.DataFrame]
+    - stream_full_model_to_polars(**kwargs) -> Iterator[pl.DataFrame]
+
+    When the API object is created with ``columnar=True`` the records are stored as
+    polars columns (see ``the_datagarden.models.columnar.ColumnarRecordStore``).
+
+    Records and request bookkeeping can be saved to and loaded from disk:
+    - save(path: str | Path, file_format: "ipc" | "parquet" = "ipc")
+    - load(path: str | Path) -> TheDataGardenRegionalDataModel
     """
 
     def __init__(
@@ -107,7 +186,10 @@ class TheDataGardenRegionalDataModel:
         self._model_name: str = model_name
         self._region_url: str = region_url
         self._request_params_hashes: list[str] = []
-        self._data_records: dict[str, RegionalDataRecord] = {}
+        self._data_records: RecordStore = ColumnarRecordStore(model=model) if api.columnar else {}
+        self._full_model_frame: "pl.DataFrame | None" = None
+        self._sub_model_data: dict[str, TheDataGardenRegionalDataModel] = {}
+        self._regional_availability: dict[str, RegionalDataStats | None] | None = None
         self.meta_data: BaseModel = meta_data
         self._model: DataGardenModel = model or getattr(DatagardenModels, model_name.upper())
         self._is_sub_model: bool = is_sub_model
@@ -119,23 +201,169 @@ class TheDataGardenRegionalDataModel:
         return self.__str__()
 
     def __call__(self, **kwargs) -> "TheDataGardenRegionalDataModel":
-        if self._is_sub_model:
-            raise TypeError(
-                "Sub model data cannot be used to retrieve data. "
-                "Use the main model data object to make calls to The-Datagarden API"
-            )
+        return self._retrieve(PAGE_FETCH_WORKERS, **kwargs)
+
+    def _retrieve(self, page_workers: int, /, **kwargs) -> "TheDataGardenRegionalDataModel":
+        """Retrieve the records of a call, fetching at most ``page_workers`` pages at the same time"""
+        self._raise_for_sub_model()
         request_hash = self.request_hash(**kwargs)
         if request_hash not in self._request_params_hashes:
-            regional_data = self.regional_paginated_data_from_api(**kwargs)
+            regional_data = self.regional_paginated_data_from_api(max_workers=page_workers, **kwargs)
             if regional_data:
                 self.set_items(regional_data)
                 self._request_params_hashes.append(request_hash)
         return self
 
+    def sync(
+        self,
+        period_type: str = "Y",
+        period_from: str | None = None,
+        period_to: str | None = None,
+        source: str | list[str] | None = None,
+        **kwargs,
+    ) -> "TheDataGardenRegionalDataModel":
+        """
+        Incrementally retrieve the records of a period range. Only the periods missing in
+        the loaded records are requested, per source, using the periods available in the
+        region statistics (see ``the_datagarden.models.sync``). Assumes the loaded records
+        of the period type were retrieved with the same other parameters (e.g. the same
+        ``region_type`` or ``descendant_level``).
+        """
+        self._raise_for_sub_model()
+        sources = [source] if isinstance(source, str) else source
+        region_type = kwargs.get("region_type")
+        windows = missing_period_windows(
+            loaded=self._loaded_periods(period_type, region_type),
+            available=self._available_periods(period_type, region_type),
+            period_from=period_from,
+            period_to=period_to,
+            sources=sources,
+        )
+        for window in windows:
+            self(period_type=period_type, **kwargs, **window)
+        return self
+
+    def _loaded_periods(self, period_type: str, region_type: str | None = None) -> dict[str, PeriodRange]:
+        """First and last loaded period per source"""
+        import polars as pl
+
+        if isinstance(self._data_records, ColumnarRecordStore):
+            frame = self._data_records.frame
+        else:
+            frame = pl.DataFrame(
+                [
+                    (record.source_name, record.period, record.period_type, record.region_type)
+                    for record in self._data_records.values()
+                ],
+                schema=dict.fromkeys(["source_name", "period", "period_type", "region_type"], pl.String),
+                orient="row",
+            )
+        if frame.is_empty():
+            return {}
+        frame = frame.filter(pl.col("period_type") == period_type)
+        if region_type is not None:
+            frame = frame.filter(pl.col("region_type") == region_type)
+        periods = frame.group_by("source_name").agg(
+            pl.col("period").min().alias("first"), pl.col("period").max()
+        )
+        return {source: (first, last) for source, first, last in periods.iter_rows() if source is not None}
+
+    def _available_periods(self, period_type: str, region_type: str | None = None) -> dict[str, PeriodRange]:
+        """First and last period available at the API per source, from the region statistics"""
+        available: dict[str, PeriodRange] = {}
+        meta_data = self.meta_data
+        if (
+            not isinstance(meta_data, CountryStats)
+            or self._model_name.lower() not in meta_data.regional_data_models
+        ):
+            return available
+        statistics = meta_data.statistics_for_data_model(model_name=self._model_name.lower())
+        for stats_region_type, stats in statistics.items():
+            if region_type is not None and stats_region_type != region_type:
+                continue
+            if period_type not in stats.period_type:
+                continue
+            for source in stats.source_names:
+                first, last = available.get(source, (stats.from_period, stats.to_period))
+                available[source] = (
+                    min(period_date(first), period_date(stats.from_period)),
+                    max(period_date(last), period_date(stats.to_period)),
+                )
+        return available
+
+    def _raise_for_sub_model(self):
+        if self._is_sub_model:
+            raise TypeError(
+                "Sub model data cannot be used to retrieve data. "
+                "Use the main model data object to make calls to The-Datagarden API"
+            )
+
+    def stream(self, max_workers: int = PAGE_FETCH_WORKERS, **kwargs) -> Iterator[RegionalDataRecord]:
+        """
+        Retrieve records from the API and yield them page by page.
+
+        Accepts the same parameters as calling the model. The records are not stored in
+        the model, so memory is bounded by the pages in flight (``max_workers``; use 1 to
+        hold a single page at a time).
+        """
+        for page_records in self._stream_pages(max_workers=max_workers, **kwargs):
+            yield from page_records
+
+    def stream_to_polars(
+        self, model_convertors: dict | None = None, max_workers: int = PAGE_FETCH_WORKERS, **kwargs
+    ) -> Iterator["pl.DataFrame"]:
+        """
+        Retrieve records from the API and yield a polars dataframe per page.
+        Columns are created as in ``to_polars(model_convertors)``.
+        """
+        for page_records in self._stream_pages(max_workers=max_workers, **kwargs):
+            yield self._records_to_polars(page_records, model_convertors)
+
+    def stream_full_model_to_polars(
+        self, max_workers: int = PAGE_FETCH_WORKERS, **kwargs
+    ) -> Iterator["pl.DataFrame"]:
+        """
+        Retrieve records from the API and yield a flattened polars dataframe per page.
+        Columns are created as in ``full_model_to_polars()``.
+        """
+        for page_resp in self._stream_responses(max_workers=max_workers, **kwargs):
+            yield regional_data_to_full_model_polars(page_resp, self._api.ingest_mode)
+
+    def _stream_pages(self, max_workers: int, **kwargs) -> Iterator[list[RegionalDataRecord]]:
+        for page_resp in self._stream_responses(max_workers=max_workers, **kwargs):
+            yield list(self._records_from_response(page_resp))
+
+    def _stream_responses(self, max_workers: int, **kwargs) -> Iterator[dict]:
+        self._raise_for_sub_model()
+        model_data_resp = self.regional_data_from_api(**kwargs)
+        if not model_data_resp:
+            return
+        # Only the pagination block is needed to retrieve the next pages
+        next_pages = self._next_pages_from_api(
+            {"pagination": model_data_resp.pop("pagination", None)}, max_workers=max_workers, **kwargs
+        )
+        yield model_data_resp
+        del model_data_resp
+        yield from next_pages
+
     def __getattr__(self, attribute: str) -> "TheDataGardenRegionalDataModel":
-        if attribute not in self._model.legends().sub_model_names:
+        """
+        Regional data of a sub model (e.g. ``demographics.population``). The sub model
+        data is a view on the records of this model; it is kept until new data is
+        retrieved for the model.
+        """
+        if attribute.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+        sub_model = sub_models(self._model).get(attribute)
+        if sub_model is None:
             raise ValueError(f"Attribute {attribute} is not a sub-model of {self._model_name}")
-        sub_model = getattr(self._model.legends(), attribute).model
+        if attribute not in self._sub_model_data:
+            self._sub_model_data[attribute] = self._regional_data_for_sub_model(attribute, sub_model)
+        return self._sub_model_data[attribute]
+
+    def _regional_data_for_sub_model(
+        self, attribute: str, sub_model: type[DataGardenSubModel]
+    ) -> "TheDataGardenRegionalDataModel":
         regional_data_for_attribute = TheDataGardenRegionalDataModel(
             api=self._api,
             model_name=attribute,
@@ -144,9 +372,12 @@ class TheDataGardenRegionalDataModel:
             is_sub_model=True,
             model=sub_model,
         )
-        regional_data_for_attribute._data_records = {
-            key: value.record_for_sub_model(attribute) for key, value in self._data_records.items()
-        }
+        if isinstance(self._data_records, ColumnarRecordStore):
+            regional_data_for_attribute._data_records = self._data_records.sub_model_store(
+                attribute, sub_model
+            )
+        else:
+            regional_data_for_attribute._data_records = SubModelRecords(self._data_records, attribute)
         return regional_data_for_attribute
 
     @property
@@ -157,39 +388,30 @@ class TheDataGardenRegionalDataModel:
         return getattr(self._model.legends(), attribute)
 
     def request_hash(self, **kwargs) -> str:
-        sorted_items = sorted(kwargs.items())
-        hash_str = ",".join(f"{k}:{v}" for k, v in sorted_items)
-        return str(hash(hash_str))
-
-    def _response_has_next_page(self, model_data_resp: dict) -> bool:
-        pagination = model_data_resp.get("pagination", None)
-        if not pagination:
-            return False
-        return pagination.get("next_page", None) is not None
-
-    def _next_page_pagination(self, model_data_resp: dict) -> dict | None:
-        pagination = model_data_resp.pop("pagination", None)
-        if not pagination:
-            return None
-        next_page = pagination.get("next_page", None)
-        if not next_page:
-            return None
-        return {"page": next_page}
-
-    def regional_paginated_data_from_api(self, **kwargs) -> dict:
+        return request_key(kwargs)
+
+    def regional_paginated_data_from_api(self, max_workers: int = PAGE_FETCH_WORKERS, **kwargs) -> dict:
         model_data_resp = self.regional_data_from_api(**kwargs)
         if not model_data_resp:
             return {}
-        while self._response_has_next_page(model_data_resp):
-            next_page_pagination = self._next_page_pagination(model_data_resp)
-            if next_page_pagination:
-                next_page_resp = self.regional_data_from_api(pagination=next_page_pagination, **kwargs)
-                if next_page_resp:
-                    model_data_resp["data_by_region"].extend(next_page_resp["data_by_region"])
-                    model_data_resp["pagination"] = next_page_resp["pagination"]
-
+        for next_page_resp in self._next_pages_from_api(model_data_resp, max_workers=max_workers, **kwargs):
+            model_data_resp["data_by_region"].extend(next_page_resp["data_by_region"])
+        model_data_resp.pop("pagination", None)
         return model_data_resp
 
+    def _next_pages_from_api(
+        self, model_data_resp: dict, max_workers: int = PAGE_FETCH_WORKERS, **kwargs
+    ) -> Iterator[dict]:
+        """
+        Retrieves the pages following the first response. When the first response tells
+        the total number of pages, the pages are fetched concurrently (in page order).
+        """
+        return fetch_next_pages(
+            fetch_page=lambda pagination: self.regional_data_from_api(pagination=pagination, **kwargs),
+            first_page_resp=model_data_resp,
+            max_workers=max_workers,
+        )
+
     def regional_data_from_api(self, **kwargs) -> dict:
         model_data_resp = self._api.retrieve_from_api(
             url_extension=self._region_url + "regional_data/",
@@ -197,38 +419,39 @@ class TheDataGardenRegionalDataModel:
             payload={"model": self._model_name, **kwargs},
         )
         if model_data_resp:
-            return model_data_resp.json()
+            return response_json(model_data_resp)
         return {}
 
     def set_items(self, data: dict):
-        for regional_data in data["data_by_region"]:
-            base_items = {
-                "name": regional_data.get("region_name", None),
-                "region_type": regional_data.get("region_type", None),
-                "un_region_code": regional_data.get("un_region_code", None),
-                "iso_cc_2": regional_data.get("iso_cc_2", None),
-                "local_region_code": regional_data.get("local_region_code", None),
-                "local_region_code_type": regional_data.get("local_region_code_type", None),
-                "parent_region_code": regional_data.get("parent_region_code", None),
-                "parent_region_code_type": regional_data.get("parent_region_code_type", None),
-                "parent_region_type": regional_data.get("parent_region_type", None),
-                "region_level": regional_data.get("region_level", 0),
-            }
-            data_for_region = regional_data["data_objects_for_region"]
-            data_records = [
-                RegionalDataRecord(**base_items, **self._record_items(data_obj))
-                for data_obj in data_for_region
-            ]
-            for data_record in data_records:
+        self._full_model_frame = None
+        self._sub_model_data = {}
+        if isinstance(self._data_records, SubModelRecords):
+            raise TypeError(
+                "Records cannot be added to sub model data, which is a view on the main model data"
+            )
+        if isinstance(self._data_records, ColumnarRecordStore):
+            # Responses are converted to columns without keeping records
+            self._data_records.add_regional_data(data, self._api.ingest_mode)
+        else:
+            for data_record in self._records_from_response(data):
                 self._data_records.update({data_record.record_hash(): data_record})
 
         if self._data_records:
-            _, first_record = list(self._data_records.items())[0]
+            first_record = next(iter(self._data_records.values()))
             model_name = first_record.data_model_name
             if not model_name:
                 raise ValueError("data_model_name is required")
             self._model_name = model_name
 
+    def _records_from_response(self, data: dict) -> Iterator[RegionalDataRecord]:
+        for regional_data in data["data_by_region"]:
+            base_items = region_fields(regional_data)
+            for data_obj in regional_data["data_objects_for_region"]:
+                if self._api.ingest_mode == "fast":
+                    yield construct_model(RegionalDataRecord, base_items | self._record_items(data_obj))
+                else:
+                    yield RegionalDataRecord(**base_items, **self._record_items(data_obj))
+
     def _record_items(self, data: dict):
         model_name = data.get("data_type", None)
         if not model_name:
@@ -237,80 +460,73 @@ class TheDataGardenRegionalDataModel:
         model = getattr(DatagardenModels, model_name.upper())
         if not model:
             raise ValueError(f"model {model_name} not found in DatagardenModels")
-        return {
-            "source_name": data.get("source_name", None),
-            "period": data.get("period", None),
-            "period_type": data.get("period_type", None),
-            "data_model_name": data.get("data_type", None),
-            "model": model(**data.get("data", {})),
+        return data_object_fields(data) | {
+            "model": (
+                construct_model(model, data.get("data", {}))
+                if self._api.ingest_mode == "fast"
+                else model(**data.get("data", {}))
+            ),
         }
 
-    def to_polars(self, model_convertors: dict | None = None) -> pl.DataFrame:
+    def to_polars(self, model_convertors: dict | None = None) -> "pl.DataFrame":
         """
         Convert the data to a polars dataframe using a dictionary of model attributes to convert to columns
         """
-        model_convertors = model_convertors or {}
-        converted_records = []
-        for record in self._data_records.values():
-            model = record.model
-            record_dict = record.model_dump()
-            record_dict.pop("model")
-
-            for new_col, model_attr in model_convertors.items():
-                # Handle nested attributes using split by dots
-                model_attr_flatten = "__flatten" in model_attr
-                model_attr = model_attr.replace("__flatten", "")
-                attrs = model_attr.split(".")
-                value = getattr(model, attrs[0])
-                for attr in attrs[1:]:
-                    value = getattr(value, attr, None)
-                if not value:
-                    continue
-                if model_attr_flatten:
-                    model_data = value.model_dump() if isinstance(value, BaseModel) else value
-                    record_dict.update(self.flatten_dict(model_data, {}))
-                else:
-                    record_dict[new_col] = value
-            converted_records.append(record_dict)
-        return pl.from_records(converted_records)
+        if isinstance(self._data_records, ColumnarRecordStore):
+            return self._data_records.to_polars(model_convertors)
+        return select_model_attributes(self.full_model_to_polars(), model_convertors)
 
-    def flatten_dict(self, dict_to_flatten: dict, flattened_dict: dict, prefix: str = "") -> dict:
-        for key, value in dict_to_flatten.items():
-            new_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                flattened_dict.update(self.flatten_dict(value, flattened_dict, new_key))
-            else:
-                flattened_dict[new_key] = value
+    def _records_to_polars(
+        self, records: Iterable[RegionalDataRecord], model_convertors: dict | None = None
+    ) -> "pl.DataFrame":
+        return records_to_polars(records, model_convertors)
 
+    def flatten_dict(self, dict_to_flatten: dict, flattened_dict: dict, prefix: str = "") -> dict:
+        flattened_dict.update(flatten_dict(dict_to_flatten, prefix))
         return flattened_dict
 
-    def full_model_to_polars(self):
+    def full_model_to_polars(self) -> "pl.DataFrame":
         """
-        Convert the data to a polars dataframe, flattening all nested dictionaries
+        Convert the data to a polars dataframe, flattening all nested dictionaries.
+        The dataframe is kept until new data is retrieved for the model.
         """
-        converted_records = []
-        for record in self._data_records.values():
-            # Get all fields from the record excluding the modeL
-            record_dict = record.model_dump(exclude={"model"})
-            # Model data is added as flattened dictionary
-            model_data = record.model.model_dump()
-            flattened_dict = self.flatten_dict(model_data, {})
-            record_dict.update(flattened_dict)
-            converted_records.append(record_dict)
-        return pl.from_records(converted_records)
-
-    def to_pandas(self, model_convertors: dict | None = None) -> pd.DataFrame:
+        if isinstance(self._data_records, ColumnarRecordStore):
+            return self._data_records.full_model_to_polars()
+        if self._full_model_frame is None:
+            self._full_model_frame = self._records_to_full_model_polars(self._data_records.values())
+        return self._full_model_frame.clone()
+
+    def _records_to_full_model_polars(self, records: Iterable[RegionalDataRecord]) -> "pl.DataFrame":
+        return records_to_full_model_polars(records)
+
+    def to_pandas(self, model_convertors: dict | None = None) -> "pd.DataFrame":
         """
         Convert the data to a pandas dataframe using a dictionary of model attributes to convert to columns
         """
         return self.to_polars(model_convertors).to_pandas()
 
-    def full_model_to_pandas(self) -> pd.DataFrame:
+    def full_model_to_pandas(self) -> "pd.DataFrame":
         """
         Convert the data to a pandas dataframe, flattening all nested dictionaries
         """
         return self.full_model_to_polars().to_pandas()
 
+    def save(self, path: str | Path, file_format: SnapshotFormat = "ipc"):
+        """
+        Save the records and request bookkeeping of the model as a snapshot directory with
+        an Arrow IPC (default) or Parquet file.
+        """
+        save_regional_data(self, path, file_format)
+
+    def load(self, path: str | Path) -> "TheDataGardenRegionalDataModel":
+        """
+        Load the records and request bookkeeping of a snapshot into the model. Requests
+        included in the snapshot are not sent to the API again.
+        """
+        self._raise_for_sub_model()
+        load_regional_data(self, path)
+        return self
+
     def __iter__(self):
         """Makes the class iterable over the values in _data_records"""
         return iter(self._data_records.values())
@@ -324,18 +540,23 @@ class TheDataGardenRegionalDataModel:
         return list(self._data_records.values())
 
     def regional_availability(self) -> dict[str, RegionalDataStats | None]:
-        availability_per_region = self.meta_data.statistics_for_data_model(model_name=self._model_name)
-        regional_availability = {}
-        for region_type in self.meta_data.region_types:
-            if region_type in availability_per_region.keys():
-                regional_availability[region_type] = availability_per_region[region_type]
-            else:
-                regional_availability[region_type] = None
-        return regional_availability
+        """
+        Statistics of the model per region type of the region, None for region types
+        without data. The availability is computed once from the region statistics.
+        """
+        if self._regional_availability is None:
+            availability_per_region = self.meta_data.statistics_for_data_model(
+                model_name=self._model_name.lower()
+            )
+            self._regional_availability = {
+                region_type: availability_per_region.get(region_type, None)
+                for region_type in self.meta_data.region_types
+            }
+        return self._regional_availability.copy()
 
     @property
     def regions_with_model_data(self) -> list[str]:
-        return [region for region in self.regional_availability() if self.regional_availability()[region]]
+        return [region for region, stats in self.regional_availability().items() if stats]
 
     def show_summary(self):
         """
@@ -353,8 +574,8 @@ class TheDataGardenRegionalDataModel:
         self,
         include_attributes: list[str] | None = None,
         exclude_attributes: list[str] | None = None,
-        filter_expr: pl.Expr | None = None,
-    ) -> pl.DataFrame:
+        filter_expr: "pl.Expr | None" = None,
+    ) -> "pl.DataFrame":
         df = self.full_model_to_polars()
         if df.is_empty():
             raise ValueError("No data loaded for this model. Data is needed to describe the model.")
@@ -371,8 +592,10 @@ class TheDataGardenRegionalDataModel:
         return df.select([col for col in df.columns if col not in attributes_to_exclude]).describe()
 
     def data_availability_per_attribute(
-        self, include_attributes: list[str] | None = None, filter_expr: pl.Expr | None = None
+        self, include_attributes: list[str] | None = None, filter_expr: "pl.Expr | None" = None
     ):
+        import polars as pl
+
         if include_attributes:
             describe_df = self.describe(include_attributes=include_attributes, filter_expr=filter_expr)
         else:
@@ -389,7 +612,7 @@ class TheDataGardenRegionalDataModel:
         return describe_df
 
     def show_data_availability_per_attribute(
-        self, include_attributes: list[str] | None = None, filter_expr: pl.Expr | None = None
+        self, include_attributes: list[str] | None = None, filter_expr: "pl.Expr | None" = None
     ):
         describe_df = self.data_availability_per_attribute(include_attributes, filter_expr)
         stats_by_column = {
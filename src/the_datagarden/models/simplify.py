@@ -0,0 +1,141 @@
+"""
+Simplification and precision reduction of packed GeoJSON coordinates.
+
+Lines and rings are simplified with Douglas-Peucker or Visvalingam-Whyatt over the
+numpy position arrays of ``PackedCoordinates``; distances and triangle areas are
+computed vectorized per segment or per pass. Coordinates can then be quantized to a
+number of decimals, which removes positions that collapse onto their predecessor.
+
+Closed rings keep at least four positions, so simplified polygons stay valid; rings
+that would collapse are left unsimplified.
+
+Example:
+    >>> coordinates = PackedCoordinates.from_list([[0, 0], [1, 0.01], [2, 0]])
+    >>> simplify_coordinates(coordinates, tolerance=0.1).to_list()
+    [[0.0, 0.0], [2.0, 0.0]]
+"""
+
+from typing import TYPE_CHECKING, Literal
+
+from .geometry import PackedCoordinates
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SimplifyMethod = Literal["douglas_peucker", "visvalingam"]
+MIN_RING_POSITIONS = 4
+
+
+def _segment_distances(points: "np.ndarray", start: "np.ndarray", end: "np.ndarray") -> "np.ndarray":
+    """Distances of points to the segment from start to end"""
+    import numpy as np
+
+    segment = end - start
+    length_squared = float(segment @ segment)
+    if length_squared == 0.0:
+        return np.hypot(*(points - start).T)
+    fraction = np.clip((points - start) @ segment / length_squared, 0.0, 1.0)
+    return np.hypot(*(points - start - fraction[:, None] * segment).T)
+
+
+def douglas_peucker_mask(points: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """Positions kept by Douglas-Peucker: points further than ``tolerance`` from the simplified line"""
+    import numpy as np
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    segments = [(0, len(points) - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+        distances = _segment_distances(points[start + 1 : end, :2], points[start, :2], points[end, :2])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            segments.extend([(start, split), (split, end)])
+    return keep
+
+
+def visvalingam_mask(points: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """
+    Positions kept by Visvalingam-Whyatt: points with an effective triangle area below
+    ``tolerance ** 2`` are removed, smallest areas first. Each pass removes all
+    non-adjacent points whose area is a local minimum.
+    """
+    import numpy as np
+
+    min_area = tolerance**2
+    kept = np.arange(len(points))
+    while len(kept) > 2:
+        positions = points[kept, :2]
+        to_previous = positions[:-2] - positions[1:-1]
+        to_following = positions[2:] - positions[1:-1]
+        areas = 0.5 * np.abs(to_previous[:, 0] * to_following[:, 1] - to_previous[:, 1] * to_following[:, 0])
+        candidates = areas < min_area
+        if not candidates.any():
+            break
+        neighbours = np.concatenate(([np.inf], areas, [np.inf]))
+        minima = candidates & (areas <= neighbours[:-2]) & (areas < neighbours[2:])
+        if not minima.any():
+            minima[np.argmin(np.where(candidates, areas, np.inf))] = True
+        kept = np.delete(kept, np.flatnonzero(minima) + 1)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[kept] = True
+    return keep
+
+
+def _simplify_part(
+    points: "np.ndarray", tolerance: float, method: SimplifyMethod, precision: int | None
+) -> "np.ndarray":
+    import numpy as np
+
+    closed = len(points) >= MIN_RING_POSITIONS and np.array_equal(points[0], points[-1])
+    min_positions = MIN_RING_POSITIONS if closed else 2
+    simplified = points
+    if tolerance > 0 and len(points) > min_positions:
+        mask_function = douglas_peucker_mask if method == "douglas_peucker" else visvalingam_mask
+        simplified = points[mask_function(points, tolerance)]
+    if precision is not None:
+        simplified = np.round(simplified, precision)
+        repeated = np.concatenate(([False], (simplified[1:] == simplified[:-1]).all(axis=1)))
+        repeated[-1] = False
+        simplified = simplified[~repeated]
+    if len(simplified) < min_positions:
+        return np.round(points, precision) if precision is not None else points
+    return simplified
+
+
+def simplify_coordinates(
+    coordinates: PackedCoordinates,
+    tolerance: float = 0.0,
+    method: SimplifyMethod = "douglas_peucker",
+    precision: int | None = None,
+    lines: bool = True,
+) -> PackedCoordinates:
+    """
+    Simplify the lines and rings of packed coordinates and round them to ``precision``
+    decimals.
+
+    Args:
+        coordinates: Packed coordinates of a geometry.
+        tolerance: Simplification tolerance in coordinate units (degrees for the API
+            geometries). 0 only applies the precision.
+        method: ``"douglas_peucker"`` or ``"visvalingam"``.
+        precision: Number of decimals of the coordinates, None to keep the precision.
+        lines: False for points (Point, MultiPoint), which are only rounded.
+    """
+    import numpy as np
+
+    if method not in ("douglas_peucker", "visvalingam"):
+        raise ValueError(f"Unknown simplification method '{method}'")
+    if not lines:
+        coords = np.round(coordinates.coords, precision) if precision is not None else coordinates.coords
+        return PackedCoordinates(coords, coordinates.offsets, coordinates.depth)
+    parts = [_simplify_part(part, tolerance, method, precision) for part in coordinates.rings()]
+    coords = np.concatenate(parts) if parts else coordinates.coords
+    if coordinates.depth < 2:
+        return PackedCoordinates(coords, (), coordinates.depth)
+    part_offsets = np.concatenate(([0], np.cumsum([len(part) for part in parts], dtype=np.int64)))
+    return PackedCoordinates(coords, (*coordinates.offsets[:-1], part_offsets), coordinates.depth)
@@ -0,0 +1,219 @@
+"""
+Binary snapshots of regional data and geojson models.
+
+A snapshot is a directory with the records of a model in one Arrow IPC (default) or
+Parquet file and a ``snapshot.json`` file with the bookkeeping of the model: the
+request hashes of a regional data model and the requested levels of a geojson
+model. Loading a snapshot restores the records and bookkeeping without calls to the
+API and without validating the records again.
+
+Regional data records are stored as the flattened columns of ``full_model_to_polars()``
+with a ``record_hash`` column; loaded records are kept in a ``ColumnarRecordStore``.
+Uncompressed IPC files are memory mapped by polars on load. GeoJSON geometries are
+stored as their packed coordinates (see ``PackedCoordinates``).
+
+Example:
+    >>> demographics.save("snapshots/nl-demographics")
+    >>> the_datagarden_api.netherlands.demographics.load("snapshots/nl-demographics")
+"""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from .columnar import RECORD_HASH_COLUMN, ColumnarRecordStore
+from .geometry import PackedCoordinates
+from .ingest import construct_model
+
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    from .geojson import TheDataGardenRegionGeoJSONModel
+    from .regional_data import TheDataGardenRegionalDataModel
+
+SnapshotFormat = Literal["ipc", "parquet"]
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = "snapshot.json"
+RECORDS_FILES = {"ipc": "records.arrow", "parquet": "records.parquet"}
+REGIONAL_DATA = "regional_data"
+GEOJSON = "geojson"
+GEOMETRY_COLUMNS = ["geometry_type", "coords", "dimensions", "depth", "offsets"]
+
+
+def _write_snapshot(path: str | Path, frame: "pl.DataFrame", file_format: SnapshotFormat, bookkeeping: dict):
+    if file_format not in RECORDS_FILES:
+        raise ValueError(f"file_format should be one of {list(RECORDS_FILES)}, not '{file_format}'")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    records_file = path / RECORDS_FILES[file_format]
+    if file_format == "ipc":
+        # Uncompressed, so the file can be memory mapped on load
+        frame.write_ipc(records_file, compression="uncompressed")
+    else:
+        frame.write_parquet(records_file)
+    snapshot = {"version": SNAPSHOT_VERSION, "file_format": file_format, **bookkeeping}
+    (path / SNAPSHOT_FILE).write_text(json.dumps(snapshot))
+
+
+def _read_snapshot(path: str | Path, model_type: str) -> tuple["pl.DataFrame", dict]:
+    import polars as pl
+
+    path = Path(path)
+    snapshot = json.loads((path / SNAPSHOT_FILE).read_text())
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"{path} is a snapshot of version {snapshot.get('version')}, "
+            f"only snapshots of version {SNAPSHOT_VERSION} can be loaded"
+        )
+    if snapshot.get("model_type") != model_type:
+        raise ValueError(f"{path} is not a snapshot of a {model_type} model")
+    records_file = path / RECORDS_FILES[snapshot["file_format"]]
+    if snapshot["file_format"] == "ipc":
+        return pl.read_ipc(records_file), snapshot
+    return pl.read_parquet(records_file), snapshot
+
+
+def save_regional_data(
+    model: "TheDataGardenRegionalDataModel", path: str | Path, file_format: SnapshotFormat = "ipc"
+):
+    if isinstance(model._data_records, ColumnarRecordStore):
+        store = model._data_records
+    else:
+        store = ColumnarRecordStore(model=model._model)
+        store.update(model._data_records)
+    bookkeeping = {
+        "model_type": REGIONAL_DATA,
+        "model_name": model._model_name,
+        "request_params_hashes": model._request_params_hashes,
+    }
+    _write_snapshot(path, store.frame, file_format, bookkeeping)
+
+
+def load_regional_data(model: "TheDataGardenRegionalDataModel", path: str | Path):
+    frame, snapshot = _read_snapshot(path, REGIONAL_DATA)
+    if snapshot["model_name"].lower() != model._model_name.lower():
+        raise ValueError(f"{path} is a snapshot of {snapshot['model_name']}, not of {model._model_name}")
+    store = model._data_records
+    if not store:
+        # The records of a snapshot are unique, so the frame is the store
+        store = ColumnarRecordStore.from_frame(frame)
+    else:
+        if not isinstance(store, ColumnarRecordStore):
+            records = store
+            store = ColumnarRecordStore()
+            store.update(records)
+        if not frame.is_empty():
+            store.add_frame(frame)
+    model._data_records = store
+    model._full_model_frame = None
+    model._sub_model_data = {}
+    model._model_name = snapshot["model_name"]
+    for request_hash in snapshot["request_params_hashes"]:
+        if request_hash not in model._request_params_hashes:
+            model._request_params_hashes.append(request_hash)
+
+
+def save_geojson(
+    model: "TheDataGardenRegionGeoJSONModel", path: str | Path, file_format: SnapshotFormat = "ipc"
+):
+    import polars as pl
+
+    from .geojson import RegionGeoJSONDataRecord
+
+    record_fields = list(RegionGeoJSONDataRecord.model_fields)
+    record_fields.remove("feature")
+    records = list(model._geojson_records.items())
+    geometries = [record.feature.geometry for _, record in records]
+    frame = pl.DataFrame(
+        {
+            RECORD_HASH_COLUMN: [record_hash for record_hash, _ in records],
+            **{field: [getattr(record, field) for _, record in records] for field in record_fields},
+            "geometry_type": [geometry.type for geometry in geometries],
+            # Geometries of equal size would otherwise become a fixed size array column
+            "coords": pl.Series(
+                [geometry.coordinates.coords.ravel() for geometry in geometries], dtype=pl.List(pl.Float64)
+            ).cast(pl.List(pl.Float64)),
+            "dimensions": [geometry.coordinates.coords.shape[1] for geometry in geometries],
+            "depth": [geometry.coordinates.depth for geometry in geometries],
+            "offsets": pl.Series(
+                [[offsets.tolist() for offsets in geometry.coordinates.offsets] for geometry in geometries],
+                dtype=pl.List(pl.List(pl.Int64)),
+            ),
+        }
+    )
+    bookkeeping = {"model_type": GEOJSON, "levels_requested": model._levels_requested}
+    _write_snapshot(path, frame, file_format, bookkeeping)
+
+
+def _list_buffer(column: "pl.Series") -> tuple["np.ndarray", list[int], list[int]]:
+    """
+    Values of all lists of a list column in one array, with the start and end of the
+    values of each row. Empty lists are left out, as ``explode()`` turns them into a null.
+    """
+    lengths = column.list.len()
+    buffer = column.filter(lengths > 0).explode().to_numpy()
+    ends = lengths.cum_sum().to_list()
+    return buffer, [0, *ends[:-1]], ends
+
+
+def load_geojson(model: "TheDataGardenRegionGeoJSONModel", path: str | Path):
+    from .geojson import Feature, RegionGeoJSONDataRecord
+
+    frame, snapshot = _read_snapshot(path, GEOJSON)
+    if not frame.is_empty():
+        # The coordinates and the offsets of all geometries are each read into one
+        # buffer; the packed coordinates of the geometries are views on them
+        coords_buffer, coords_starts, coords_ends = _list_buffer(frame.get_column("coords"))
+        offsets = frame.get_column("offsets")
+        # One row per offsets level of all geometries
+        offsets_buffer, offsets_starts, offsets_ends = _list_buffer(
+            offsets.filter(offsets.list.len() > 0).explode()
+        )
+        _, levels_starts, levels_ends = _list_buffer(offsets)
+        properties_columns = [
+            column
+            for column in frame.columns
+            if column not in GEOMETRY_COLUMNS and column != RECORD_HASH_COLUMN
+        ]
+        geometries = zip(
+            frame.get_column("geometry_type").to_list(),
+            frame.get_column("dimensions").to_list(),
+            frame.get_column("depth").to_list(),
+            coords_starts,
+            coords_ends,
+            levels_starts,
+            levels_ends,
+            strict=True,
+        )
+        records = zip(
+            frame.get_column(RECORD_HASH_COLUMN).to_list(),
+            frame.select(properties_columns).to_dicts(),
+            geometries,
+            strict=True,
+        )
+        for record_hash, properties, geometry in records:
+            geometry_type, dimensions, depth, coords_start, coords_end, levels_start, levels_end = geometry
+            packed_coordinates = PackedCoordinates(
+                coords_buffer[coords_start:coords_end].reshape(-1, dimensions),
+                tuple(
+                    offsets_buffer[offsets_starts[level] : offsets_ends[level]]
+                    for level in range(levels_start, levels_end)
+                ),
+                depth,
+            )
+            feature = construct_model(
+                Feature,
+                {
+                    "properties": properties,
+                    "geometry": {"type": geometry_type, "coordinates": packed_coordinates},
+                },
+            )
+            model._geojson_records[record_hash] = construct_model(
+                RegionGeoJSONDataRecord, properties | {"feature": feature}
+            )
+    model._spatial_indexes = {}
+    model._simplified_features = {}
+    for level in snapshot["levels_requested"]:
+        if level not in model._levels_requested:
+            model._levels_requested.append(level)
@@ -0,0 +1,222 @@
+"""
+Spatial index for point in polygon lookups on packed GeoJSON geometries.
+
+``SpatialIndex`` indexes the bounding boxes of the polygons of a list of (Multi)Polygon
+geometries in an R-tree packed with the Sort-Tile-Recursive (STR) algorithm. Points
+are located in bulk:
+
+1. All points are pushed down the tree level by level. Each step is one vectorized
+   bounding box test on (point, node) pairs.
+2. The candidate geometries are refined with an even-odd (ray casting) test. Edges
+   are bucketed in horizontal bands per geometry, so a point is only tested against
+   the edges in its band.
+
+Example:
+    >>> index = SpatialIndex([feature.geometry.coordinates for feature in features])
+    >>> index.locate(np.array([5.1, 4.9]), np.array([52.1, 52.3]))
+    array([ 3, -1])
+"""
+
+from typing import TYPE_CHECKING, Sequence
+
+from .geometry import PackedCoordinates
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NODE_CAPACITY = 16
+EDGES_PER_BAND = 4
+POINTS_PER_CHUNK = 65_536
+
+
+def _ranges(starts: "np.ndarray", counts: "np.ndarray") -> "np.ndarray":
+    """Concatenated ranges ``starts[i]:starts[i] + counts[i]``"""
+    import numpy as np
+
+    total = int(counts.sum())
+    range_starts = np.cumsum(counts) - counts
+    return np.repeat(starts - range_starts, counts) + np.arange(total)
+
+
+def _str_order(bounds: "np.ndarray", node_capacity: int) -> "np.ndarray":
+    """Sort-Tile-Recursive order: vertical slices by x center, sorted by y center within a slice"""
+    import numpy as np
+
+    node_count = -(-len(bounds) // node_capacity)
+    slice_size = node_capacity * int(np.ceil(np.sqrt(node_count)))
+    x_order = np.argsort(bounds[:, 0] + bounds[:, 2], kind="stable")
+    slices = np.arange(len(bounds)) // slice_size
+    y_centers = (bounds[:, 1] + bounds[:, 3])[x_order]
+    return x_order[np.lexsort((y_centers, slices))]
+
+
+class _EdgeBands:
+    """Edges of the rings of a geometry bucketed in horizontal bands"""
+
+    def __init__(self, coordinates: PackedCoordinates):
+        import numpy as np
+
+        coords = coordinates.coords[:, :2]
+        ring_ends = coordinates.offsets[-1][1:] - 1
+        is_edge = np.ones(max(len(coords) - 1, 0), dtype=bool)
+        is_edge[ring_ends[ring_ends < len(is_edge)]] = False
+        starts, ends = coords[:-1][is_edge], coords[1:][is_edge]
+        not_horizontal = starts[:, 1] != ends[:, 1]
+        self.edges = np.column_stack([starts[not_horizontal], ends[not_horizontal]])
+
+        y_min = float(self.edges[:, [1, 3]].min(initial=np.inf))
+        y_max = float(self.edges[:, [1, 3]].max(initial=-np.inf))
+        self.y_min = y_min if np.isfinite(y_min) else 0.0
+        self.band_count = max(1, len(self.edges) // EDGES_PER_BAND)
+        self.band_height = (y_max - y_min) / self.band_count if np.isfinite(y_min) and y_max > y_min else 1.0
+        low_bands = self.bands(self.edges[:, [1, 3]].min(axis=1))
+        high_bands = self.bands(self.edges[:, [1, 3]].max(axis=1))
+        spans = high_bands - low_bands + 1
+        edge_bands = _ranges(low_bands, spans)
+        order = np.argsort(edge_bands, kind="stable")
+        self.band_edges = np.repeat(np.arange(len(self.edges)), spans)[order]
+        self.band_sizes = np.bincount(edge_bands, minlength=self.band_count)
+
+    def bands(self, y: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        bands = np.floor((y - self.y_min) / self.band_height).astype(np.int64)
+        return np.clip(bands, 0, self.band_count - 1)
+
+
+class SpatialIndex:
+    """
+    STR packed R-tree over the polygons of (Multi)Polygon geometries.
+
+    Args:
+        geometries: Packed coordinates of Polygon or MultiPolygon geometries.
+        node_capacity: Number of children per node of the tree.
+    """
+
+    def __init__(self, geometries: Sequence[PackedCoordinates], node_capacity: int = NODE_CAPACITY):
+        import numpy as np
+
+        self._geometries = list(geometries)
+        self._node_capacity = node_capacity
+
+        part_bounds, part_geometries = [], []
+        for geometry_index, coordinates in enumerate(self._geometries):
+            for part in self._polygons(coordinates):
+                if len(part):
+                    part_bounds.append([*part.min(axis=0)[:2], *part.max(axis=0)[:2]])
+                    part_geometries.append(geometry_index)
+        bounds = np.array(part_bounds, dtype=np.float64).reshape(-1, 4)
+        order = _str_order(bounds, node_capacity) if len(bounds) else np.arange(0)
+        self._leaf_geometries = np.array(part_geometries, dtype=np.int64)[order]
+        # Levels of node bounds, leaves first; node i of a level covers nodes
+        # i * node_capacity up to (i + 1) * node_capacity of the level below
+        self._levels = [bounds[order]]
+        while len(self._levels[-1]) > node_capacity:
+            child_bounds = self._levels[-1]
+            starts = np.arange(0, len(child_bounds), node_capacity)
+            self._levels.append(
+                np.column_stack(
+                    [
+                        np.minimum.reduceat(child_bounds[:, 0], starts),
+                        np.minimum.reduceat(child_bounds[:, 1], starts),
+                        np.maximum.reduceat(child_bounds[:, 2], starts),
+                        np.maximum.reduceat(child_bounds[:, 3], starts),
+                    ]
+                )
+            )
+
+        # Edge bands of all geometries; the bands of geometry g are numbered from
+        # band_offsets[g] and hold edge numbers of the concatenated edges
+        edge_bands = [_EdgeBands(coordinates) for coordinates in self._geometries]
+        edge_offsets = np.cumsum([0, *(len(bands.edges) for bands in edge_bands)])
+        self._band_offsets = np.cumsum([0, *(bands.band_count for bands in edge_bands)])[:-1]
+        self._band_counts = np.array([bands.band_count for bands in edge_bands], dtype=np.int64)
+        self._y_min = np.array([bands.y_min for bands in edge_bands], dtype=np.float64)
+        self._band_heights = np.array([bands.band_height for bands in edge_bands], dtype=np.float64)
+        self._edges = np.concatenate([bands.edges for bands in edge_bands] or [np.empty((0, 4))])
+        self._band_edges = np.concatenate(
+            [bands.band_edges + offset for bands, offset in zip(edge_bands, edge_offsets, strict=False)]
+            or [np.empty(0, dtype=np.int64)]
+        )
+        band_sizes = np.concatenate(
+            [bands.band_sizes for bands in edge_bands] or [np.empty(0, dtype=np.int64)]
+        )
+        self._band_starts = np.concatenate(([0], np.cumsum(band_sizes)))
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    @staticmethod
+    def _polygons(coordinates: PackedCoordinates) -> list["np.ndarray"]:
+        """Positions of the polygons of a geometry"""
+        if coordinates.depth < 3:
+            return [coordinates.coords]
+        polygon_offsets, ring_offsets = coordinates.offsets[0].tolist(), coordinates.offsets[1]
+        return [
+            coordinates.coords[ring_offsets[start] : ring_offsets[end]]
+            for start, end in zip(polygon_offsets[:-1], polygon_offsets[1:], strict=True)
+        ]
+
+    def candidates(self, x: "np.ndarray", y: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+        """(point, geometry) pairs of points in the bounding box of a polygon of the geometry"""
+        import numpy as np
+
+        top_level = self._levels[-1]
+        points = np.repeat(np.arange(len(x)), len(top_level))
+        nodes = np.tile(np.arange(len(top_level)), len(x))
+        for level in range(len(self._levels) - 1, -1, -1):
+            level_bounds = self._levels[level]
+            if level < len(self._levels) - 1:
+                first_children = nodes * self._node_capacity
+                counts = np.minimum(first_children + self._node_capacity, len(level_bounds)) - first_children
+                points = np.repeat(points, counts)
+                nodes = _ranges(first_children, counts)
+            node_bounds = level_bounds[nodes]
+            inside = (
+                (x[points] >= node_bounds[:, 0])
+                & (x[points] <= node_bounds[:, 2])
+                & (y[points] >= node_bounds[:, 1])
+                & (y[points] <= node_bounds[:, 3])
+            )
+            points, nodes = points[inside], nodes[inside]
+        return points, self._leaf_geometries[nodes]
+
+    def contains(self, x: "np.ndarray", y: "np.ndarray", geometries: "np.ndarray") -> "np.ndarray":
+        """Whether each point lies in the geometry (by index) of the point"""
+        import numpy as np
+
+        local_bands = np.floor((y - self._y_min[geometries]) / self._band_heights[geometries])
+        local_bands = np.clip(local_bands.astype(np.int64), 0, self._band_counts[geometries] - 1)
+        bands = self._band_offsets[geometries] + local_bands
+        counts = self._band_starts[bands + 1] - self._band_starts[bands]
+        pairs = np.repeat(np.arange(len(x)), counts)
+        x1, y1, x2, y2 = self._edges[self._band_edges[_ranges(self._band_starts[bands], counts)]].T
+        px, py = x[pairs], y[pairs]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings = ((y1 > py) != (y2 > py)) & (px < x1 + (py - y1) * (x2 - x1) / (y2 - y1))
+        return np.bincount(pairs[crossings], minlength=len(x)) % 2 == 1
+
+    def locate(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        """
+        Index of the geometry containing each point, -1 for points outside all geometries.
+        Points in overlapping geometries get the first geometry.
+        """
+        import numpy as np
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        located = np.full(len(x), -1, dtype=np.int64)
+        if not len(self._geometries):
+            return located
+        geometry_count = len(self._geometries)
+        for chunk_start in range(0, len(x), POINTS_PER_CHUNK):
+            chunk_x = x[chunk_start : chunk_start + POINTS_PER_CHUNK]
+            chunk_y = y[chunk_start : chunk_start + POINTS_PER_CHUNK]
+            points, geometries = self.candidates(chunk_x, chunk_y)
+            # Points in the bounding box of several polygons of a geometry are tested once
+            pairs = np.unique(points * geometry_count + geometries)
+            points, geometries = pairs // geometry_count, pairs % geometry_count
+            inside = self.contains(chunk_x[points], chunk_y[points], geometries)
+            points, first = np.unique(points[inside], return_index=True)
+            located[chunk_start + points] = geometries[inside][first]
+        return located
@@ -0,0 +1,105 @@
+"""
+Incremental synchronisation of regional data.
+
+``missing_period_windows`` compares the periods of the records already loaded in a
+model with the periods available at the API (from the region statistics) and returns
+the request parameters for the periods that are still missing, per source:
+
+- periods after the last loaded period (the last loaded period itself is requested
+  again, as the most recent figures are the ones that get revised);
+- periods before the first loaded period, when ``period_from`` asks for them;
+- the whole requested range for sources without loaded records.
+
+Sources with the same missing window are combined in one request. Gaps between the
+first and last loaded period of a source are not detected.
+
+Example:
+    >>> missing_period_windows(
+    ...     loaded={"Eurostat": ("2015-01-01", "2022-01-01")},
+    ...     available={"Eurostat": ("2010-01-01", "2023-01-01"), "CBS": ("2010-01-01", "2023-01-01")},
+    ...     period_from="2015-01-01",
+    ... )
+    [{'source': ['Eurostat'], 'period_from': '2022-01-01'}, {'source': ['CBS'], 'period_from': '2015-01-01'}]
+"""
+
+from datetime import date
+from typing import Any, overload
+
+PeriodRange = tuple[str, str]
+
+
+@overload
+def period_date(period: str | date) -> str: ...
+
+
+@overload
+def period_date(period: None) -> None: ...
+
+
+def period_date(period: str | date | None) -> str | None:
+    """Date part (``YYYY-MM-DD``) of a period, period bound or datetime"""
+    if period is None:
+        return None
+    if isinstance(period, date):
+        return period.isoformat()[:10]
+    return str(period)[:10]
+
+
+def missing_period_windows(
+    loaded: dict[str, PeriodRange],
+    available: dict[str, PeriodRange],
+    period_from: str | date | None = None,
+    period_to: str | date | None = None,
+    sources: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Request parameters (``source``, ``period_from`` and ``period_to``) for the periods
+    missing in the loaded records.
+
+    Args:
+        loaded: First and last loaded period per source.
+        available: First and last period available at the API per source. Periods of
+            sources missing here are assumed to be available.
+        period_from: Start of the requested periods; None for the API default.
+        period_to: End of the requested periods; None for the API default.
+        sources: Sources to synchronise; all available and loaded sources when not set.
+            Without any known source the whole requested range is returned.
+    """
+    period_from, period_to = period_date(period_from), period_date(period_to)
+    sources = sources or list(dict.fromkeys([*available, *loaded]))
+    if not sources:
+        return [_request_params(period_from, period_to)]
+    windows: dict[tuple[str | None, str | None], list[str]] = {}
+    for source in sources:
+        loaded_from, loaded_to = (period_date(period) for period in loaded.get(source, (None, None)))
+        available_from, available_to = (period_date(period) for period in available.get(source, (None, None)))
+        if loaded_from is None or loaded_to is None:
+            if _overlaps(period_from, period_to, available_from, available_to):
+                windows.setdefault((period_from, period_to), []).append(source)
+            continue
+        has_newer_periods = available_to is None or available_to > loaded_to
+        if has_newer_periods and (period_to is None or period_to > loaded_to):
+            windows.setdefault((loaded_to, period_to), []).append(source)
+        has_older_periods = available_from is None or available_from < loaded_from
+        if has_older_periods and period_from is not None and period_from < loaded_from:
+            windows.setdefault((period_from, loaded_from), []).append(source)
+
+    return [
+        {"source": window_sources, **_request_params(window_from, window_to)}
+        for (window_from, window_to), window_sources in windows.items()
+    ]
+
+
+def _request_params(period_from: str | None, period_to: str | None) -> dict[str, Any]:
+    params = {"period_from": period_from, "period_to": period_to}
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _overlaps(
+    period_from: str | None, period_to: str | None, available_from: str | None, available_to: str | None
+) -> bool:
+    if period_from is not None and available_to is not None and available_to < period_from:
+        return False
+    if period_to is not None and available_from is not None and available_from > period_to:
+        return False
+    return True
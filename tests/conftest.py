@@ -0,0 +1,222 @@
+"""
+Fakes and factories shared by the tests
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+import jwt
+import pytest
+from datagarden_models import DatagardenModels
+from requests import Response
+
+from the_datagarden.abc.authentication import BaseDataGardenCredentials, DatagardenEnvironment
+from the_datagarden.models.regional_data import RegionalDataRecord
+
+POLYGON = [[[4.0, 52.0], [5.0, 52.0], [5.0, 53.0], [4.0, 52.0]]]
+
+
+class FakeCredentials(BaseDataGardenCredentials):
+    @classmethod
+    def credentials(cls, the_datagarden_api_url: str, email: str | None = None, password: str | None = None):
+        return {"email": email, "password": password}
+
+
+class FakeEnvironment(DatagardenEnvironment):
+    CREDENTIALS = FakeCredentials
+    THE_DATAGARDEN_URL = "https://test.the-datagarden.io"
+    ECHO_INIT = False
+
+
+class MirrorEnvironment(FakeEnvironment):
+    THE_DATAGARDEN_URL = "https://mirror.the-datagarden.io"
+
+
+def json_response(body: dict, status_code: int = 200) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+class FakeApiSession:
+    """
+    Session answering token requests (``token`` and ``refresh``) with access tokens that
+    live ``token_life_time`` seconds, the endpoints in ``results`` with a single page of
+    results and the endpoints in ``bodies`` with the body returned for the payload of the
+    request. The status code of an endpoint can be set in ``status_codes``. Requests wait
+    for ``release`` (when set) before they are answered.
+    """
+
+    def __init__(
+        self,
+        results: dict[str, list[dict]] | None = None,
+        bodies: dict[str, Callable[[dict | None], dict]] | None = None,
+        token_life_time: float = 300,
+        status_codes: dict[str, int] | None = None,
+        release: threading.Event | None = None,
+    ):
+        self.results = results or {}
+        self.bodies = bodies or {}
+        self.token_life_time = token_life_time
+        self.status_codes = status_codes or {}
+        self.release = release
+        self.requests: list[tuple[str, dict | None]] = []
+        self.request_threads: set[int] = set()
+        self.in_flight = self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> list[str]:
+        return [endpoint for endpoint, _ in self.requests]
+
+    def request(self, method: str, url: str, headers: dict | None = None, data: str | None = None, **kwargs):
+        endpoint = url.rstrip("/").rsplit("/", 1)[-1]
+        payload = kwargs.get("json") or (json.loads(data) if data else None)
+        with self._lock:
+            self.requests.append((endpoint, payload))
+            self.request_threads.add(threading.get_ident())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            count = len(self.requests)
+        try:
+            if self.release:
+                self.release.wait(timeout=10)
+            return self._response(endpoint, payload, count)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _response(self, endpoint: str, payload: dict | None, count: int) -> Response:
+        status_code = self.status_codes.get(endpoint, 200)
+        if status_code != 200:
+            return json_response({"detail": f"{endpoint} failed"}, status_code)
+        if endpoint in self.results:
+            return json_response({"results": self.results[endpoint], "next": None})
+        if endpoint in self.bodies:
+            return json_response(self.bodies[endpoint](payload))
+        access = jwt.encode({"exp": time.time() + self.token_life_time, "n": count}, "secret" * 6)
+        return json_response({"access": access, "refresh": f"refresh-{count}"})
+
+
+@pytest.fixture
+def environment() -> type[DatagardenEnvironment]:
+    return FakeEnvironment
+
+
+@pytest.fixture
+def mirror_environment() -> type[DatagardenEnvironment]:
+    return MirrorEnvironment
+
+
+@pytest.fixture
+def api_session() -> type[FakeApiSession]:
+    """Factory of fake sessions of the API"""
+    return FakeApiSession
+
+
+@pytest.fixture
+def model_api() -> SimpleNamespace:
+    """The settings of an API object used by the models"""
+    return SimpleNamespace(columnar=False, ingest_mode="strict")
+
+
+@pytest.fixture
+def regional_record() -> Callable[..., RegionalDataRecord]:
+    """Factory of demographics records of a province"""
+
+    def regional_record(
+        local_region_code: str = "NL31",
+        period: str = "2021-01-01T00:00:00Z",
+        total: float = 100.0,
+        ages: dict | None = None,
+        **fields,
+    ) -> RegionalDataRecord:
+        population = {"total": total, "by_age_gender": {"age": {"male": ages}}} if ages else {"total": total}
+        record = {
+            "name": local_region_code,
+            "region_type": "province",
+            "iso_cc_2": "NL",
+            "local_region_code": local_region_code,
+            "region_level": 2,
+            "period": period,
+            "period_type": "Y",
+            "source_name": "Eurostat",
+            "data_model_name": "Demographics",
+            "model": DatagardenModels.DEMOGRAPHICS(population=population),
+        }
+        return RegionalDataRecord(**(record | fields))
+
+    return regional_record
+
+
+@pytest.fixture
+def regional_data_response() -> Callable[..., dict]:
+    """Factory of responses of the regional data endpoint with a demographics record per period"""
+
+    def regional_data_response(
+        totals: dict[str, float], local_region_code: str = "NL31", pagination: dict | None = None
+    ) -> dict:
+        data_objects = [
+            {
+                "data_type": "Demographics",
+                "source_name": "Eurostat",
+                "period": period,
+                "period_type": "Y",
+                "data": {"population": {"total": total}},
+            }
+            for period, total in totals.items()
+        ]
+        region = {
+            "region_name": local_region_code,
+            "region_type": "province",
+            "iso_cc_2": "NL",
+            "local_region_code": local_region_code,
+            "region_level": 2,
+            "data_objects_for_region": data_objects,
+        }
+        return {"data_by_region": [region], "pagination": pagination}
+
+    return regional_data_response
+
+
+@pytest.fixture
+def statistics_response() -> dict:
+    """Response of the statistics endpoint of a country with yearly demographics of its provinces"""
+    stats = {"count": 10, "sources": {"Eurostat": ""}, "from_period": "2010-01-01", "to_period": "2024-01-01"}
+    return {
+        "statistics": {
+            "2": {
+                "count": 12,
+                "region_type": "province",
+                "access_level": "public",
+                "region_level": 2,
+                "with_geojson": 12,
+                "regional_data_stats": {"Demographics": stats | {"period_type": ["Y"]}},
+            }
+        }
+    }
+
+
+@pytest.fixture
+def geojson_feature() -> Callable[..., dict]:
+    """Factory of GeoJSON features of a region (a polygon by default)"""
+
+    def geojson_feature(local_region_code: str, geometry: dict | None = None, region_level: int = 2) -> dict:
+        return {
+            "type": "Feature",
+            "properties": {
+                "name": local_region_code,
+                "region_level": region_level,
+                "region_type": "province",
+                "iso_cc_2": "NL",
+                "local_region_code": local_region_code,
+                "local_region_code_type": "nuts",
+            },
+            "geometry": geometry or {"type": "Polygon", "coordinates": POLYGON},
+        }
+
+    return geojson_feature
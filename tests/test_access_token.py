@@ -0,0 +1,91 @@
+"""
+Test refreshing access tokens from many threads
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from the_datagarden.api.authentication import AccessToken
+
+
+def test_tokens_are_refreshed_once_by_concurrent_threads(environment, api_session):
+    session = api_session(release=threading.Event())
+    tokens = AccessToken(environment, "a@b.c", "secret", session=session, background_refresh=False)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(lambda: tokens.header_with_access_token) for _ in range(8)]
+        session.release.set()
+        headers = [future.result() for future in futures]
+    assert session.endpoints == ["token"]
+    assert len({header["Authorization"] for header in headers}) == 1
+
+    # The token expires within the life time margin, so it is refreshed once
+    tokens._token_expiry_time = datetime.now(tz=UTC) + timedelta(seconds=tokens.TOKEN_LIFE_TIME_MARGIN / 2)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: tokens.header_with_access_token, range(8)))
+    assert session.endpoints == ["token", "refresh"]
+
+
+def test_token_managers_per_credentials(environment, api_session):
+    session = api_session()
+    first = AccessToken(environment, "first@b.c", "secret", session=session, background_refresh=False)
+    second = AccessToken(environment, "second@b.c", "secret", session=session, background_refresh=False)
+    assert first.header_with_access_token != second.header_with_access_token
+    assert [payload["email"] for _, payload in session.requests] == ["first@b.c", "second@b.c"]
+
+
+class FakeTimer:
+    """Timer that is started and fired by the test instead of after its interval"""
+
+    def __init__(self, interval: float, function, args=()):
+        self.interval, self.function, self.args = interval, function, args
+        self.started = self.cancelled = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+    def fire(self):
+        self.function(*self.args)
+
+
+@pytest.fixture
+def timers(monkeypatch) -> list[FakeTimer]:
+    """Timers created by the token managers, instead of started threads"""
+    timers: list[FakeTimer] = []
+
+    def timer(*args, **kwargs) -> FakeTimer:
+        timers.append(FakeTimer(*args, **kwargs))
+        return timers[-1]
+
+    monkeypatch.setattr(threading, "Timer", timer)
+    return timers
+
+
+def test_tokens_are_refreshed_in_background(environment, api_session, timers):
+    session = api_session(token_life_time=300)
+    tokens = AccessToken(environment, "a@b.c", "secret", session=session)
+    header = tokens.header_with_access_token
+
+    # Refreshed TOKEN_REFRESH_AHEAD seconds before the token expires
+    assert len(timers) == 1 and timers[0].started
+    assert 300 - tokens.TOKEN_REFRESH_AHEAD - 5 < timers[0].interval <= 300 - tokens.TOKEN_REFRESH_AHEAD
+    tokens._token_expiry_time = datetime.now(tz=UTC) + timedelta(seconds=tokens.TOKEN_REFRESH_AHEAD / 2)
+    timers[0].fire()
+    assert session.endpoints == ["token", "refresh"]
+    assert tokens.header_with_access_token != header
+
+    assert len(timers) == 2
+    tokens.close()
+    assert timers[1].cancelled
+
+
+def test_failed_token_request_raises(environment, api_session):
+    session = api_session(status_codes={"token": 401})
+    tokens = AccessToken(environment, "a@b.c", "secret", session=session, background_refresh=False)
+    with pytest.raises(ValueError, match="Token request failed"):
+        _ = tokens.header_with_access_token
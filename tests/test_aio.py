@@ -0,0 +1,137 @@
+"""
+Test the asyncio client with a fake session of the API
+"""
+
+import asyncio
+import copy
+import threading
+
+import pytest
+
+from the_datagarden.api.aio import AsyncTheDataGardenAPI
+from the_datagarden.api.base import TheDataGardenAPI
+
+COUNTRIES = {"Netherlands": "NL", "Germany": "DE", "Belgium": "BE", "France": "FR"}
+REGIONS = {
+    "continent": [{"name": "Europe"}],
+    "country": [
+        {"name": name, "iso_cc_2": iso_cc_2, "parent_region": "Europe"}
+        for name, iso_cc_2 in COUNTRIES.items()
+    ],
+}
+
+
+@pytest.fixture
+def fake_session(api_session, regional_data_response, geojson_feature, statistics_response):
+    def session(**kwargs):
+        bodies = {
+            "statistics": lambda payload: statistics_response,
+            "regional_data": lambda payload: regional_data_response({"2021-01-01T00:00:00Z": 100.0}),
+            "geojson": lambda payload: {"features": [geojson_feature("NL31")], "pagination": None},
+        }
+        return api_session(REGIONS, bodies=bodies, **kwargs)
+
+    return session
+
+
+def lazy_api(environment, session, **kwargs) -> AsyncTheDataGardenAPI:
+    api = TheDataGardenAPI(environment, "a@b.c", "secret", session=session, check_pulse=False, lazy=True)
+    return AsyncTheDataGardenAPI(api, **kwargs)
+
+
+def test_retrieve_and_geojsons_of_a_lazy_api(environment, fake_session):
+    session = fake_session()
+    api = lazy_api(environment, session)
+
+    async def main():
+        netherlands = api.nl
+        assert session.requests == []
+        demographics = await netherlands.retrieve("demographics")
+        geojsons = await netherlands.geojsons(region_level=2)
+        return threading.get_ident(), netherlands, demographics, geojsons
+
+    loop_thread, netherlands, demographics, geojsons = asyncio.run(main())
+    assert netherlands.region is api.api.nl
+    assert len(demographics) == 1
+    assert demographics.model is api.api.nl.demographics
+    assert len(geojsons) == 1
+    assert session.endpoints == ["token", "continent", "country", "statistics", "regional_data", "geojson"]
+    assert loop_thread not in session.request_threads
+
+
+def test_unknown_region_of_a_lazy_api_is_raised_when_awaited(environment, fake_session):
+    api = lazy_api(environment, fake_session())
+    with pytest.raises(AttributeError):
+        asyncio.run(api.region("atlantis").lookup())
+
+
+def test_concurrency_is_limited(environment, fake_session):
+    session = fake_session(release=threading.Event())
+    api = lazy_api(environment, session, max_concurrency=2)
+
+    async def main():
+        session.release.set()
+        await api.netherlands.lookup()
+        session.release.clear()
+        retrieved = asyncio.gather(*[api.region(country).retrieve("demographics") for country in COUNTRIES])
+        while session.in_flight < 2:
+            await asyncio.sleep(0.001)
+        session.release.set()
+        return await retrieved
+
+    models = asyncio.run(main())
+    assert [len(model) for model in models] == [1] * len(COUNTRIES)
+    assert session.max_in_flight == 2
+
+
+def test_calls_on_the_same_model_run_one_after_the_other(environment, fake_session):
+    session = fake_session(release=threading.Event())
+    api = lazy_api(environment, session)
+
+    async def main():
+        session.release.set()
+        first = await api.nl.model("demographics")
+        second = await api.nl.model("demographics")
+        session.release.clear()
+        calls = asyncio.gather(first(period_from="2020-01-01"), second(period_from="2021-01-01"))
+        while session.in_flight < 1:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.05)
+        in_flight = session.in_flight
+        session.release.set()
+        await calls
+        return first, second, in_flight
+
+    first, second, in_flight = asyncio.run(main())
+    assert first is not second and first.model is second.model
+    assert in_flight == 1
+    assert session.endpoints.count("regional_data") == 2
+
+
+def test_private_attributes_are_not_taken_from_the_wrapped_model(environment, fake_session):
+    api = lazy_api(environment, fake_session())
+    demographics = asyncio.run(api.nl.model("demographics"))
+
+    with pytest.raises(AttributeError):
+        _ = demographics._request_params_hashes
+    assert copy.copy(demographics).model is demographics.model
+
+
+def test_create_forwards_the_api_options(environment, fake_session):
+    session = fake_session()
+    api = asyncio.run(
+        AsyncTheDataGardenAPI.create(
+            environment,
+            "a@b.c",
+            "secret",
+            session=session,
+            max_concurrency=3,
+            check_pulse=False,
+            lazy=True,
+            columnar=True,
+            ingest_mode="fast",
+        )
+    )
+    assert (api.api.columnar, api.api.ingest_mode) == (True, "fast")
+    assert not api.api.regions_loaded
+    assert session.requests == []
@@ -0,0 +1,73 @@
+"""
+Test setting up API objects: independent objects, lazy start-up and region snapshots
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from the_datagarden.api.base import TheDataGardenAPI
+
+REGIONS = {
+    "continent": [{"name": "Europe"}],
+    "country": [{"name": "Netherlands", "iso_cc_2": "NL", "parent_region": "Europe"}],
+}
+
+
+def lazy_api(environment, session) -> TheDataGardenAPI:
+    return TheDataGardenAPI(environment, "a@b.c", "secret", session=session, check_pulse=False, lazy=True)
+
+
+def test_api_objects_are_independent(api_session, environment, mirror_environment):
+    production_session, mirror_session = api_session(REGIONS), api_session(REGIONS)
+    production, mirror = (
+        lazy_api(environment, production_session),
+        lazy_api(mirror_environment, mirror_session),
+    )
+    assert production is not mirror
+
+    assert production.netherlands.name == "Netherlands"
+    assert production.nl is production.netherlands
+    assert production.netherlands is not mirror.netherlands
+    assert production.netherlands._api is production
+    assert production_session.endpoints == ["token", "continent", "country"]
+    assert mirror_session.endpoints == ["token", "continent", "country"]
+
+
+def test_regions_are_set_up_once_by_concurrent_threads(api_session, environment):
+    session = api_session(REGIONS, release=threading.Event())
+    production = lazy_api(environment, session)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(lambda: production.netherlands) for _ in range(8)]
+        session.release.set()
+        countries = [future.result() for future in futures]
+    assert all(country is countries[0] for country in countries)
+    assert session.endpoints == ["token", "continent", "country"]
+
+
+def test_lazy_api_without_pulse_check_makes_no_requests(api_session, environment):
+    session = api_session(REGIONS)
+    api = lazy_api(environment, session)
+    assert session.requests == []
+    assert api.api_status is None
+    assert not api.regions_loaded
+
+
+def test_region_snapshot_round_trip(api_session, environment, tmp_path):
+    snapshot = tmp_path / "regions.json"
+    session = api_session(REGIONS)
+    api = TheDataGardenAPI(
+        environment, "a@b.c", "secret", session=session, check_pulse=False, region_snapshot=snapshot
+    )
+    assert session.endpoints == ["token", "continent", "country"]
+    assert snapshot.exists()
+
+    snapshot_session = api_session(REGIONS)
+    snapshot_api = TheDataGardenAPI(
+        environment, "a@b.c", "secret", session=snapshot_session, check_pulse=False, region_snapshot=snapshot
+    )
+    assert snapshot_session.requests == []
+    assert list(snapshot_api.continents()) == list(api.continents())
+    assert list(snapshot_api.countries()) == list(api.countries())
+    assert snapshot_api.nl is snapshot_api.netherlands
+    assert snapshot_api.nl.region_url == api.nl.region_url
+    assert snapshot_api.nl._continent == "europe"
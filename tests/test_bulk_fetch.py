@@ -0,0 +1,83 @@
+"""
+Test retrieving regional data for many regions at once
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from the_datagarden.api.base import TheDataGardenAPI
+
+REGIONS = {
+    "continent": [{"name": "Europe"}],
+    "country": [
+        {"name": "Netherlands", "iso_cc_2": "NL", "parent_region": "Europe"},
+        {"name": "Germany", "iso_cc_2": "DE", "parent_region": "Europe"},
+    ],
+}
+
+
+@pytest.fixture
+def lazy_api(environment, api_session, statistics_response):
+    def lazy_api(regional_data):
+        bodies = {"statistics": lambda payload: statistics_response, "regional_data": regional_data}
+        session = api_session(REGIONS, bodies=bodies)
+        api = TheDataGardenAPI(environment, "a@b.c", "secret", session=session, check_pulse=False, lazy=True)
+        return api, session
+
+    return lazy_api
+
+
+def test_bulk_fetch_returns_the_records_of_the_call(lazy_api, regional_data_response):
+    api, _ = lazy_api(lambda payload: regional_data_response({payload["period_from"]: 100.0}))
+
+    api.bulk_fetch(models=["demographics"], period_from="2020-01-01T00:00:00Z")
+    data = api.bulk_fetch(models=["demographics"], period_from="2021-01-01T00:00:00Z")
+
+    assert data["demographics"].models[0] is not data["demographics"].models[1]
+    assert len(data["demographics"].models) == 2
+    assert [record.period for record in data["demographics"]] == ["2021-01-01T00:00:00Z"] * 2
+    assert len(api.nl.demographics) == 0
+
+
+def test_bulk_fetch_limits_the_requests_running_at_the_same_time(lazy_api, regional_data_response):
+    next_pages = threading.Event()
+
+    def regional_data(payload: dict) -> dict:
+        page = (payload.get("pagination") or {}).get("page", 1)
+        if page > 1:
+            next_pages.wait(timeout=10)
+        pagination = {"current_page": page, "next_page": page + 1 if page < 5 else None, "total_pages": 5}
+        return regional_data_response({f"20{10 + page}-01-01T00:00:00Z": 100.0}, pagination=pagination)
+
+    api, session = lazy_api(regional_data)
+    api.prefetch_statistics()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fetched = executor.submit(api.bulk_fetch, models=["demographics"], max_workers=4)
+        # Both regions fetch their first page, then two next pages each
+        while session.in_flight < 4 and not fetched.done():
+            time.sleep(0.001)
+        next_pages.set()
+        data = fetched.result()
+
+    assert len(data["demographics"]) == 10
+    assert session.max_in_flight == 4
+
+
+def test_bulk_fetch_skips_regions_without_data_of_the_default_period_type(
+    environment, api_session, statistics_response, regional_data_response
+):
+    stats = statistics_response["statistics"]["2"]["regional_data_stats"]["Demographics"]
+    stats["period_type"] = ["Q"]
+    bodies = {
+        "statistics": lambda payload: statistics_response,
+        "regional_data": lambda payload: regional_data_response({"2021-01-01T00:00:00Z": 100.0}),
+    }
+    session = api_session(REGIONS, bodies=bodies)
+    api = TheDataGardenAPI(environment, "a@b.c", "secret", session=session, check_pulse=False, lazy=True)
+
+    assert api.bulk_fetch(models=["demographics"]) == {}
+    assert "regional_data" not in session.endpoints
+    assert len(api.bulk_fetch(models=["demographics"], period_type="Q")["demographics"]) == 2
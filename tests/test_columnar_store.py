@@ -0,0 +1,70 @@
+"""
+Test storing regional data records as polars columns
+"""
+
+from types import SimpleNamespace
+
+from datagarden_models import DatagardenModels
+from polars.testing import assert_frame_equal
+
+from the_datagarden.models.columnar import ColumnarRecordStore
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+
+def test_columnar_store_replaces_records_with_the_same_hash(regional_record):
+    store = ColumnarRecordStore()
+    store.add_records([regional_record("NL", "2020", 100.0), regional_record("NL", "2021", 110.0)])
+    store.add_records([regional_record("NL", "2021", 120.0)])
+
+    assert len(store) == 2
+    assert store.full_model_to_polars().get_column("population.total").to_list() == [100.0, 120.0]
+
+
+def test_columnar_store_materializes_records_and_sub_models(regional_record):
+    records = [regional_record("NL", "2020", 100.0), regional_record("NL", "2021", 110.0)]
+    store = ColumnarRecordStore()
+    store.add_records(records)
+
+    assert list(store.values()) == records
+    population = store.sub_model_store("population", DatagardenModels.DEMOGRAPHICS.legends().population.model)
+    assert list(population.values()) == [record.record_for_sub_model("population") for record in records]
+    assert store.to_polars({"total": "population.total"}).get_column("total").to_list() == [100.0, 110.0]
+
+
+def test_columnar_store_indexes_added_pages(regional_record):
+    store = ColumnarRecordStore()
+    pages = [
+        [regional_record("NL", "2020", 100.0), regional_record("NL", "2021", 110.0)],
+        [regional_record("NL", "2022", 120.0, ages={"AGE-0": 5.0})],
+        [regional_record("NL", "2020", 105.0), regional_record("NL", "2023", 130.0)],
+    ]
+    population = None
+    for page in pages:
+        store.add_records(page)
+        if population is None:
+            population = store.sub_model_store(
+                "population", DatagardenModels.DEMOGRAPHICS.legends().population.model
+            )
+
+    records = {record.record_hash(): record for page in pages for record in page}
+    assert dict(store) == records
+    assert store.frame.height == len(store) == 4
+    assert store[pages[2][0].record_hash()].model.population.total == 105.0
+    assert len(population) == 2
+
+
+def test_columnar_store_adds_responses_in_fast_mode_without_records(regional_data_response):
+    pages = [
+        regional_data_response({"2020-01-01T00:00:00Z": 100.0, "2021-01-01T00:00:00Z": 110.0}),
+        regional_data_response({"2021-01-01T00:00:00Z": 120.0, "2022-01-01T00:00:00Z": 130.0}),
+    ]
+    api = SimpleNamespace(columnar=True, ingest_mode="fast")
+    demographics = TheDataGardenRegionalDataModel(api, "demographics", "", None)
+    store = ColumnarRecordStore()
+    for page in pages:
+        demographics.set_items(page)
+        store.add_records(demographics._records_from_response(page))
+
+    assert list(demographics._data_records) == list(store)
+    assert_frame_equal(demographics.full_model_to_polars(), store.full_model_to_polars())
+    assert [record.model.population.total for record in demographics] == [100.0, 120.0, 130.0]
@@ -0,0 +1,83 @@
+"""
+Test converting regional data records to polars dataframes
+"""
+
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+from datagarden_models import DatagardenModels
+from polars.testing import assert_frame_equal
+from pydantic import ValidationError
+
+from the_datagarden.models.conversion import (
+    model_schema,
+    records_to_full_model_polars,
+    records_to_polars,
+    regional_data_to_full_model_polars,
+)
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+
+def test_model_schema_has_types_from_legends():
+    schema = model_schema(DatagardenModels.DEMOGRAPHICS)
+    assert schema["population.total"] == pl.Float64
+    assert schema["metadata.data_is_projection"] == pl.Boolean
+
+
+def test_full_model_columns_follow_model_fields_and_dictionary_keys(regional_record):
+    records = [
+        regional_record("r1", total=100.0, ages={"AGE-0": 10.0, "AGE-1": 11.0}),
+        regional_record("r2", total=200.0, ages={"AGE-0": 20.0, "AGE-2": 22.0}),
+    ]
+    df = records_to_full_model_polars(records)
+
+    age_columns = [column for column in df.columns if column.startswith("population.by_age_gender.age.male")]
+    assert age_columns == [f"population.by_age_gender.age.male.AGE-{age}" for age in range(3)]
+    assert df.get_column("population.by_age_gender.age.male.AGE-2").to_list() == [None, 22.0]
+    assert df.schema["mortality.total_deaths"] == pl.Float64
+
+
+def test_to_polars_selects_model_attributes_with_data(regional_record):
+    records = [regional_record("r1", total=100.0), regional_record("r2", total=200.0)]
+    df = records_to_polars(records, {"population": "population.total", "deaths": "mortality.total_deaths"})
+
+    assert df.get_column("population").to_list() == [100.0, 200.0]
+    assert "deaths" not in df.columns
+
+
+def test_response_conversion_matches_the_records_created_in_fast_mode(regional_data_response):
+    response = regional_data_response({"2020-01-01T00:00:00Z": 100.0, "2021-01-01T00:00:00Z": 110.0})
+    first, second = response["data_by_region"][0]["data_objects_for_region"]
+    first["data"]["population"]["by_age_gender"] = {"age": {"male": {"AGE-0": 10.0, "AGE-1": 11.0}}}
+    second["data"]["population"]["by_age_gender"] = {"age": {"female": {"AGE-2": 22.0}}}
+    # Attributes that are not fields of the model are left out, as in the constructed models
+    second["data"]["life_expectancy"] = {"unknown": 80.0}
+
+    api = SimpleNamespace(columnar=False, ingest_mode="fast")
+    demographics = TheDataGardenRegionalDataModel(api, "demographics", "", None)
+    records = list(demographics._records_from_response(response))
+    df = regional_data_to_full_model_polars(response)
+
+    assert_frame_equal(df, records_to_full_model_polars(records))
+    assert "life_expectancy.unknown" not in df.columns
+    assert df.get_column("population.by_age_gender.age.total").to_list() == [None, None]
+
+
+def test_response_conversion_validates_and_converts_as_the_records_in_strict_mode(
+    regional_data_response, model_api
+):
+    response = regional_data_response({"2020-01-01T00:00:00Z": 100, "2021-01-01T00:00:00Z": 110})
+    first, _ = response["data_by_region"][0]["data_objects_for_region"]
+    first["data"]["population"]["by_age_gender"] = {"age": {"male": {"AGE-0": 10.0, "AGE-1": 11.0}}}
+
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    records = list(demographics._records_from_response(response))
+    df = regional_data_to_full_model_polars(response, "strict")
+
+    assert_frame_equal(df, records_to_full_model_polars(records))
+    assert df.schema["population.total"] == pl.Float64
+
+    first["data"]["population"]["total"] = "many"
+    with pytest.raises(ValidationError):
+        regional_data_to_full_model_polars(response, "strict")
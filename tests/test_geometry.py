@@ -0,0 +1,39 @@
+"""
+Test the packed storage of GeoJSON coordinates
+"""
+
+import pytest
+
+from the_datagarden.models.geojson import Geometry
+from the_datagarden.models.geometry import PackedCoordinates
+
+RING = [[4.0, 52.0], [5.0, 52.0], [5.0, 53.0], [4.0, 52.0]]
+HOLE = [[4.2, 52.2], [4.4, 52.2], [4.4, 52.4], [4.2, 52.2]]
+
+GEOMETRIES = {
+    "Point": [4.0, 52.0],
+    "LineString": RING,
+    "MultiPoint": RING,
+    "Polygon": [RING, HOLE],
+    "MultiLineString": [RING, HOLE],
+    "MultiPolygon": [[RING, HOLE], [RING]],
+}
+
+
+@pytest.mark.parametrize("geometry_type", GEOMETRIES)
+def test_geometry_round_trip(geometry_type):
+    geojson = {"type": geometry_type, "coordinates": GEOMETRIES[geometry_type]}
+    geometry = Geometry(**geojson)
+
+    assert isinstance(geometry.coordinates, PackedCoordinates)
+    assert geometry.model_dump() == geojson
+    assert geometry.to_geojson() == geojson
+    assert Geometry.model_validate_json(geometry.model_dump_json()) == geometry
+
+
+def test_multipolygon_layout():
+    coordinates = PackedCoordinates.from_list(GEOMETRIES["MultiPolygon"])
+
+    assert coordinates.coords.shape == (12, 2)
+    assert [offsets.tolist() for offsets in coordinates.offsets] == [[0, 2, 3], [0, 4, 8, 12]]
+    assert [ring.tolist() for ring in coordinates.rings()] == [RING, HOLE, RING]
@@ -0,0 +1,37 @@
+"""
+Test that importing the_datagarden does not import heavy modules, so lazy imports don't regress.
+
+Each test runs in a fresh interpreter, as modules imported by other tests are cached.
+"""
+
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "polars", "numpy", "datagarden_models"]
+
+IMPORT_SCRIPT = """
+import json, sys
+{statement}
+print(json.dumps([module for module in {heavy_modules} if module in sys.modules]))
+"""
+
+
+def imported_heavy_modules(statement: str) -> list[str]:
+    script = IMPORT_SCRIPT.format(statement=statement, heavy_modules=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_import_package_does_not_import_heavy_modules():
+    assert imported_heavy_modules("import the_datagarden") == []
+
+
+def test_import_api_does_not_import_heavy_modules():
+    assert imported_heavy_modules("from the_datagarden import TheDataGardenAPI, AsyncTheDataGardenAPI") == []
+
+
+def test_models_import_dataframe_libraries_on_use():
+    heavy_modules = imported_heavy_modules("from the_datagarden.models import TheDataGardenRegionalDataModel")
+    assert "pandas" not in heavy_modules
+    assert "polars" not in heavy_modules
@@ -0,0 +1,72 @@
+"""
+Test creating models from API responses without validation (fast ingest mode)
+"""
+
+from datagarden_models import DatagardenModels
+from pydantic import BaseModel
+
+from the_datagarden.models.geojson import Feature
+from the_datagarden.models.ingest import construct_model
+
+
+def test_construct_model_equals_validated_model():
+    data = {
+        "population": {"total": 1000.0, "by_age_gender": {"age": {"male": {"AGE-0": 10.0}}}},
+        "migration": {"net_migrantion": 5.0},
+    }
+    constructed = construct_model(DatagardenModels.DEMOGRAPHICS, data)
+
+    assert constructed.population.by_age_gender.age.male.root == {"AGE-0": 10.0}
+    assert constructed.model_dump() == DatagardenModels.DEMOGRAPHICS(**data).model_dump()
+
+
+class Value(BaseModel):
+    value: float | None = None
+    unit: str = "count"
+
+
+class Values(BaseModel):
+    by_year: list[Value] = []
+    by_name: dict[str, Value] | None = None
+
+
+def test_construct_model_creates_models_in_lists_and_dictionaries():
+    data = {"by_year": [{"value": 1.0}, {"value": 2.0, "unit": "km"}], "by_name": {"a": {"value": 3.0}}}
+    constructed = construct_model(Values, data)
+
+    assert constructed == Values(**data)
+    assert constructed.by_name["a"].unit == "count"
+    energy = construct_model(DatagardenModels.ENERGY, {"production": {"by_fuel": {"coal": {"value": 1.0}}}})
+    assert (
+        energy.model_dump()
+        == DatagardenModels.ENERGY(production={"by_fuel": {"coal": {"value": 1.0}}}).model_dump()
+    )
+
+
+def test_constructed_models_do_not_share_mutable_defaults():
+    first, second = construct_model(Values, {}), construct_model(Values, {})
+    first.by_year.append(Value(value=1.0))
+    assert second.by_year == []
+
+    first, second = (construct_model(DatagardenModels.DEMOGRAPHICS, {}) for _ in range(2))
+    first.population.total = 100.0
+    assert second.population.total is None
+
+
+def test_construct_feature():
+    data = {
+        "type": "Feature",
+        "properties": {
+            "name": "Utrecht",
+            "region_level": 2,
+            "region_type": "province",
+            "iso_cc_2": "NL",
+            "local_region_code": "NL31",
+            "local_region_code_type": "nuts",
+        },
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[5.0, 52.0], [5.1, 52.0], [5.0, 52.1], [5.0, 52.0]]],
+        },
+    }
+    assert construct_model(Feature, data) == Feature(**data)
@@ -0,0 +1,55 @@
+"""
+Test joining regional data onto GeoJSON feature properties
+"""
+
+import json
+
+from the_datagarden.models.geojson import TheDataGardenRegionGeoJSONModel
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+
+def test_stream_feature_collection_with_regional_data(model_api, geojson_feature, regional_record):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    geojsons.set_items(
+        {"features": [geojson_feature("NL31"), geojson_feature("NL32"), geojson_feature("NL33")]}
+    )
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    records = [
+        regional_record("NL31", "2021-01-01T00:00:00Z", 100.0),
+        regional_record("NL31", "2022-01-01T00:00:00Z", 110.0),
+        regional_record("NL32", "2021-01-01T00:00:00Z", 200.0),
+    ]
+    demographics._data_records = {record.record_hash(): record for record in records}
+
+    attributes = {"population": "population.total"}
+
+    def joined_properties(**kwargs) -> list[dict]:
+        chunks = geojsons.stream_feature_collection(demographics, attributes, **kwargs)
+        return [item["properties"] for item in json.loads(b"".join(chunks))["features"]]
+
+    assert [properties.get("population") for properties in joined_properties(period="2021")] == [
+        100.0,
+        200.0,
+        None,
+    ]
+    latest = joined_properties()
+    assert [properties.get("population") for properties in latest] == [110.0, 200.0, None]
+    assert latest[0]["name"] == "NL31"
+    assert json.loads(b"".join(geojsons.stream_feature_collection())) == geojsons.to_feature_collection()
+
+
+def test_attributes_named_as_feature_properties_are_left_out(model_api, geojson_feature, regional_record):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    geojsons.set_items({"features": [geojson_feature("NL31")]})
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    record = regional_record("NL31", "2021-01-01T00:00:00Z", 100.0)
+    demographics._data_records = {record.record_hash(): record}
+
+    attributes = {"name": "population.total", "population": "population.total"}
+    collection = b"".join(geojsons.stream_feature_collection(demographics, attributes))
+
+    assert collection.count(b'"name":') == 1
+    assert json.loads(collection)["features"][0]["properties"] == {
+        **geojson_feature("NL31")["properties"],
+        "population": 100.0,
+    }
@@ -0,0 +1,98 @@
+"""
+JSON decoding of API responses: each response body is decoded once, and every available
+decoder decodes large regional data and geojson payloads.
+"""
+
+import json
+
+import pytest
+from requests import Response
+
+from the_datagarden.api.decoder import (
+    DECODERS,
+    _import_decoder,
+    json_decoder_name,
+    response_json,
+    set_json_decoder,
+)
+
+
+def make_response(payload: dict) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def regional_data_payload(record_count: int) -> dict:
+    age = {f"AGE-{age}": 1000.0 + age for age in range(101)}
+    return {
+        "next": None,
+        "results": [
+            {
+                "period": "2020-01-01T00:00Z",
+                "period_type": "Y",
+                "source": "Eurostat",
+                "data": {"population": {"by_age_gender": {"male": age, "female": age}, "total": 1e6}},
+            }
+            for _ in range(record_count)
+        ],
+    }
+
+
+def geojson_payload(feature_count: int) -> dict:
+    ring = [[4.0 + i * 1e-4, 52.0 + i * 1e-4] for i in range(1000)]
+    return {
+        "next": None,
+        "results": [
+            {
+                "type": "Feature",
+                "properties": {"name": f"region {i}"},
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+            }
+            for i in range(feature_count)
+        ],
+    }
+
+
+@pytest.fixture
+def counting_decoder():
+    decoder_name = json_decoder_name()
+    calls = []
+
+    def decoder(content: bytes):
+        calls.append(content)
+        return json.loads(content)
+
+    set_json_decoder(decoder)
+    yield calls
+    set_json_decoder(decoder_name)
+
+
+def test_response_is_decoded_once(counting_decoder):
+    response = make_response({"next": "https://example.com/?page=2", "results": [{"a": 1}]})
+
+    assert response_json(response).get("next") == "https://example.com/?page=2"
+    assert response_json(response)["results"] == [{"a": 1}]
+    assert len(counting_decoder) == 1
+
+
+def test_unknown_decoder_is_rejected():
+    with pytest.raises(ValueError):
+        set_json_decoder("unknown")
+
+
+@pytest.mark.parametrize(
+    "payload", [regional_data_payload(2_000), geojson_payload(200)], ids=["regional_data", "geojson"]
+)
+def test_available_decoders_decode_large_responses(payload):
+    content = json.dumps(payload).encode()
+    decoded_by = []
+    for name in DECODERS:
+        try:
+            decoder = _import_decoder(name)
+        except ImportError:
+            continue
+        assert decoder(content) == payload
+        decoded_by.append(name)
+    assert decoded_by
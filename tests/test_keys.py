@@ -0,0 +1,40 @@
+"""
+Test deterministic record and request keys
+"""
+
+import os
+import subprocess
+import sys
+
+from the_datagarden.models.keys import record_key, request_key
+
+KEYS_SCRIPT = """
+from datagarden_models import DatagardenModels
+from the_datagarden.models.keys import request_key
+from the_datagarden.models.regional_data import RegionalDataRecord
+
+record = RegionalDataRecord(iso_cc_2="NL", period="2022", model=DatagardenModels.DEMOGRAPHICS())
+print(record.record_hash(), request_key({"period_type": "Y", "source": ["CBS"]}))
+"""
+
+
+def test_keys_are_equal_across_processes():
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", KEYS_SCRIPT],
+            env=os.environ | {"PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for hash_seed in ["1", "2"]
+    }
+    assert len(keys) == 1
+
+
+def test_keys():
+    assert record_key(["NL", None]) != record_key(["NL", "None"])
+    assert record_key(["NL", "NL31"]) != record_key(["NLNL", "31"])
+    assert request_key({"period_type": "Y", "period_from": "2020"}) == request_key(
+        {"period_from": "2020", "period_type": "Y"}
+    )
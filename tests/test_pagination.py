@@ -0,0 +1,161 @@
+"""
+Test fetching paginated regional data and geojson responses
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from the_datagarden.models.geojson import TheDataGardenRegionGeoJSONModel
+from the_datagarden.models.pagination import fetch_all_pages, fetch_next_pages
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+
+def page_fetcher(total_pages: int | None):
+    def fetch_page(pagination: dict) -> dict:
+        page = pagination["page"]
+        time.sleep(random.random() / 100)
+        next_page = page + 1 if page < 10 else None
+        return {"page": page, "pagination": {"next_page": next_page, "total_pages": total_pages}}
+
+    return fetch_page
+
+
+def test_fetch_next_pages_concurrently_in_page_order():
+    first_page = {"page": 1, "pagination": {"next_page": 2, "total_pages": 10}}
+    pages = fetch_next_pages(page_fetcher(10), first_page, max_workers=4)
+    assert [page["page"] for page in pages] == list(range(2, 11))
+
+
+def test_fetch_next_pages_serially_without_page_count():
+    first_page = {"page": 1, "pagination": {"next_page": 2}}
+    pages = fetch_next_pages(page_fetcher(None), first_page, max_workers=4)
+    assert [page["page"] for page in pages] == list(range(2, 11))
+
+
+def test_fetch_next_pages_single_page():
+    first_page = {"page": 1, "pagination": {"next_page": None, "total_pages": 1}}
+    assert list(fetch_next_pages(page_fetcher(1), first_page)) == []
+
+
+@pytest.mark.parametrize("total_pages", [10, None])
+def test_fetch_next_pages_raises_for_a_failed_page(total_pages):
+    fetch_page = page_fetcher(total_pages)
+    first_page = {"page": 1, "pagination": {"next_page": 2, "total_pages": total_pages}}
+    pages = fetch_next_pages(
+        lambda pagination: None if pagination["page"] == 4 else fetch_page(pagination), first_page
+    )
+
+    assert [next(pages)["page"], next(pages)["page"]] == [2, 3]
+    with pytest.raises(RuntimeError, match="Page 4"):
+        next(pages)
+
+
+def test_fetch_all_pages_of_several_requests():
+    fetchers = {"level-0": page_fetcher(10), "level-2": page_fetcher(None)}
+
+    def fetch_page(request_key: str, pagination: dict | None) -> dict:
+        return fetchers[request_key](pagination or {"page": 1})
+
+    pages = list(fetch_all_pages(fetch_page, fetchers, max_workers=4))
+    for request_key in fetchers:
+        assert sorted(page["page"] for key, page, _ in pages if key == request_key) == list(range(1, 11))
+        completions = [complete for key, _, complete in pages if key == request_key]
+        assert completions == [False] * 9 + [True]
+
+
+def test_regional_data_pages_are_merged_in_page_order(model_api, regional_data_response):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    # Each page waits for the page after it, so the pages arrive in reverse order
+    arrived = {page: threading.Event() for page in range(1, 6)}
+    arrival_order = []
+
+    def regional_data_from_api(pagination: dict | None = None, **kwargs) -> dict:
+        page = pagination["page"] if pagination else 1
+        if 1 < page < 5:
+            assert arrived[page + 1].wait(timeout=10)
+        arrival_order.append(page)
+        arrived[page].set()
+        return regional_data_response(
+            {f"20{10 + page}-01-01T00:00:00Z": float(page)},
+            pagination={"current_page": page, "next_page": page + 1 if page < 5 else None, "total_pages": 5},
+        )
+
+    demographics.regional_data_from_api = regional_data_from_api
+    demographics(period_from="2011-01-01")
+
+    assert arrival_order == [1, 5, 4, 3, 2]
+    assert [record.model.population.total for record in demographics] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_failing_regional_data_page_is_raised(model_api, regional_data_response):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+
+    def regional_data_from_api(pagination: dict | None = None, **kwargs) -> dict:
+        page = pagination["page"] if pagination else 1
+        if page == 3:
+            raise ConnectionError("page 3 failed")
+        return regional_data_response(
+            {f"20{10 + page}-01-01T00:00:00Z": float(page)},
+            pagination={"current_page": page, "next_page": page + 1 if page < 5 else None, "total_pages": 5},
+        )
+
+    demographics.regional_data_from_api = regional_data_from_api
+    with pytest.raises(ConnectionError):
+        demographics(period_from="2011-01-01")
+    # Nothing is stored, so calling the model again retries the request
+    assert len(demographics) == 0
+    assert demographics._request_params_hashes == []
+
+
+def test_failed_regional_data_page_is_not_taken_for_a_complete_request(model_api, regional_data_response):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+
+    def regional_data_from_api(pagination: dict | None = None, **kwargs) -> dict:
+        page = pagination["page"] if pagination else 1
+        if page == 3:
+            return {}
+        return regional_data_response(
+            {f"20{10 + page}-01-01T00:00:00Z": float(page)},
+            pagination={"current_page": page, "next_page": page + 1 if page < 5 else None, "total_pages": 5},
+        )
+
+    demographics.regional_data_from_api = regional_data_from_api
+    with pytest.raises(RuntimeError, match="Page 3"):
+        demographics(period_from="2011-01-01")
+    assert len(demographics) == 0
+    assert demographics._request_params_hashes == []
+
+
+def test_geojson_level_is_requested_after_all_of_its_pages(model_api, geojson_feature):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    failing_pages = {2}
+    requested_pages = []
+
+    def geojson_data_from_api(region_level: int, pagination: dict | None = None) -> dict | None:
+        page = pagination["page"] if pagination else 1
+        requested_pages.append(page)
+        if page in failing_pages:
+            return None
+        return {
+            "features": [geojson_feature(f"NL3{page}")],
+            "pagination": {
+                "current_page": page,
+                "next_page": page + 1 if page < 3 else None,
+                "total_pages": 3,
+            },
+        }
+
+    geojsons.geojson_data_from_api = geojson_data_from_api
+    geojsons(region_level=2)
+    assert len(geojsons) == 2
+    assert geojsons._levels_requested == []
+
+    failing_pages.clear()
+    geojsons(region_level=2)
+    geojsons(region_level=2)
+    assert len(geojsons) == 3
+    assert geojsons._levels_requested == [2]
+    assert sorted(requested_pages) == [1, 1, 2, 2, 3, 3]
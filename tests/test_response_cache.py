@@ -0,0 +1,107 @@
+"""
+Test the persistent response cache
+"""
+
+import pytest
+from requests import Response
+
+from the_datagarden.abc.cache import CachedResponse
+from the_datagarden.api.cache import ResponseCache, SQLiteResponseStore
+
+URL = "https://api.the-datagarden.io/country/netherlands/statistics/"
+
+
+def cached_response(size: int, stored_at: float = 0.0) -> CachedResponse:
+    return CachedResponse(status_code=200, headers={"ETag": '"v1"'}, content=b"x" * size, stored_at=stored_at)
+
+
+def test_store_returns_stored_response(tmp_path):
+    store = SQLiteResponseStore(tmp_path)
+    store.set("key", cached_response(10, stored_at=1.0))
+    assert store.get("key") == cached_response(10, stored_at=1.0)
+    store.touch("key", 2.0)
+    assert store.get("key")["stored_at"] == 2.0
+    assert store.get("other") is None
+
+
+def test_store_evicts_least_recently_used_responses(tmp_path):
+    store = SQLiteResponseStore(tmp_path, max_size_mb=1)
+    store.set("first", cached_response(400_000))
+    store.set("second", cached_response(400_000))
+    store.get("first")
+    store.set("third", cached_response(400_000))
+    assert store.get("second") is None
+    assert store.get("first") and store.get("third")
+
+
+def test_cache_key_and_time_to_live(tmp_path):
+    cache = ResponseCache(store=SQLiteResponseStore(tmp_path), ttl={"geojson": 0})
+    url = "https://api.the-datagarden.io/country/netherlands/"
+    assert cache.key("POST", url, payload={"a": 1, "b": 2}) == cache.key(
+        "POST", url, payload={"b": 2, "a": 1}
+    )
+    assert cache.key("POST", url, payload={"a": 1}) != cache.key("POST", url, payload={"a": 2})
+    assert cache.key("GET", url, account="a@b.c") != cache.key("GET", url, account="d@e.f")
+    assert cache.endpoint_class(url + "statistics/") == "statistics"
+    assert cache.endpoint_class(url + "regional_data/") == "regional_data"
+    assert cache.endpoint_class(url) == "default"
+    assert cache.ttl_for(url + "geojson/") == 0
+
+
+class QueuedSession:
+    """Session answering requests with the queued responses, recording the request headers"""
+
+    def __init__(self, *responses: tuple[int, dict[str, str], bytes]):
+        self.responses = list(responses)
+        self.headers: list[dict[str, str]] = []
+
+    def request(self, method: str, url: str, headers: dict[str, str], **kwargs) -> Response:
+        self.headers.append(headers)
+        status_code, response_headers, content = self.responses.pop(0)
+        response = Response()
+        response.status_code = status_code
+        response.headers.update(response_headers)
+        response._content = content
+        return response
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResponseCache:
+    return ResponseCache(store=SQLiteResponseStore(tmp_path), ttl={"statistics": 60})
+
+
+def test_fresh_response_is_returned_from_cache(cache):
+    session = QueuedSession((200, {"ETag": '"v1"'}, b'{"n": 1}'))
+    first = cache.send(session, "GET", URL, headers={}, account="a@b.c")
+    second = cache.send(session, "GET", URL, headers={}, account="a@b.c")
+    assert (first.content, second.content) == (b'{"n": 1}', b'{"n": 1}')
+    assert second.headers["ETag"] == '"v1"'
+    assert len(session.headers) == 1
+
+
+def test_responses_are_cached_per_account(cache):
+    session = QueuedSession((200, {}, b'{"n": 1}'), (200, {}, b'{"n": 2}'))
+    cache.send(session, "GET", URL, headers={}, account="a@b.c")
+    assert cache.send(session, "GET", URL, headers={}, account="d@e.f").content == b'{"n": 2}'
+
+
+def test_expired_response_is_revalidated(cache):
+    session = QueuedSession((200, {"ETag": '"v1"'}, b'{"n": 1}'), (304, {}, b""))
+    cache.send(session, "GET", URL, headers={})
+    key = cache.key("GET", URL)
+    cache.store.touch(key, 0.0)
+
+    response = cache.send(session, "GET", URL, headers={})
+
+    assert (response.status_code, response.content) == (200, b'{"n": 1}')
+    assert session.headers[1] == {"If-None-Match": '"v1"'}
+    assert cache.store.get(key)["stored_at"] > 0.0
+    assert cache.send(session, "GET", URL, headers={}).content == b'{"n": 1}'
+    assert len(session.headers) == 2
+
+
+def test_failed_response_is_not_cached(cache):
+    session = QueuedSession((503, {}, b'{"detail": "down"}'), (200, {}, b'{"n": 1}'))
+    assert cache.send(session, "GET", URL, headers={}).status_code == 503
+    assert cache.store.get(cache.key("GET", URL)) is None
+    assert cache.send(session, "GET", URL, headers={}).content == b'{"n": 1}'
@@ -0,0 +1,99 @@
+"""
+Test the retry, timeout and pool settings of the HTTP session
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from the_datagarden.api.session import DataGardenRetry, DataGardenSession
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """Responds with the status codes of ``server.statuses`` in turn, then with 200"""
+
+    def _respond(self):
+        self.server.requests.append(self.command)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    server.statuses, server.requests = [], []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+@pytest.mark.parametrize(
+    "method, statuses, expected_status, expected_requests",
+    [
+        ("GET", [503, 502], 200, 3),
+        ("GET", [429], 200, 2),
+        ("POST", [429], 200, 2),
+        ("POST", [503], 503, 1),
+    ],
+)
+def test_retries(server, method, statuses, expected_status, expected_requests):
+    server.statuses.extend(statuses)
+    with DataGardenSession(max_retries=3, backoff_factor=0) as session:
+        response = session.request(method, url(server), json={"query": 1})
+    assert response.status_code == expected_status
+    assert server.requests == [method] * expected_requests
+
+
+def test_retries_are_limited(server):
+    server.statuses.extend([503] * 5)
+    with DataGardenSession(max_retries=2, backoff_factor=0) as session:
+        assert session.get(url(server)).status_code == 503
+    assert len(server.requests) == 3
+
+
+class TimeoutAdapter(HTTPAdapter):
+    def __init__(self):
+        super().__init__()
+        self.timeouts: list = []
+
+    def send(self, request, **kwargs) -> Response:
+        self.timeouts.append(kwargs["timeout"])
+        response = Response()
+        response.status_code = 200
+        return response
+
+
+def test_default_timeout_can_be_overridden():
+    session = DataGardenSession(timeout=30)
+    adapter = TimeoutAdapter()
+    session.mount("https://", adapter)
+    session.get("https://test.the-datagarden.io/")
+    session.get("https://test.the-datagarden.io/", timeout=5)
+    assert adapter.timeouts == [30, 5]
+
+
+def test_pool_and_retry_settings():
+    session = DataGardenSession(pool_size=32, max_retries=5, backoff_factor=0.1)
+    adapter = session.get_adapter("https://test.the-datagarden.io/")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert adapter._pool_connections == 32
+    assert isinstance(adapter.max_retries, DataGardenRetry)
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 0.1
@@ -0,0 +1,45 @@
+"""
+Test simplification and precision reduction of GeoJSON geometries
+"""
+
+import numpy as np
+import pytest
+
+from the_datagarden.models.geojson import TheDataGardenRegionGeoJSONModel
+from the_datagarden.models.geometry import PackedCoordinates
+from the_datagarden.models.simplify import simplify_coordinates
+
+
+def circle(positions: int) -> list:
+    angles = np.linspace(0, 2 * np.pi, positions)
+    ring = np.column_stack([5 + np.cos(angles), 52 + np.sin(angles)])
+    ring[-1] = ring[0]
+    return ring.tolist()
+
+
+@pytest.mark.parametrize("method", ["douglas_peucker", "visvalingam"])
+def test_simplified_rings_stay_closed(method):
+    coordinates = PackedCoordinates.from_list([circle(10_000), circle(5)])
+    simplified = simplify_coordinates(coordinates, tolerance=0.01, method=method, precision=4)
+
+    rings = list(simplified.rings())
+    assert len(rings) == 2
+    assert 4 <= len(rings[0]) < 200
+    assert all(np.array_equal(ring[0], ring[-1]) for ring in rings)
+    assert np.array_equal(rings[0], np.round(rings[0], 4))
+
+
+def test_feature_collection_is_simplified_and_cached(model_api, geojson_feature):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    features = [
+        geojson_feature("NL31", {"type": "Polygon", "coordinates": [circle(10_000)]}),
+        geojson_feature("NL32", {"type": "Polygon", "coordinates": [circle(20)]}),
+    ]
+    geojsons.set_items({"features": features})
+
+    collection = geojsons.to_feature_collection(region_level=2, tolerance=0.01, precision=4)
+    full_ring, small_ring = (item["geometry"]["coordinates"][0] for item in collection["features"])
+    assert len(full_ring) < 200
+    assert len(small_ring) <= 20
+    assert geojsons.simplified_features(0.01, precision=4) is geojsons.simplified_features(0.01, precision=4)
+    assert geojsons.to_feature_collection(region_level=0)["features"] == []
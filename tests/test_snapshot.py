@@ -0,0 +1,71 @@
+"""
+Test saving and loading regional data and geojson models as snapshots
+"""
+
+import json
+
+import pytest
+
+from the_datagarden.models.geojson import TheDataGardenRegionGeoJSONModel
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+POLYGON = [[[4.0, 52.0], [5.0, 52.0], [5.0, 53.0], [4.0, 52.0]]]
+MULTI_POLYGON = [POLYGON, [[[6.0, 50.0], [7.0, 50.0], [7.0, 51.0], [6.0, 50.0]]]]
+
+
+@pytest.mark.parametrize("file_format", ["ipc", "parquet"])
+def test_regional_data_snapshot(tmp_path, file_format, model_api, regional_record):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    records = [regional_record("NL31", total=100.0), regional_record("NL32", total=200.0)]
+    demographics._data_records = {record.record_hash(): record for record in records}
+    demographics._request_params_hashes = ["request"]
+    demographics.save(tmp_path / "demographics", file_format=file_format)
+
+    loaded = TheDataGardenRegionalDataModel(model_api, "demographics", "", None).load(
+        tmp_path / "demographics"
+    )
+    assert loaded._request_params_hashes == ["request"]
+    assert {record_hash: record.model_dump() for record_hash, record in loaded._data_records.items()} == {
+        record.record_hash(): record.model_dump() for record in records
+    }
+    assert loaded.to_polars({"population": "population.total"}).get_column("population").to_list() == [
+        100.0,
+        200.0,
+    ]
+
+    with pytest.raises(ValueError):
+        TheDataGardenRegionalDataModel(model_api, "economics", "", None).load(tmp_path / "demographics")
+    with pytest.raises(ValueError):
+        TheDataGardenRegionGeoJSONModel(api=model_api, region_url="").load(tmp_path / "demographics")
+
+
+def test_geojson_snapshot(tmp_path, model_api, geojson_feature):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    geojsons.set_items(
+        {
+            "features": [
+                geojson_feature("NL31"),
+                geojson_feature("NL32", {"type": "MultiPolygon", "coordinates": MULTI_POLYGON}),
+                geojson_feature("NL33", {"type": "Polygon", "coordinates": []}),
+                geojson_feature("NL34", {"type": "Point", "coordinates": [5.0, 52.0]}),
+            ]
+        }
+    )
+    geojsons._levels_requested = [2]
+    geojsons.save(tmp_path / "geojsons")
+
+    loaded = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="").load(tmp_path / "geojsons")
+    assert loaded._levels_requested == [2]
+    assert list(loaded._geojson_records) == list(geojsons._geojson_records)
+    assert loaded.to_feature_collection() == geojsons.to_feature_collection()
+    assert loaded.locate([4.9, 6.9, 0.0], [52.1, 50.1, 0.0]).tolist() == ["NL31", "NL32", None]
+
+
+def test_snapshot_of_another_version_is_not_loaded(tmp_path, model_api):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    demographics.save(tmp_path / "demographics")
+    snapshot_file = tmp_path / "demographics" / "snapshot.json"
+    snapshot_file.write_text(json.dumps(json.loads(snapshot_file.read_text()) | {"version": 0}))
+
+    with pytest.raises(ValueError, match="version 0"):
+        TheDataGardenRegionalDataModel(model_api, "demographics", "", None).load(tmp_path / "demographics")
@@ -0,0 +1,49 @@
+"""
+Test locating points in GeoJSON regions with the spatial index
+"""
+
+import numpy as np
+
+from the_datagarden.models.geojson import TheDataGardenRegionGeoJSONModel
+from the_datagarden.models.geometry import PackedCoordinates
+from the_datagarden.models.spatial import SpatialIndex
+
+
+def square(x: float, y: float, size: float) -> list:
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+def test_spatial_index_matches_grid_cells():
+    geometries = [
+        PackedCoordinates.from_list([square(column, row, 1.0)]) for column in range(30) for row in range(30)
+    ]
+    x, y = np.random.default_rng(0).uniform(-1, 31, (2, 10_000))
+
+    located = SpatialIndex(geometries).locate(x, y)
+
+    inside = (x >= 0) & (x < 30) & (y >= 0) & (y < 30)
+    expected = np.where(inside, np.floor(x) * 30 + np.floor(y), -1).astype(int)
+    on_edge = np.isclose(x, np.round(x)) | np.isclose(y, np.round(y))
+    assert np.array_equal(located[~on_edge], expected[~on_edge])
+    assert len(SpatialIndex([]).locate(x, y)) == len(x)
+
+
+def test_locate_region_codes_with_holes_and_multipolygons(model_api, geojson_feature):
+    geojsons = TheDataGardenRegionGeoJSONModel(api=model_api, region_url="")
+    with_hole = {"type": "Polygon", "coordinates": [square(0, 0, 4), square(1, 1, 2)]}
+    islands = {"type": "MultiPolygon", "coordinates": [[square(10, 0, 1)], [square(1.5, 1.5, 1)]]}
+    country = {"type": "Polygon", "coordinates": [square(-5, -5, 20)]}
+    geojsons.set_items(
+        {
+            "features": [
+                geojson_feature("NL31", with_hole),
+                geojson_feature("NL32", islands),
+                geojson_feature("NL", country, region_level=0),
+            ]
+        }
+    )
+
+    lon = np.array([0.5, 1.2, 2.0, 10.5, 20.0])
+    lat = np.array([0.5, 1.2, 2.0, 0.5, 20.0])
+    assert geojsons.locate(lon, lat, region_level=2).tolist() == ["NL31", None, "NL32", "NL32", None]
+    assert geojsons.locate(lon, lat, region_level=0).tolist() == ["NL", "NL", "NL", "NL", None]
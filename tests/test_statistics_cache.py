@@ -0,0 +1,109 @@
+"""
+Test the region statistics cache shared by the regions of an API object
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from datagarden_models import CountryStats
+from pydantic import BaseModel
+
+from the_datagarden.api.statistics import AvailabilityIndex, StatisticsCache
+
+
+class Statistics(BaseModel):
+    region_url: str
+
+
+def test_statistics_are_retrieved_once():
+    cache = StatisticsCache()
+    retrieved = []
+
+    def retrieve() -> Statistics:
+        retrieved.append(1)
+        time.sleep(0.05)
+        return Statistics(region_url="country/nl/")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statistics = list(executor.map(lambda _: cache.get("country/nl/", retrieve), range(8)))
+    assert len(retrieved) == 1
+    assert all(item is statistics[0] for item in statistics)
+    assert "country/nl/" in cache
+
+
+def test_failed_retrievals_are_not_cached():
+    cache = StatisticsCache()
+    assert cache.get("country/nl/", lambda: None) is None
+    assert "country/nl/" not in cache
+    assert cache.get("country/nl/", lambda: Statistics(region_url="country/nl/")) is not None
+
+
+def test_prefetch_regions_concurrently():
+    cache = StatisticsCache()
+    cache.set("country/nl/", Statistics(region_url="country/nl/"))
+    # Every retrieval waits until all uncached regions are being retrieved at the same time
+    all_retrieving = threading.Barrier(5, timeout=10)
+    retrieved = []
+
+    class Region:
+        def __init__(self, region_url: str):
+            self.region_url = region_url
+
+        @property
+        def meta_data(self) -> Statistics | None:
+            def retrieve() -> Statistics:
+                retrieved.append(self.region_url)
+                all_retrieving.wait()
+                return Statistics(region_url=self.region_url)
+
+            return cache.get(self.region_url, retrieve)
+
+    regions = [Region(f"country/{code}/") for code in ["nl", "de", "be", "fr", "it", "es"]]
+    cache.prefetch(regions, max_workers=8)
+    assert sorted(retrieved) == sorted(region.region_url for region in regions[1:])
+    assert len(cache) == 6
+
+
+def country_statistics(to_period: str) -> CountryStats:
+    stats = {"count": 10, "sources": {"Eurostat": ""}, "from_period": "2010-01-01", "to_period": to_period}
+    return CountryStats(
+        {
+            "0": {
+                "count": 1,
+                "region_type": "country",
+                "access_level": "public",
+                "region_level": 0,
+                "with_geojson": 1,
+                "regional_data_stats": {"Demographics": stats | {"period_type": ["Y"]}},
+            },
+            "2": {
+                "count": 12,
+                "region_type": "province",
+                "access_level": "public",
+                "region_level": 2,
+                "with_geojson": 12,
+                "regional_data_stats": {"Economics": stats | {"period_type": ["Y", "Q"]}},
+            },
+        }
+    )
+
+
+def test_availability_index():
+    regions = [
+        SimpleNamespace(
+            name="Netherlands", region_url="country/nl/", meta_data=country_statistics("2024-01-01")
+        ),
+        SimpleNamespace(name="Germany", region_url="country/de/", meta_data=country_statistics("2020-01-01")),
+        SimpleNamespace(name="Kenya", region_url="country/ke/", meta_data=None),
+    ]
+    index = AvailabilityIndex(regions)
+
+    assert len(index) == 4
+    assert sorted(index.model_names) == ["demographics", "economics"]
+    assert index.regions("demographics") == regions[:2]
+    assert index.regions("Economics", period_type="Q", period_from="2022-01-01") == regions[:1]
+    assert index.regions("economics", region_type="country") == []
+    assert index.has_data(regions[1], "demographics", period_to="2015-01-01", source="Eurostat")
+    assert not index.has_data(regions[2], "demographics")
@@ -0,0 +1,83 @@
+"""
+Test streaming regional data page by page
+"""
+
+import threading
+
+import polars as pl
+import pytest
+
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+PAGES = 6
+
+
+class PageTracker:
+    """Tracks the pages requested from the API and the pages processed by the consumer"""
+
+    def __init__(self):
+        self.processed = 0
+        self.requested: list[int] = []
+        self.pages_in_memory: list[int] = []
+        self._condition = threading.Condition()
+
+    def request(self, page: int):
+        with self._condition:
+            self.requested.append(page)
+            # Pages requested but not yet processed, including this one
+            self.pages_in_memory.append(page - self.processed)
+            self._condition.notify_all()
+
+    def wait_for_request(self, page: int):
+        with self._condition:
+            assert self._condition.wait_for(lambda: page in self.requested, timeout=10)
+
+
+@pytest.fixture
+def demographics(model_api, regional_data_response):
+    """Demographics model with a page per year, tracking the pages requested from the API"""
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", None)
+    demographics.pages = PageTracker()
+
+    def regional_data_from_api(pagination: dict | None = None, **kwargs) -> dict:
+        page = pagination["page"] if pagination else 1
+        demographics.pages.request(page)
+        next_page = page + 1 if page < PAGES else None
+        return regional_data_response(
+            {f"{2010 + page}-01-01T00:00:00Z": float(page)},
+            pagination={"current_page": page, "next_page": next_page, "total_pages": PAGES},
+        )
+
+    demographics.regional_data_from_api = regional_data_from_api
+    return demographics
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_stream_yields_records_in_page_order_without_storing_them(demographics, max_workers):
+    totals = []
+    for record in demographics.stream(max_workers=max_workers, period_from="2011-01-01"):
+        page = int(record.model.population.total)
+        if page > 1:
+            # The pages that may be fetched while this page is processed
+            demographics.pages.wait_for_request(min(page - 1 + max_workers, PAGES))
+        totals.append(record.model.population.total)
+        demographics.pages.processed = page
+
+    assert totals == [float(page) for page in range(1, PAGES + 1)]
+    assert max(demographics.pages.pages_in_memory) == max_workers
+    assert len(demographics) == 0
+    assert demographics._request_params_hashes == []
+
+
+def test_stream_to_polars_yields_a_dataframe_per_page(demographics):
+    frames = list(demographics.stream_to_polars({"total": "population.total"}, max_workers=3))
+    assert [frame.get_column("total").to_list() for frame in frames] == [
+        [float(page)] for page in range(1, PAGES + 1)
+    ]
+
+    full_model_frames = list(demographics.stream_full_model_to_polars(max_workers=3))
+    assert len(full_model_frames) == PAGES
+    assert pl.concat(full_model_frames).get_column("population.total").to_list() == [
+        float(page) for page in range(1, PAGES + 1)
+    ]
+    assert len(demographics) == 0
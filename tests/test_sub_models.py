@@ -0,0 +1,27 @@
+"""
+Test sub model data as views on the records of the parent model
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_sub_model_data_is_memoized_until_new_data(columnar, regional_data_response):
+    api = SimpleNamespace(columnar=columnar, ingest_mode="strict")
+    demographics = TheDataGardenRegionalDataModel(api, "demographics", "", None)
+    demographics.set_items(regional_data_response({"2020-01-01T00:00:00Z": 100.0}))
+
+    population = demographics.population
+    assert demographics.population is population
+    assert [record.model.total for record in population] == [100.0]
+    assert [record.data_model_name for record in population] == ["population"]
+
+    demographics.set_items(regional_data_response({"2021-01-01T00:00:00Z": 110.0}))
+    assert demographics.population is not population
+    assert [record.model.total for record in demographics.population] == [100.0, 110.0]
+    with pytest.raises(ValueError):
+        _ = demographics.unknown_sub_model
@@ -0,0 +1,88 @@
+"""
+Test incremental synchronisation of regional data
+"""
+
+from datagarden_models import CountryStats
+
+from the_datagarden.models.regional_data import TheDataGardenRegionalDataModel
+from the_datagarden.models.sync import missing_period_windows
+
+META_DATA = CountryStats(
+    {
+        "0": {
+            "count": 1,
+            "region_type": "country",
+            "access_level": "public",
+            "region_level": 0,
+            "with_geojson": 1,
+            "regional_data_stats": {
+                "Demographics": {
+                    "count": 10,
+                    "sources": {"Eurostat": "", "CBS": ""},
+                    "from_period": "2010-01-01",
+                    "to_period": "2024-01-01",
+                    "period_type": ["Y"],
+                }
+            },
+        }
+    }
+)
+
+
+def test_missing_period_windows():
+    available = {"Eurostat": ("2010-01-01", "2024-01-01"), "CBS": ("2018-01-01", "2022-01-01")}
+    loaded = {
+        "Eurostat": ("2015-01-01T00:00:00Z", "2022-01-01T00:00:00Z"),
+        "CBS": ("2018-01-01", "2022-01-01"),
+    }
+    assert missing_period_windows(loaded, available) == [
+        {"source": ["Eurostat"], "period_from": "2022-01-01"}
+    ]
+    assert missing_period_windows(loaded, available, period_from="2012-01-01", period_to="2023-01-01") == [
+        {"source": ["Eurostat"], "period_from": "2022-01-01", "period_to": "2023-01-01"},
+        {"source": ["Eurostat"], "period_from": "2012-01-01", "period_to": "2015-01-01"},
+    ]
+    assert missing_period_windows({}, available, period_from="2023-01-01") == [
+        {"source": ["Eurostat"], "period_from": "2023-01-01"}
+    ]
+    assert missing_period_windows({}, {}, period_from="2023-01-01") == [{"period_from": "2023-01-01"}]
+
+
+def test_sync_requests_missing_periods_only(model_api):
+    demographics = TheDataGardenRegionalDataModel(model_api, "demographics", "", META_DATA)
+    requests = []
+
+    def regional_data_from_api(**kwargs) -> dict:
+        requests.append(kwargs)
+        periods = range(2010, 2023) if "period_to" in kwargs else range(2022, 2025)
+        data_objects = [
+            {
+                "data_type": "Demographics",
+                "source_name": source,
+                "period": f"{year}-01-01T00:00:00Z",
+                "period_type": "Y",
+                "data": {},
+            }
+            for source in kwargs["source"]
+            for year in periods
+        ]
+        return {"data_by_region": [{"iso_cc_2": "NL", "data_objects_for_region": data_objects}]}
+
+    demographics.regional_data_from_api = regional_data_from_api
+    demographics.sync(period_from="2010-01-01", period_to="2022-01-01")
+    assert requests == [
+        {
+            "period_type": "Y",
+            "source": ["Eurostat", "CBS"],
+            "period_from": "2010-01-01",
+            "period_to": "2022-01-01",
+        }
+    ]
+    assert len(demographics) == 26
+
+    demographics.sync()
+    assert requests[1:] == [{"period_type": "Y", "source": ["Eurostat", "CBS"], "period_from": "2022-01-01"}]
+    assert len(demographics) == 30
+
+    demographics.sync()
+    assert len(requests) == 2